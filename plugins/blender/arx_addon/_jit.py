@@ -0,0 +1,251 @@
+# Copyright 2019-2020 Arx Libertatis Team (see the AUTHORS file)
+#
+# This file is part of Arx Libertatis.
+#
+# Arx Libertatis is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Arx Libertatis is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Arx Libertatis. If not, see <http://www.gnu.org/licenses/>.
+
+#   Optional numba-compiled kernels. Numba is not shipped with Blender, so
+# everything here degrades gracefully: when the import fails the exported
+# names are None and callers fall back to their NumPy implementations.
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    compute_vertex_lighting = None
+    nearest_rooms = None
+    cell_poly_indices = None
+    quat_to_arx_euler_deg = None
+    pkware_encode_literals = None
+    eval_scene_lighting = None
+else:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def compute_vertex_lighting(positions, normals, light_pos, light_color,
+                                light_fallstart, light_fallend, light_intensity,
+                                ambient, falloff_power, max_contribution):
+        """Per-vertex lighting reduction, parallel over vertices"""
+        vertex_count = positions.shape[0]
+        light_count = light_pos.shape[0]
+        colors = np.empty((vertex_count, 4), dtype=np.uint8)
+        for v in prange(vertex_count):
+            final_r = ambient[0]
+            final_g = ambient[1]
+            final_b = ambient[2]
+            for l in range(light_count):
+                dx = light_pos[l, 0] - positions[v, 0]
+                dy = light_pos[l, 1] - positions[v, 1]
+                dz = light_pos[l, 2] - positions[v, 2]
+                distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+                if distance > light_fallend[l]:
+                    continue
+                if distance < light_fallstart[l]:
+                    falloff = 1.0
+                else:
+                    falloff_range = light_fallend[l] - light_fallstart[l]
+                    if falloff_range > 0:
+                        falloff = 1.0 - (distance - light_fallstart[l]) / falloff_range
+                        if falloff < 0.0:
+                            falloff = 0.0
+                        falloff = falloff ** falloff_power
+                    else:
+                        falloff = 1.0
+                if distance > 0.01:
+                    lambert = (normals[v, 0] * dx + normals[v, 1] * dy + normals[v, 2] * dz) / distance
+                    if lambert < 0.0:
+                        lambert = 0.0
+                else:
+                    lambert = 1.0
+                contribution = light_intensity[l] * falloff * lambert * max_contribution
+                final_r += light_color[l, 0] * contribution
+                final_g += light_color[l, 1] * contribution
+                final_b += light_color[l, 2] * contribution
+            colors[v, 0] = min(max(int(final_r), 0), 255)
+            colors[v, 1] = min(max(int(final_g), 0), 255)
+            colors[v, 2] = min(max(int(final_b), 0), 255)
+            colors[v, 3] = 255
+        return colors
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def nearest_rooms(new_centers, exist_centers, exist_rooms):
+        """Room ID of the nearest existing face center for each new center"""
+        new_count = new_centers.shape[0]
+        exist_count = exist_centers.shape[0]
+        rooms = np.empty(new_count, dtype=np.int32)
+        for n in prange(new_count):
+            best_room = 1
+            best_distance = np.inf
+            for e in range(exist_count):
+                dx = exist_centers[e, 0] - new_centers[n, 0]
+                dy = exist_centers[e, 1] - new_centers[n, 1]
+                dz = exist_centers[e, 2] - new_centers[n, 2]
+                distance = dx * dx + dy * dy + dz * dz
+                if distance < best_distance:
+                    best_distance = distance
+                    best_room = exist_rooms[e]
+            rooms[n] = best_room
+        return rooms
+
+    @njit(cache=True)
+    def cell_poly_indices(cell_x, cell_z):
+        """Index of each face within its 160x160 grid cell, in face order"""
+        face_count = cell_x.shape[0]
+        counts = np.zeros((160, 160), dtype=np.int32)
+        indices = np.empty(face_count, dtype=np.int32)
+        for i in range(face_count):
+            indices[i] = counts[cell_z[i], cell_x[i]]
+            counts[cell_z[i], cell_x[i]] += 1
+        return indices
+
+    @njit(cache=True, fastmath=True)
+    def quat_to_arx_euler_deg(w, x, y, z):
+        """Blender entity quaternion to Arx XYZ Euler angles in degrees
+
+        Scalar equivalent of the export rotation pipeline: multiply by the
+        inverse z-correction quaternion, conjugate by the blender/arx axis
+        permutation, apply the w/y sign flips, then extract XYZ Euler.
+        """
+        # z_correction_inverse = Quaternion((0, 0, 1), -radians(90))
+        c = 0.7071067811865476
+        s = -0.7071067811865476
+        cw = c * w - s * z
+        cx = c * x - s * y
+        cy = c * y + s * x
+        cz = c * z + s * w
+
+        # Conjugation by the axis permutation maps (x, y, z) -> (x, z, -y);
+        # then flip_w and flip_y negate their components
+        fw = -cw
+        fx = cx
+        fy = -cz
+        fz = -cy
+
+        # XYZ Euler extraction (matches mathutils to_euler('XYZ'))
+        sinp = 2.0 * (fw * fy - fz * fx)
+        if sinp > 1.0:
+            sinp = 1.0
+        elif sinp < -1.0:
+            sinp = -1.0
+        ex = math.atan2(2.0 * (fw * fx + fy * fz), 1.0 - 2.0 * (fx * fx + fy * fy))
+        ey = math.asin(sinp)
+        ez = math.atan2(2.0 * (fw * fz + fx * fy), 1.0 - 2.0 * (fy * fy + fz * fz))
+
+        deg = 57.29577951308232
+        return ex * deg, ey * deg, ez * deg
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def eval_scene_lighting(positions, normals, light_pos, light_type,
+                            light_cutoff, light_color, light_energy, light_dir):
+        """Blender-light vertex lighting for the Cycles export path
+
+        light_type codes: 0 = point with cutoff distance, 1 = point with
+        inverse-square falloff, 2 = sun (fixed direction, no attenuation),
+        3 = any other light type. Energy arrives pre-scaled.
+        """
+        vertex_count = positions.shape[0]
+        light_count = light_pos.shape[0]
+        colors = np.empty((vertex_count, 4), dtype=np.uint8)
+        for v in prange(vertex_count):
+            # Cool ambient: (0.3, 0.3, 0.4) at strength 0.2
+            red = 0.06
+            green = 0.06
+            blue = 0.08
+            for l in range(light_count):
+                if light_type[l] == 2:
+                    dx = light_dir[l, 0]
+                    dy = light_dir[l, 1]
+                    dz = light_dir[l, 2]
+                    attenuation = 1.0
+                else:
+                    dx = light_pos[l, 0] - positions[v, 0]
+                    dy = light_pos[l, 1] - positions[v, 1]
+                    dz = light_pos[l, 2] - positions[v, 2]
+                    distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+                    if distance > 1e-9:
+                        inverse = 1.0 / distance
+                        dx *= inverse
+                        dy *= inverse
+                        dz *= inverse
+                    if light_type[l] == 0:
+                        attenuation = 1.0 - distance / light_cutoff[l]
+                        if attenuation < 0.0:
+                            attenuation = 0.0
+                    elif light_type[l] == 1:
+                        attenuation = 1.0 / (1.0 + distance * distance * 0.001)
+                    else:
+                        attenuation = 1.0 / (1.0 + distance * 0.1)
+                lambert = normals[v, 0] * dx + normals[v, 1] * dy + normals[v, 2] * dz
+                if lambert < 0.0:
+                    lambert = 0.0
+                weight = light_energy[l] * attenuation * lambert
+                red += light_color[l, 0] * weight
+                green += light_color[l, 1] * weight
+                blue += light_color[l, 2] * weight
+            colors[v, 0] = int(min(red, 1.0) * 255.0)
+            colors[v, 1] = int(min(green, 1.0) * 255.0)
+            colors[v, 2] = int(min(blue, 1.0) * 255.0)
+            colors[v, 3] = 255
+        return colors
+
+    @njit(cache=True)
+    def pkware_encode_literals(data):
+        """PKWare uncoded-literal bitstream for a whole payload in one pass
+
+        Emits the 0-prefixed LSB-first 9-bit code for every input byte
+        followed by the 16-bit end-of-stream marker, zero-padding the
+        final byte - the compiled equivalent of the encoder's
+        write_literals / write_end_of_stream / get_bytes sequence.
+        """
+        byte_count = data.shape[0]
+        out = np.empty((9 * byte_count + 16 + 7) // 8, dtype=np.uint8)
+        acc = 0
+        nbits = 0
+        pos = 0
+        for i in range(byte_count):
+            acc |= (np.int64(data[i]) << 1) << nbits
+            nbits += 9
+            while nbits >= 8:
+                out[pos] = acc & 0xFF
+                pos += 1
+                acc >>= 8
+                nbits -= 8
+        # End-of-stream marker: 1 bit, 7 zeros, 8 ones, LSB first
+        acc |= 0xFF01 << nbits
+        nbits += 16
+        while nbits >= 8:
+            out[pos] = acc & 0xFF
+            pos += 1
+            acc >>= 8
+            nbits -= 8
+        if nbits > 0:
+            out[pos] = acc & 0xFF
+            pos += 1
+        return out[:pos]
+
+    # Warm up the JIT on a trivial input so compilation cost is paid at addon
+    # load rather than on the first export
+    _warmup = np.zeros((1, 3), dtype=np.float32)
+    _warmup_scalar = np.zeros(1, dtype=np.float32)
+    compute_vertex_lighting(_warmup, _warmup, _warmup, _warmup,
+                            _warmup_scalar, _warmup_scalar, _warmup_scalar,
+                            np.zeros(3, dtype=np.float32), 1.5, 200.0)
+    nearest_rooms(_warmup, _warmup, np.ones(1, dtype=np.int32))
+    cell_poly_indices(np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32))
+    quat_to_arx_euler_deg(1.0, 0.0, 0.0, 0.0)
+    pkware_encode_literals(np.zeros(1, dtype=np.uint8))
+    eval_scene_lighting(_warmup, _warmup, _warmup, np.zeros(1, dtype=np.int32),
+                        np.ones(1, dtype=np.float32), _warmup,
+                        _warmup_scalar, _warmup)
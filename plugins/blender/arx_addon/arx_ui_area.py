@@ -15,20 +15,146 @@
 # You should have received a copy of the GNU General Public License
 # along with Arx Libertatis. If not, see <http://www.gnu.org/licenses/>.
 
+import bmesh
 import bpy
+import hashlib
+import logging
 import os
+import pickle
+import struct
+import numpy as np
+from collections import Counter, defaultdict
 from bpy.props import IntProperty, BoolProperty, StringProperty, CollectionProperty, PointerProperty, EnumProperty, FloatProperty
 from bpy.types import Operator, Panel, PropertyGroup, UIList
 from mathutils import Matrix, Vector, Quaternion
 from .arx_io_util import ArxException, arx_pos_to_blender_for_model, arx_transform_to_blender, blender_pos_to_arx
+from .dataFts import FtsPoly, FtsVector3, FtsVertex
 from .managers import getAddon
 from .arx_asl_reader import ASLReader
 from .arx_asl_syntax import ASLSyntaxHighlighter, ASLNavigator
+from ._jit import (cell_poly_indices, compute_vertex_lighting, eval_scene_lighting,
+                   nearest_rooms, pkware_encode_literals, quat_to_arx_euler_deg)
 import math
 
+log = logging.getLogger('ArxAreaUI')
+
 # Global ASL navigator instance
 g_asl_navigator = None
 
+# blender_pos_to_arx's axis permutation folded together with the inverse of
+# the 0.1 import scale; bulk position conversion is positions @ this matrix.
+# Scalar callers keep using blender_pos_to_arx directly.
+# Directory prefix for texture paths stored in FTS texture containers, plus
+# the pre-encoded pieces used when building fic fields directly as bytes
+_FTS_TEXTURE_PATH_PREFIX = "GRAPH\\OBJ3D\\TEXTURES\\"
+_FTS_PATH_PREFIX_BYTES = b"GRAPH\\OBJ3D\\TEXTURES\\"
+_FTS_PATH_SUFFIX_BYTES = b".BMP"
+
+_BLENDER_TO_ARX_PERM = np.array([[10.0, 0.0, 0.0],
+                                 [0.0, 0.0, 10.0],
+                                 [0.0, -10.0, 0.0]], dtype=np.float32)
+
+
+# numpy mirror of dataDlf.DANAE_LS_INTER (pack=1): entities are the most
+# numerous DLF record, so the export fills rows of one structured array and
+# serializes the whole block with a single tobytes() instead of building a
+# ctypes instance per entity
+# Degree/radian conversion factors as plain multiply constants for the
+# export hot paths (math.degrees is an attribute lookup + C call per use)
+_DEG_PER_RAD = 180.0 / math.pi
+_NEG_HALF_PI = -math.pi / 2.0
+
+_DLF_INTER_DTYPE = np.dtype([
+    ('name', 'S512'),
+    ('pos', '<f4', 3),
+    ('angle', '<f4', 3),
+    ('ident', '<i4'),
+    ('flags', '<i4'),
+    ('pad', '<i4', 14),
+    ('fpad', '<f4', 16),
+])
+
+
+def _blender_pos_to_arx_scaled(pos):
+    """blender_pos_to_arx(pos) with the inverse 0.1 import scale fused in
+
+    Scalar counterpart of _BLENDER_TO_ARX_PERM: one result tuple per call
+    instead of the permute / Vector / scalar-multiply chain.
+    """
+    return (pos[0] * 10.0, pos[2] * -10.0, pos[1] * 10.0)
+
+# msgspec is much faster than pickle for the nested scene-property payloads
+# but is not bundled with Blender, so blobs carry a one-byte format tag and
+# pickle remains both the fallback encoder and the legacy decoder.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_SCENE_BLOB_MSGPACK = b'M'
+_SCENE_BLOB_PICKLE = b'P'
+_SCENE_BLOB_FRAMED = b'F'
+
+def _pack_framed(items):
+    """Length-prefixed framing for a homogeneous list of bytes blobs
+
+    Cheaper to encode and decode than pickling the list, and independent
+    of pickle protocol versions between Blender installs.
+    """
+    return struct.pack('<I', len(items)) + b''.join(
+        struct.pack('<I', len(item)) + item for item in items)
+
+def _unpack_framed(buf):
+    """Inverse of _pack_framed"""
+    view = memoryview(buf)
+    (count,) = struct.unpack_from('<I', view, 0)
+    offset = 4
+    items = []
+    for _ in range(count):
+        (size,) = struct.unpack_from('<I', view, offset)
+        offset += 4
+        items.append(bytes(view[offset:offset + size]))
+        offset += size
+    return items
+
+def _encode_scene_blob(data):
+    """Serialize a scene-property payload, preferring msgspec.msgpack"""
+    if msgspec is not None:
+        try:
+            return _SCENE_BLOB_MSGPACK + msgspec.msgpack.encode(data)
+        except (msgspec.EncodeError, TypeError):
+            pass
+    # Protocol 5 frames the large portal/distance byte blobs efficiently;
+    # out-of-band PickleBuffers would not survive in an ID property, which
+    # can only hold one contiguous bytes value
+    return _SCENE_BLOB_PICKLE + pickle.dumps(data, protocol=5)
+
+def _decode_scene_blob(blob):
+    """Deserialize a scene-property payload written by _encode_scene_blob"""
+    blob = bytes(blob)
+    tag = blob[:1]
+    if tag == _SCENE_BLOB_MSGPACK:
+        if msgspec is None:
+            raise ArxException("Scene data was stored with msgspec, which is not installed")
+        return msgspec.msgpack.decode(blob[1:])
+    if tag == _SCENE_BLOB_PICKLE:
+        return pickle.loads(blob[1:])
+    # Untagged blobs predate the format tag
+    return pickle.loads(blob)
+
+# Parsed FTS containers keyed by path; repeated exports of the same area
+# re-read an unchanged file otherwise. Entries are (mtime_ns, size, data).
+_FTS_CACHE = {}
+
+def _cached_read_fts_container(fts_serializer, fts_path):
+    stat = os.stat(fts_path)
+    cached = _FTS_CACHE.get(fts_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    fts_data = fts_serializer.read_fts_container(fts_path)
+    _FTS_CACHE[fts_path] = (stat.st_mtime_ns, stat.st_size, fts_data)
+    return fts_data
+
 def get_asl_text_name(entity_ident, object_id=None):
     """Generate consistent text block name for ASL files"""
     if object_id:
@@ -68,7 +194,7 @@ g_areaToLevel = {
     7:7, 23:7
 }
 
-def importArea(context, report, area_id):
+def importArea(context, report, area_id, addon=None):
     scene_name = f"Area_{area_id:02d}"
     scene = bpy.data.scenes.get(scene_name)
     if scene:
@@ -78,7 +204,9 @@ def importArea(context, report, area_id):
     scene = bpy.data.scenes.new(name=scene_name)
     scene.unit_settings.system = 'METRIC'
     scene.unit_settings.scale_length = 0.01
-    getAddon(context).sceneManager.importScene(context, scene, area_id)
+    if addon is None:
+        addon = getAddon(context)
+    addon.sceneManager.importScene(context, scene, area_id)
 
 class CUSTOM_OT_arx_area_list_reload(Operator):
     bl_idname = "arx.arx_area_list_reload"
@@ -86,7 +214,8 @@ class CUSTOM_OT_arx_area_list_reload(Operator):
     def invoke(self, context, event):
         area_list = context.window_manager.arx_areas_col
         area_list.clear()
-        for area_id, value in getAddon(context).arxFiles.levels.levels.items():
+        levels = getAddon(context).arxFiles.levels.levels
+        for area_id in levels:
             item = area_list.add()
             item.name = f'Area {area_id}'
             item.area_id = area_id
@@ -185,12 +314,33 @@ class ArxOperatorImportAllLevels(Operator):
     bl_idname = "arx.operator_import_all_levels"
     bl_label = "Import All Levels"
     def execute(self, context):
-        for area_id, value in getAddon(context).arxFiles.levels.levels.items():
-            try:
-                importArea(context, self.report, area_id)
-            except ArxException as e:
-                self.report({'ERROR'}, str(e))
-                return {'CANCELLED'}
+        addon = getAddon(context)
+        levels = addon.arxFiles.levels.levels
+        scene_manager = addon.sceneManager
+
+        # Batch setup once: suspend global undo while many scenes are created
+        # and run a single depsgraph update at the end instead of per area
+        edit_prefs = context.preferences.edit
+        original_undo = edit_prefs.use_global_undo
+        edit_prefs.use_global_undo = False
+        try:
+            for area_id in levels:
+                scene_name = f"Area_{area_id:02d}"
+                if bpy.data.scenes.get(scene_name):
+                    self.report({'INFO'}, f"Area Scene named [{scene_name}] already exists.")
+                    continue
+                self.report({'INFO'}, f"Creating new Area Scene [{scene_name}]")
+                scene = bpy.data.scenes.new(name=scene_name)
+                scene.unit_settings.system = 'METRIC'
+                scene.unit_settings.scale_length = 0.01
+                try:
+                    scene_manager.importScene(context, scene, area_id)
+                except ArxException as e:
+                    self.report({'ERROR'}, str(e))
+                    return {'CANCELLED'}
+        finally:
+            edit_prefs.use_global_undo = original_undo
+            context.view_layer.depsgraph.update()
         return {'FINISHED'}
 
 class ArxAreaExportHelper:
@@ -201,7 +351,9 @@ class ArxAreaExportHelper:
         self._scene_offset = Vector((0, 0, 0))
         self._preserve_original_lighting = False
         self.converted_faces = []
-    
+        self._faces_soa = None
+        self._next_tc = None
+
     # Shared methods will be moved here from the main operator class
 
 class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
@@ -219,7 +371,9 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         self._scene_offset = Vector((0, 0, 0))
         self._preserve_original_lighting = False
         self.converted_faces = []
-        
+        self._faces_soa = None
+        self._next_tc = None
+
         area_list = context.window_manager.arx_areas_col
         if not area_list:
             self.report({'ERROR'}, "No area list loaded")
@@ -251,10 +405,13 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
     
     def exportArea(self, context, scene, area_id, export_fts=True, export_llf=True, export_dlf=True):
         """Export area data based on flags"""
-        print(f"DEBUG: exportArea called with export_fts={export_fts}, export_llf={export_llf}, export_dlf={export_dlf}")
+        log.debug(f"exportArea called with export_fts={export_fts}, export_llf={export_llf}, export_dlf={export_dlf}")
         addon = getAddon(context)
         area_files = addon.arxFiles.levels.levels[area_id]
-        
+        # Resolve the serializer once; the FTS read and write paths below
+        # share it instead of re-walking the addon attribute chain
+        fts_serializer = addon.sceneManager.ftsSerializer
+
         # DLF-only export: Skip all the expensive FTS processing
         if export_dlf and not export_fts and not export_llf:
             if area_files.dlf:
@@ -285,41 +442,49 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 llfData = addon.sceneManager.llfSerializer.read(area_files.llf)
                 self._storeLightsForLighting(llfData)
             else:
-                print("WARNING: No LLF file found - lighting calculations will use defaults")
+                log.warning("No LLF file found - lighting calculations will use defaults")
                 self._storeLightsForLighting(None)
         elif export_fts:
             # For FTS-only export, skip lighting data loading for performance
-            print("DEBUG: FTS-only export - skipping lighting data loading")
+            log.debug("FTS-only export - skipping lighting data loading")
             self._storeLightsForLighting(None)
         
         # Try to restore complete FTS data from scene properties first
-        current_scene = background_obj.users_scene[0]
+        # The enclosing scene is already passed in; users_scene builds a new
+        # list of scenes on every access
+        current_scene = scene
         if ("arx_texture_data" in current_scene and 
             "arx_anchor_data" in current_scene and 
             "arx_portal_data" in current_scene):
-            print("DEBUG: Using preserved FTS data from scene properties")
+            log.debug("Using preserved FTS data from scene properties")
             # Use minimal base structure and restore from scene properties
-            base_fts_data = addon.sceneManager.ftsSerializer.read_fts_container(area_files.fts)
+            base_fts_data = _cached_read_fts_container(fts_serializer, area_files.fts)
             fts_data = self._restoreOriginalFtsDataFromScene(current_scene, base_fts_data)
         else:
-            print("DEBUG: No preserved data found, reading fresh from FTS file and storing")
+            log.debug("No preserved data found, reading fresh from FTS file and storing")
             # Read original FTS data and store it for future use
-            fts_data = addon.sceneManager.ftsSerializer.read_fts_container(area_files.fts)
+            fts_data = _cached_read_fts_container(fts_serializer, area_files.fts)
             self._storeOriginalFtsDataInScene(current_scene, fts_data)
         
         # Store scene offset for lighting calculations
         self._scene_offset = Vector(fts_data.sceneOffset) if hasattr(fts_data, 'sceneOffset') else Vector((0, 0, 0))
-        
+
+        # Cache the tunable lighting parameters as plain floats so the vertex
+        # lighting hot paths never go through RNA property access
+        lighting_props = bpy.context.scene.arx_lighting
+        self._light_params = (lighting_props.light_falloff_power,
+                              lighting_props.max_light_contribution)
+
         # Set lighting recalculation mode based on export type
         if export_llf:
             # For LLF export, recalculate lighting for modified geometry to fix lightmap issues
             self._preserve_original_lighting = False
-            print("DEBUG: LLF export - will recalculate vertex lighting")
+            log.debug("LLF export - will recalculate vertex lighting")
         else:
             # For FTS-only export, preserve existing lighting to avoid expensive calculations
             # BUT regenerate if geometry has changed to prevent vector bounds errors
             self._preserve_original_lighting = True
-            print("DEBUG: FTS-only export - preserving existing vertex lighting for performance")
+            log.debug("FTS-only export - preserving existing vertex lighting for performance")
         
         # Convert Blender mesh back to FTS cells with current material assignments
         fts_data = self.convertMeshToFtsCells(background_obj, fts_data)
@@ -336,10 +501,10 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 break
         
         if portal_count > 0:
-            print(f"DEBUG: Reading {portal_count} portals from Blender scene")
+            log.debug(f"Reading {portal_count} portals from Blender scene")
             fts_data = self._rebuildPortalSystemFromBlender(fts_data, current_scene)
         else:
-            print("DEBUG: No portals found - keeping original portal data")
+            log.debug("No portals found - keeping original portal data")
         
         # Read user-modified anchor network from Blender scene (skip if no anchors)
         anchor_count = 0
@@ -351,28 +516,28 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             anchor_count = len([obj for obj in current_scene.collection.objects if 'anchor' in obj.name.lower() and obj.type == 'MESH'])
         
         if anchor_count > 0:
-            print(f"DEBUG: Reading {anchor_count} anchor objects from Blender scene")
+            log.debug(f"Reading {anchor_count} anchor objects from Blender scene")
             fts_data = self._rebuildAnchorNetworkFromBlender(fts_data, current_scene)
         else:
-            print("DEBUG: No anchor objects found - keeping original anchor data")
+            log.debug("No anchor objects found - keeping original anchor data")
         
         # Only rebuild room polygon references if geometry was modified or new portals added
         if geometry_modified or portal_count > 0:
             if geometry_modified:
-                print(f"DEBUG: Geometry modified ({len(self.converted_faces)} vs {original_face_count} faces) - user must assign room IDs manually")
+                log.debug(f"Geometry modified ({len(self.converted_faces)} vs {original_face_count} faces) - user must assign room IDs manually")
                 # Force lighting regeneration when geometry changes to prevent vector bounds errors
                 if self._preserve_original_lighting:
-                    print("DEBUG: Forcing lighting regeneration due to geometry changes")
+                    log.debug("Forcing lighting regeneration due to geometry changes")
                     self._preserve_original_lighting = False
-            print("DEBUG: Rebuilding room polygon references due to changes")
+            log.debug("Rebuilding room polygon references due to changes")
             fts_data = self._rebuildRoomPolygonReferences(fts_data) or fts_data
         else:
-            print("DEBUG: No geometry/portal changes - keeping original room references")
+            log.debug("No geometry/portal changes - keeping original room references")
         
         # Write back to original FTS file
         if export_fts:
             try:
-                self.writeFtsFile(area_files.fts, fts_data, self.converted_faces)
+                self.writeFtsFile(area_files.fts, fts_data, self.converted_faces, fts_serializer)
                 self.report({'INFO'}, f"Successfully exported FTS with {len(self.converted_faces)} faces")
             except Exception as e:
                 self.report({'ERROR'}, f"FTS write failed: {str(e)}")
@@ -380,18 +545,21 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         else:
             self.report({'INFO'}, "Skipped FTS export")
         
-        # Update LLF file with new vertex lighting data
+        # Update LLF file with new vertex lighting data - read the RNA
+        # properties once up front
         scene = bpy.context.scene
         lighting_props = scene.arx_lighting
-        
-        if export_llf and area_files.llf and lighting_props.regenerate_lighting and lighting_props.lighting_method != 'SKIP':
+        lighting_method = lighting_props.lighting_method
+        regenerate_lighting = lighting_props.regenerate_lighting
+
+        if export_llf and area_files.llf and regenerate_lighting and lighting_method != 'SKIP':
             try:
                 self.updateLlfFile(area_files.llf, self.converted_faces)
-                self.report({'INFO'}, f"Successfully updated LLF lighting data using {lighting_props.lighting_method}")
+                self.report({'INFO'}, f"Successfully updated LLF lighting data using {lighting_method}")
             except Exception as e:
                 self.report({'ERROR'}, f"LLF update failed: {str(e)}")
                 # Don't fail the entire export if LLF update fails
-        elif lighting_props.lighting_method == 'SKIP':
+        elif lighting_method == 'SKIP':
             self.report({'INFO'}, "Skipped LLF lighting update (fast export mode)")
         else:
             self.report({'INFO'}, "LLF lighting update disabled")
@@ -407,102 +575,189 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
     
     def convertMeshToFtsCells(self, mesh_obj, fts_data):
         """Convert Blender mesh back to FTS cell format"""
-        import bmesh
-        
-        # Create bmesh from mesh
-        bm = bmesh.new()
-        bm.from_mesh(mesh_obj.data)
-        bm.faces.ensure_lookup_table()
-        
+        mesh = mesh_obj.data
+
         # Build material index mapping from Blender to FTS
         material_mapping, fts_data = self._buildMaterialMapping(mesh_obj, fts_data)
-        
-        # Get UV and vertex color layers
-        uv_layer = bm.loops.layers.uv.active
-        color_layer = bm.loops.layers.color.active
-        
-        # Get FTS polygon property layers
-        transval_layer = bm.faces.layers.float.get('arx_transval')
-        area_layer = bm.faces.layers.float.get('arx_area')
-        room_layer = bm.faces.layers.int.get('arx_room')
-        polytype_layer = bm.faces.layers.int.get('arx_polytype')
-        
-        # Get preserved geometric data layers
-        norm_layer = bm.faces.layers.float_vector.get('arx_norm')
-        norm2_layer = bm.faces.layers.float_vector.get('arx_norm2')
-        vertex_norms_layer = bm.faces.layers.string.get('arx_vertex_normals')
-        tex_index_layer = bm.faces.layers.int.get('arx_tex_index')
-        
-        # Get preserved cell coordinate layers for exact round-trip
-        cell_x_layer = bm.faces.layers.int.get('arx_cell_x')
-        cell_z_layer = bm.faces.layers.int.get('arx_cell_z')
-        
-        # FORCE CLEARING of old cell coordinates to ensure recalculation
-        if cell_x_layer:
-            print("DEBUG: Clearing old arx_cell_x data to force recalculation")
-            bm.faces.layers.int.remove(cell_x_layer)
-            cell_x_layer = None
-        if cell_z_layer:
-            print("DEBUG: Clearing old arx_cell_z data to force recalculation")
-            bm.faces.layers.int.remove(cell_z_layer)
-            cell_z_layer = None
-        
+
+        # Bulk-read geometry into numpy arrays; per-loop Python attribute
+        # access is the dominant cost on large background meshes.
+        num_vertices = len(mesh.vertices)
+        num_loops = len(mesh.loops)
+
+        vertex_cos = np.empty(num_vertices * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', vertex_cos)
+        vertex_cos = vertex_cos.reshape(num_vertices, 3)
+        arx_positions = vertex_cos @ _BLENDER_TO_ARX_PERM
+
+        loop_vertex_indices = np.empty(num_loops, dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_vertex_indices)
+
+        uv_layer = mesh.uv_layers.active
+        loop_uvs = None
+        if uv_layer:
+            loop_uvs = np.empty(num_loops * 2, dtype=np.float32)
+            uv_layer.data.foreach_get('uv', loop_uvs)
+            loop_uvs = loop_uvs.reshape(num_loops, 2)
+            loop_uvs[:, 1] = 1.0 - loop_uvs[:, 1]  # flip V coordinate back
+
+        color_attribute = mesh.color_attributes.active_color
+        loop_colors = None
+        if color_attribute and color_attribute.domain == 'CORNER':
+            raw_colors = np.empty(num_loops * 4, dtype=np.float32)
+            color_attribute.data.foreach_get('color', raw_colors)
+            # One float-to-byte conversion for the whole attribute
+            loop_colors = np.clip(raw_colors.reshape(num_loops, 4) * 255.0, 0, 255).astype(np.uint8)
+
+        # The preserve-vs-recalculate decision is loop-invariant, so when
+        # lighting has to be recalculated do it for all loop vertices in one
+        # vectorized batch instead of per-vertex Python calls.
+        preserve_lighting = (getattr(self, '_preserve_original_lighting', False)
+                             and loop_colors is not None)
+        loop_light_colors = None
+        if not preserve_lighting:
+            num_polygons = len(mesh.polygons)
+            poly_normals = np.empty(num_polygons * 3, dtype=np.float32)
+            mesh.polygons.foreach_get('normal', poly_normals)
+            poly_normals = poly_normals.reshape(num_polygons, 3) @ (_BLENDER_TO_ARX_PERM * 0.1)
+            loop_totals = np.empty(num_polygons, dtype=np.int32)
+            mesh.polygons.foreach_get('loop_total', loop_totals)
+            loop_normals = np.repeat(poly_normals, loop_totals, axis=0)
+            loop_light_colors = self._calculateVertexLightingBatch(
+                arx_positions[loop_vertex_indices], loop_normals)
+
+        # Bulk-read the FTS polygon property layers through mesh.attributes;
+        # per-face bmesh layer subscripts are pure Python overhead
+        face_count = len(mesh.polygons)
+
+        def _face_attribute(name, key, dtype, components=1):
+            attribute = mesh.attributes.get(name)
+            if attribute is None or attribute.domain != 'FACE':
+                return None
+            values = np.empty(face_count * components, dtype=dtype)
+            attribute.data.foreach_get(key, values)
+            return values.reshape(face_count, components) if components > 1 else values
+
+        face_transvals = _face_attribute('arx_transval', 'value', np.float32)
+        face_areas = _face_attribute('arx_area', 'value', np.float32)
+        face_rooms = _face_attribute('arx_room', 'value', np.int32)
+        face_polytypes = _face_attribute('arx_polytype', 'value', np.int32)
+
+        # Fallback polygon areas in Arx units, bulk-read only when the
+        # arx_area attribute is missing (scale is 10.0, area scales by square)
+        blender_areas = None
+        if face_areas is None:
+            blender_areas = np.empty(face_count, dtype=np.float32)
+            mesh.polygons.foreach_get('area', blender_areas)
+            blender_areas *= 100.0
+
+        # Vectorized cell coordinates from all face centers at once; the cell
+        # grid and room reference passes reuse these instead of re-averaging
+        # vertex positions per face (grid cells are int(coordinate / 100))
+        poly_centers = np.empty(face_count * 3, dtype=np.float32)
+        mesh.polygons.foreach_get('center', poly_centers)
+        arx_centers = poly_centers.reshape(face_count, 3) @ _BLENDER_TO_ARX_PERM
+        face_cell_x = (arx_centers[:, 0] / 100.0).astype(np.int32)
+        face_cell_z = (arx_centers[:, 2] / 100.0).astype(np.int32)
+
+        # Preserved geometric data layers
+        face_norms = _face_attribute('arx_norm', 'vector', np.float32, 3)
+        face_norms2 = _face_attribute('arx_norm2', 'vector', np.float32, 3)
+        vertex_norms_attribute = mesh.attributes.get('arx_vertex_normals')
+        if vertex_norms_attribute is not None and vertex_norms_attribute.domain != 'FACE':
+            vertex_norms_attribute = None
+
+        # Decode every preserved vertex-normal blob into one (F,4,3) tensor up
+        # front; the face loop then takes zero-copy row views. STRING
+        # attributes have no bulk accessor, so this stays one linear pass.
+        vertex_normals_arr = None
+        vertex_normals_counts = None
+        if vertex_norms_attribute is not None:
+            vertex_normals_arr = np.zeros((face_count, 4, 3), dtype=np.float32)
+            vertex_normals_counts = np.zeros(face_count, dtype=np.int8)
+            norms_data = vertex_norms_attribute.data
+            for face_index in range(face_count):
+                blob = norms_data[face_index].value
+                if len(blob) >= 36:  # 4 normals × 3 floats × 4 bytes = 48 bytes
+                    count = min(len(blob) // 12, 4)
+                    vertex_normals_arr[face_index, :count] = \
+                        np.frombuffer(blob, dtype='<f4', count=count * 3).reshape(count, 3)
+                    vertex_normals_counts[face_index] = count
+
+        # Preserved arx_cell_x/arx_cell_z attributes are deliberately ignored;
+        # cell coordinates are always recalculated during grid generation
+        cell_x_layer = None
+        cell_z_layer = None
+
         if not uv_layer:
             raise ArxException("Background mesh missing UV coordinates")
         
+        # SoA mirrors of the converted face data, indexed by mesh face id.
+        # Bulk passes can consume these arrays instead of the per-face dicts;
+        # triangles duplicate their last vertex into slot 3, quads store the
+        # export vertex order (the import-time swap of slots 2/3 reversed).
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get('loop_start', loop_starts)
+        all_loop_totals = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get('loop_total', all_loop_totals)
+        slot_offsets = np.where((all_loop_totals == 4)[:, np.newaxis],
+                                np.array([0, 1, 3, 2]), np.array([0, 1, 2, 2]))
+        slot_loops = np.minimum(loop_starts[:, np.newaxis] + slot_offsets, num_loops - 1)
+        color_source = loop_colors if preserve_lighting else loop_light_colors
+        self._faces_soa = {
+            'pos': arx_positions[loop_vertex_indices[slot_loops]],
+            'uv': loop_uvs[slot_loops] if loop_uvs is not None else None,
+            'color': color_source[slot_loops],
+            'transval': face_transvals,
+            'area': face_areas,
+            'room': face_rooms,
+            'poly_type': face_polytypes,
+            'loop_total': all_loop_totals,
+        }
+
+        # Vectorized degenerate-face prepass: flag everything that is not a
+        # triangle or quad once instead of branching per face in the loop
+        invalid_faces = (all_loop_totals < 3) | (all_loop_totals > 4)
+        invalid_count = int(invalid_faces.sum())
+        if invalid_count:
+            log.warning(f"Skipping {invalid_count} faces with unsupported vertex counts (only triangles and quads are exported)")
+
         # Check for preserved FTS data - warn but don't fail if missing
-        has_preserved_data = bool(transval_layer and cell_x_layer and cell_z_layer)
+        has_preserved_data = bool(face_transvals is not None and cell_x_layer and cell_z_layer)
         if not has_preserved_data:
-            print(f"WARNING: Mesh missing FTS polygon properties - will use defaults for new/modified faces")
-            print(f"  transval_layer: {transval_layer is not None}")
-            print(f"  cell_x_layer: {cell_x_layer is not None}") 
-            print(f"  cell_z_layer: {cell_z_layer is not None}")
+            log.warning(f"Mesh missing FTS polygon properties - will use defaults for new/modified faces")
+            log.debug(f"  transval_layer: {face_transvals is not None}")
+            log.debug(f"  cell_x_layer: {cell_x_layer is not None}")
+            log.debug(f"  cell_z_layer: {cell_z_layer is not None}")
         
         # Convert faces back to Arx format
         converted_faces = []
         quad_count = 0
         triangle_count = 0
-        for face in bm.faces:
-            # Validate face geometry
-            if len(face.verts) < 3:
-                print(f"WARNING: Skipping degenerate face with {len(face.verts)} vertices")
+        for face in mesh.polygons:
+            # Degenerate faces were flagged in the vectorized prepass
+            if invalid_faces[face.index]:
                 continue
-            if len(face.verts) > 4:
-                print(f"WARNING: Face has {len(face.verts)} vertices, only quads and triangles supported")
-                continue
-                
-            # Convert face vertices back to Arx coordinates
+
+            # Convert face vertices back to Arx coordinates using the
+            # precomputed position/UV/color arrays
             arx_vertices = []
-            for loop in face.loops:
-                # Convert position back to Arx coordinates (reverse the 0.1 scaling and coordinate transform)
-                blender_pos = loop.vert.co
-                arx_pos_tuple = blender_pos_to_arx(blender_pos)
-                arx_pos = Vector(arx_pos_tuple) * 10.0  # Reverse 0.1 scale factor
-                
-                
-                # Get UV coordinates (flip V coordinate back)
-                uv = loop[uv_layer].uv if uv_layer else (0.0, 0.0)
-                arx_uv = (uv[0], 1.0 - uv[1])
-                
-                # Calculate vertex lighting - either use preserved lightmap or recalculate
-                if hasattr(self, '_preserve_original_lighting') and self._preserve_original_lighting and color_layer:
-                    # Use preserved lighting for unmodified faces
-                    color = loop[color_layer]
-                    arx_color = (int(color[0] * 255), int(color[1] * 255), int(color[2] * 255), int(color[3] * 255))
+            for loop_index in face.loop_indices:
+                vertex_index = loop_vertex_indices[loop_index]
+                arx_pos = Vector(arx_positions[vertex_index])
+
+                # Get UV coordinates (V already flipped back in bulk)
+                if loop_uvs is not None:
+                    arx_uv = (float(loop_uvs[loop_index, 0]), float(loop_uvs[loop_index, 1]))
                 else:
-                    # Calculate lighting from scratch for all faces when recalculation is enabled
-                    # Convert face normal from Blender to Arx coordinates
-                    if hasattr(face, 'normal'):
-                        blender_normal = face.normal
-                        arx_normal = Vector(blender_pos_to_arx(blender_normal))
-                    else:
-                        arx_normal = Vector((0, 1, 0))  # Default upward normal
-                    arx_color = self._calculateVertexLighting(arx_pos, arx_normal)
-                    
-                    # Debug first few lighting calculations
-                    if len(converted_faces) < 3:
-                        print(f"DEBUG: Vertex lighting for face {len(converted_faces)}: pos={arx_pos} → color={arx_color}")
-                
+                    arx_uv = (0.0, 0.0)
+
+                # Vertex lighting - color_source was selected once up front
+                # (preserved lightmap or batch-recalculated colors)
+                color = color_source[loop_index]
+                arx_color = (int(color[0]), int(color[1]), int(color[2]), int(color[3]))
+
+
                 arx_vertices.append({
                     'pos': arx_pos,
                     'uv': arx_uv,
@@ -511,17 +766,17 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             
             # Reverse the vertex order swap that was done during import for quads
             vertex_order_swapped = False
-            if len(face.verts) == 4 and len(arx_vertices) == 4:
+            if face.loop_total == 4 and len(arx_vertices) == 4:
                 # During import: tempVerts[2], tempVerts[3] = tempVerts[3], tempVerts[2]
                 # So during export, swap them back
                 arx_vertices[2], arx_vertices[3] = arx_vertices[3], arx_vertices[2]
                 vertex_order_swapped = True
             
             # Get preserved geometric data or fallback to Blender-calculated
-            if norm_layer and norm2_layer:
+            if face_norms is not None and face_norms2 is not None:
                 # Use preserved original normals
-                arx_normal = Vector(face[norm_layer])
-                arx_normal2 = Vector(face[norm2_layer])
+                arx_normal = Vector(face_norms[face.index])
+                arx_normal2 = Vector(face_norms2[face.index])
             else:
                 # Fallback: calculate from Blender geometry
                 blender_normal = face.normal
@@ -529,7 +784,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 
                 # If we swapped vertex order for quads, the normal direction may be wrong
                 # For new custom geometry, recalculate normal from actual vertex positions
-                if vertex_order_swapped or not (norm_layer and norm2_layer):
+                if vertex_order_swapped or face_norms is None or face_norms2 is None:
                     # Calculate normal from the actual vertex order we're using
                     if len(arx_vertices) >= 3:
                         v0 = Vector(arx_vertices[0]['pos'])
@@ -541,71 +796,57 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                         arx_normal = calculated_normal
                         
                         if len(converted_faces) < 3:
-                            print(f"DEBUG: Face {len(converted_faces)} normal: blender={blender_normal} → calculated={calculated_normal}")
+                            log.debug(f"Face {len(converted_faces)} normal: blender={blender_normal} → calculated={calculated_normal}")
                 
                 arx_normal2 = arx_normal
             
-            # Get preserved vertex normals
-            vertex_normals = []
-            if vertex_norms_layer:
-                import struct
-                vertex_norm_data = face[vertex_norms_layer]
-                if len(vertex_norm_data) >= 36:  # 4 normals × 3 floats × 4 bytes = 48 bytes
-                    for i in range(4):
-                        offset = i * 12  # 3 floats × 4 bytes
-                        x, y, z = struct.unpack('<fff', vertex_norm_data[offset:offset+12])
-                        vertex_normals.append(Vector((x, y, z)))
-            
-            # Fallback if not enough vertex normals preserved
-            while len(vertex_normals) < 4:
-                vertex_normals.append(arx_normal)
-            
+            # Preserved vertex normals come from the predecoded tensor; faces
+            # with partial or missing data pad with the face normal
+            if vertex_normals_arr is not None:
+                preserved_count = vertex_normals_counts[face.index]
+            else:
+                preserved_count = 0
+            if preserved_count == 4:
+                vertex_normals = vertex_normals_arr[face.index]
+            elif preserved_count > 0:
+                vertex_normals = ([Vector(normal) for normal in vertex_normals_arr[face.index, :preserved_count]]
+                                  + [arx_normal] * (4 - preserved_count))
+            else:
+                vertex_normals = [arx_normal] * 4
+
+
             # Get stored FTS properties or calculate from geometry
-            transval = face[transval_layer] if transval_layer else 0.0
-            if area_layer:
-                stored_area = face[area_layer]
+            transval = float(face_transvals[face.index]) if face_transvals is not None else 0.0
+            if face_areas is not None:
+                stored_area = float(face_areas[face.index])
             else:
-                # Calculate area in Arx units (Blender area × scale factor²)
-                blender_area = face.calc_area()
-                stored_area = blender_area * (10.0 * 10.0)  # Scale factor is 10.0, area scales by square
-            room_id = face[room_layer] if room_layer else 0
+                # Bulk-read Blender areas already converted to Arx units
+                stored_area = float(blender_areas[face.index])
+            room_id = int(face_rooms[face.index]) if face_rooms is not None else 0
             # Clamp room ID to valid range (engine crashes on negative room IDs)
             if room_id < 0:
                 room_id = 0
                 if len(converted_faces) < 10:
-                    print(f"WARNING: Face {len(converted_faces)} had negative room ID, clamped to 0")
+                    log.warning(f"Face {len(converted_faces)} had negative room ID, clamped to 0")
             # Use current material assignment instead of preserved texture index
             # This ensures texture changes in Blender are reflected in the export
             blender_mat_index = face.material_index
             fts_texture_id = material_mapping.get(blender_mat_index, 0)
             if blender_mat_index != 0 and fts_texture_id == 0:
-                print(f"WARNING: Face {face.index} has material index {blender_mat_index} but no FTS texture mapping found")  # Default to texture 0 if not found
+                log.warning(f"Face {face.index} has material index {blender_mat_index} but no FTS texture mapping found")  # Default to texture 0 if not found
             
             # Calculate polygon type from actual geometry
-            is_quad = len(face.verts) == 4
-            if polytype_layer:
-                poly_type = face[polytype_layer]
+            is_quad = face.loop_total == 4
+            if face_polytypes is not None:
+                poly_type = int(face_polytypes[face.index])
             else:
                 # Default polygon type - calculate flag value directly to avoid ctypes
                 # POLY_QUAD flag is bit 0, so value is 1 if quad, 0 if triangle
                 poly_type = 1 if is_quad else 0
             
-            # Get preserved cell coordinates (only store if they exist in mesh data)
-            has_preserved_cell_coords = cell_x_layer and cell_z_layer
-            if has_preserved_cell_coords:
-                cell_x = face[cell_x_layer]
-                cell_z = face[cell_z_layer]
-            else:
-                # No preserved coordinates - let cell grid generation calculate them later
-                cell_x = None
-                cell_z = None
-                
-                if len(converted_faces) < 5:
-                    print(f"DEBUG: No preserved cell coordinates for face {len(converted_faces)} - will calculate during grid generation")
-            
             # Debug: log room values from Blender face data
             if len(converted_faces) < 5:
-                print(f"DEBUG: Blender face {len(converted_faces)}: room_id={room_id}")
+                log.debug(f"Blender face {len(converted_faces)}: room_id={room_id}")
             
             # Count quad vs triangle faces
             if is_quad:
@@ -627,13 +868,12 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 'norm2': arx_normal2,  # Use preserved secondary normal
                 'vertex_normals': vertex_normals[:4],  # Use preserved per-vertex normals
                 'tex': fts_texture_id,  # Use current material assignment
+                'face_index': face.index,  # Row into the _faces_soa arrays
+                # Precomputed cell placement from the vectorized center pass
+                'grid_cell': (int(face_cell_x[face.index]), int(face_cell_z[face.index])),
+                'grid_center': (float(arx_centers[face.index, 0]), float(arx_centers[face.index, 2])),
             }
-            
-            # Only add cell coordinates if they were preserved from mesh data
-            if has_preserved_cell_coords:
-                fts_polygon['cell_x'] = cell_x
-                fts_polygon['cell_z'] = cell_z
-            
+
             converted_faces.append(fts_polygon)
         
         # Store converted data for potential FTS writing
@@ -641,12 +881,18 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         # implementing the full FTS write functionality
         self.converted_faces = converted_faces
         
-        print(f"QUAD/TRIANGLE COUNT: {quad_count} quads, {triangle_count} triangles, {len(converted_faces)} total faces")
+        log.debug(f"QUAD/TRIANGLE COUNT: {quad_count} quads, {triangle_count} triangles, {len(converted_faces)} total faces")
         self.report({'INFO'}, f"Converted {len(converted_faces)} faces from Blender mesh ({quad_count} quads, {triangle_count} triangles)")
-        
-        bm.free()
+
         return fts_data
     
+    @staticmethod
+    def _ftsTextureView(fts_texture):
+        """Uniform (fic, tc) view over dict and ctypes FTS texture entries"""
+        if isinstance(fts_texture, dict):
+            return fts_texture['fic'], fts_texture['tc']
+        return fts_texture.fic, fts_texture.tc
+
     def _buildMaterialMapping(self, mesh_obj, fts_data):
         """Build mapping from Blender material indices to FTS texture indices"""
         material_mapping = {}
@@ -656,51 +902,65 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         
         if not mesh_materials:
             return {0: 0}, fts_data  # Default mapping
-        
-        
+
+        # Pre-normalize every FTS texture name once; doing the string cleanup
+        # per (material × texture) pair made the matching scan quadratic
+        normalized_textures = []
+        base_to_texture = {}
+        for fts_texture in fts_data.textures:
+            fts_fic, fts_tc = self._ftsTextureView(fts_texture)  # tc is the texture container ID, not the array index
+            fts_name = fts_fic.decode('iso-8859-1').rstrip('\x00')
+            fts_base = fts_name.replace('\\', '/').split('/')[-1].lower()  # Get filename only
+            fts_base = fts_base.replace('.jpg', '').replace('.tga', '').replace('.bmp', '')
+            normalized_textures.append((fts_base, fts_tc, fts_texture))
+            base_to_texture.setdefault(fts_base, (fts_tc, fts_texture))
+
+        # Next free texture container ID, maintained as a counter so
+        # _addNewTexture doesn't rescan the texture list per new material
+        self._next_tc = max((tc for _, tc, _ in normalized_textures), default=0) + 1
+
+        # Accumulate texture path updates keyed by tc and rebuild the texture
+        # list in a single terminal pass (namedtuple is immutable)
+        pending_tex_updates = {}
+
+        def _apply_pending_updates(data):
+            updated = [pending_tex_updates.get(self._ftsTextureView(tex)[1], tex)
+                       for tex in data.textures]
+            pending_tex_updates.clear()
+            return data._replace(textures=updated)
+
         for blender_idx, material in enumerate(mesh_materials):
             if material is None:
                 # Empty material slot
                 material_mapping[blender_idx] = 0
                 continue
-                
+
             material_name = material.name
-            
+
             # Extract image path from Blender material if available
             image_path = self._extractImagePathFromMaterial(material)
-            
-            # Try to find matching FTS texture by name
+
+            # Try to find matching FTS texture by name - exact basename match
+            # via dict lookup, substring match as fallback
             fts_tex_index = None
             fts_texture_to_update = None
-            
-            for fts_idx, fts_texture in enumerate(fts_data.textures):
-                if isinstance(fts_texture, dict):
-                    fts_name = fts_texture['fic'].decode('iso-8859-1').rstrip('\x00')
-                else:
-                    fts_name = fts_texture.fic.decode('iso-8859-1').rstrip('\x00')
-                
-                # Improved matching logic - extract base name from both sides
-                material_base = material_name.replace('-mat', '').lower()
-                fts_base = fts_name.replace('\\', '/').split('/')[-1].lower()  # Get filename only
-                fts_base = fts_base.replace('.jpg', '').replace('.tga', '').replace('.bmp', '')
-                
-                if material_base == fts_base or material_base in fts_base or fts_base in material_base:
-                    if isinstance(fts_texture, dict):
-                        fts_tex_index = fts_texture['tc']  # Use texture container ID, not array index
-                        fts_tc = fts_texture['tc']
-                    else:
-                        fts_tex_index = fts_texture.tc
-                        fts_tc = fts_texture.tc
-                    fts_texture_to_update = fts_texture
-                    break
+            material_base = material_name.replace('-mat', '').lower()
+
+            exact_match = base_to_texture.get(material_base)
+            if exact_match is not None:
+                fts_tex_index, fts_texture_to_update = exact_match
+            else:
+                for fts_base, fts_tc, fts_texture in normalized_textures:
+                    if material_base in fts_base or fts_base in material_base:
+                        fts_tex_index = fts_tc
+                        fts_texture_to_update = fts_texture
+                        break
             
             # Update FTS texture path only if user actually changed the image path
             if fts_texture_to_update and image_path:
                 # Extract current FTS filename for comparison
-                if isinstance(fts_texture_to_update, dict):
-                    current_fts_path = fts_texture_to_update['fic'].decode('iso-8859-1').rstrip('\x00')
-                else:
-                    current_fts_path = fts_texture_to_update.fic.decode('iso-8859-1').rstrip('\x00')
+                current_fic, fts_to_update_tc = self._ftsTextureView(fts_texture_to_update)
+                current_fts_path = current_fic.decode('iso-8859-1').rstrip('\x00')
                 current_filename = current_fts_path.replace('\\', '/').split('/')[-1]
                 current_base = current_filename.replace('.jpg', '').replace('.tga', '').replace('.bmp', '').lower()
                 image_base = image_path.lower()
@@ -708,27 +968,23 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 # Only update if the user actually changed the texture
                 if current_base != image_base:
                     # Reconstruct proper FTS path format
-                    new_fts_path = f"GRAPH\\OBJ3D\\TEXTURES\\{image_path.upper()}.BMP"
+                    new_fts_path = _FTS_TEXTURE_PATH_PREFIX + image_path.upper() + ".BMP"
                     new_texture = self._updateFtsTexturePath(fts_texture_to_update, new_fts_path)
                     if new_texture:
-                        # Create new texture list (can't modify namedtuple directly)
-                        new_textures = list(fts_data.textures)
-                        for i, tex in enumerate(new_textures):
-                            tex_tc = tex['tc'] if isinstance(tex, dict) else tex.tc
-                            fts_to_update_tc = fts_texture_to_update['tc'] if isinstance(fts_texture_to_update, dict) else fts_texture_to_update.tc
-                            if tex_tc == fts_to_update_tc:
-                                new_textures[i] = new_texture
-                                break
-                        # Replace the entire FTS data with updated textures (namedtuple is immutable)
-                        fts_data = fts_data._replace(textures=new_textures)
-                        pass
-            
+                        pending_tex_updates[fts_to_update_tc] = new_texture
+
             if fts_tex_index is None:
-                # Add new texture to FTS texture list
+                # Add new texture to FTS texture list - sync pending path
+                # updates first since _addNewTexture copies fts_data.textures
+                if pending_tex_updates:
+                    fts_data = _apply_pending_updates(fts_data)
                 fts_tex_index, fts_data = self._addNewTexture(fts_data, material_name, image_path)
-                
+
             material_mapping[blender_idx] = fts_tex_index
-        
+
+        if pending_tex_updates:
+            fts_data = _apply_pending_updates(fts_data)
+
         return material_mapping, fts_data
     
     def _extractImagePathFromMaterial(self, material):
@@ -765,7 +1021,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             encoded_path = encoded_path[:255]  # Leave room for null terminator
         
         # Create new texture as Python dict to avoid ctypes read-only issues
-        path_bytes = encoded_path + b'\x00' * (256 - len(encoded_path))
+        path_bytes = encoded_path.ljust(256, b'\x00')
         
         if isinstance(fts_texture, dict):
             new_texture = {
@@ -785,68 +1041,90 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
     
     def _storeOriginalFtsDataInScene(self, scene, fts_data):
         """Store complete original FTS data in scene custom properties for persistence across save/load"""
-        import pickle
-        print("DEBUG: Storing complete original FTS data in scene properties")
-        
+        log.debug("Storing complete original FTS data in scene properties")
+
+        # The same fts_data object is often stored repeatedly (repeated save
+        # or export clicks) without changing - identity plus a couple of
+        # canary lengths is enough to skip the whole serialization pipeline
+        cache_key = f"{id(fts_data)}:{len(fts_data.textures)}:{len(fts_data.portals)}:{len(fts_data.anchors)}"
+        if scene.get("arx_fts_cache_key") == cache_key:
+            log.debug("Original FTS data unchanged - skipping re-store")
+            return
+
         # Store critical non-geometry data that must be preserved exactly
         try:
             # Store scene offset
             scene["arx_scene_offset"] = fts_data.sceneOffset
-            print(f"DEBUG: Storing scene offset: {fts_data.sceneOffset}")
+            log.debug(f"Storing scene offset: {fts_data.sceneOffset}")
             
-            # Store textures as serialized data  
+            # Store textures as serialized data. The list is homogeneous, so
+            # the dict-vs-ctypes dispatch is decided once instead of per entry
             texture_data = []
-            for i, tex in enumerate(fts_data.textures):
-                try:
-                    if isinstance(tex, dict):
-                        # Validate dict format
-                        if 'tc' in tex and 'temp' in tex and 'fic' in tex:
-                            texture_data.append(tex)  # Already in correct format
-                        else:
-                            print(f"WARNING: Invalid texture dict at index {i}: {tex}")
-                            texture_data.append({'tc': 0, 'temp': 0, 'fic': b'default.bmp' + b'\x00' * 245})
+            textures_are_dicts = isinstance(fts_data.textures[0], dict) if fts_data.textures else True
+            if textures_are_dicts:
+                for i, tex in enumerate(fts_data.textures):
+                    if 'tc' in tex and 'temp' in tex and 'fic' in tex:
+                        texture_data.append(tex)  # Already in correct format
                     else:
-                        # Convert ctypes to dict with proper type conversion
+                        log.warning(f"Invalid texture dict at index {i}: {tex}")
+                        texture_data.append({'tc': 0, 'temp': 0, 'fic': b'default.bmp' + b'\x00' * 245})
+            else:
+                # Convert ctypes to dicts with proper type conversion
+                try:
+                    for tex in fts_data.textures:
                         texture_data.append({
-                            'tc': int(tex.tc) if hasattr(tex, 'tc') else 0,
-                            'temp': int(tex.temp) if hasattr(tex, 'temp') else 0,
-                            'fic': bytes(tex.fic) if hasattr(tex, 'fic') else b'default.bmp' + b'\x00' * 245
+                            'tc': int(tex.tc),
+                            'temp': int(tex.temp),
+                            'fic': bytes(tex.fic)
                         })
                 except Exception as e:
-                    print(f"WARNING: Failed to process texture {i}: {e}")
-                    # Add fallback texture
-                    texture_data.append({'tc': i, 'temp': 0, 'fic': b'default.bmp' + b'\x00' * 245})
-            
-            scene["arx_texture_data"] = pickle.dumps(texture_data)
-            print(f"DEBUG: Stored {len(texture_data)} textures")
-            
-            # Store anchors - convert ALL ctypes to Python types
-            anchor_data = []
-            print(f"DEBUG: Processing {len(fts_data.anchors)} anchors")
-            for i, anchor in enumerate(fts_data.anchors):
-                if i < 3:  # Debug first few anchors
-                    print(f"DEBUG: Anchor {i}: {type(anchor)}, length={len(anchor)}, content={anchor}")
-                if len(anchor) >= 5:  # New format with preserved data
-                    anchor_pos, anchor_links, radius, height, flags = anchor
-                    # Convert all ctypes to Python types
-                    if hasattr(anchor_pos, 'x'):  # SavedVec3 structure
-                        pos_tuple = (float(anchor_pos.x), float(anchor_pos.y), float(anchor_pos.z))
-                    else:
-                        pos_tuple = tuple(float(x) for x in anchor_pos)  # Convert to tuple of floats
-                    
-                    link_list = list(anchor_links) if hasattr(anchor_links, '__iter__') else [anchor_links]
-                    anchor_data.append((pos_tuple, link_list, float(radius), float(height), int(flags)))
-                else:  # Old format fallback
-                    anchor_pos, anchor_links = anchor[:2]
-                    if hasattr(anchor_pos, 'x'):  # SavedVec3 structure
-                        pos_tuple = (float(anchor_pos.x), float(anchor_pos.y), float(anchor_pos.z))
-                    else:
-                        pos_tuple = tuple(float(x) for x in anchor_pos)
-                    
-                    link_list = list(anchor_links) if hasattr(anchor_links, '__iter__') else [anchor_links]
-                    anchor_data.append((pos_tuple, link_list))
-            scene["arx_anchor_data"] = pickle.dumps(anchor_data)
-            print(f"DEBUG: Stored {len(anchor_data)} anchors")
+                    log.warning(f"Failed to process texture {len(texture_data)}: {e}")
+                    # Pad remaining entries with fallback textures
+                    for i in range(len(texture_data), len(fts_data.textures)):
+                        texture_data.append({'tc': i, 'temp': 0, 'fic': b'default.bmp' + b'\x00' * 245})
+            
+            scene["arx_texture_data"] = _encode_scene_blob(texture_data)
+            log.debug(f"Stored {len(texture_data)} textures")
+            
+            # Store anchors - convert ALL ctypes to Python types. The anchor
+            # list is homogeneous, so the SavedVec3-vs-sequence test on the
+            # position is decided once instead of per anchor
+            log.debug(f"Processing {len(fts_data.anchors)} anchors")
+            first_anchor = fts_data.anchors[0] if fts_data.anchors else None
+            pos_is_struct = first_anchor is not None and hasattr(first_anchor[0], 'x')
+            if (first_anchor is not None and not pos_is_struct
+                    and isinstance(first_anchor[0], tuple) and isinstance(first_anchor[1], list)):
+                # Anchors that round-tripped through the scene store are
+                # already plain tuples/lists - re-running the per-anchor
+                # conversion would just copy them element by element
+                anchor_data = fts_data.anchors
+            else:
+                anchor_data = []
+                for i, anchor in enumerate(fts_data.anchors):
+                    if i < 3:  # Debug first few anchors - %-style defers the
+                        # formatting until the record is actually emitted
+                        log.debug("Anchor %d: %s, length=%d, content=%s", i, type(anchor), len(anchor), anchor)
+                    if len(anchor) >= 5:  # New format with preserved data
+                        anchor_pos, anchor_links, radius, height, flags = anchor
+                        # Convert all ctypes to Python types
+                        if pos_is_struct:  # SavedVec3 structure
+                            pos_tuple = (float(anchor_pos.x), float(anchor_pos.y), float(anchor_pos.z))
+                        else:
+                            pos_tuple = tuple(float(x) for x in anchor_pos)  # Convert to tuple of floats
+
+                        link_list = list(anchor_links) if hasattr(anchor_links, '__iter__') else [anchor_links]
+                        anchor_data.append((pos_tuple, link_list, float(radius), float(height), int(flags)))
+                    else:  # Old format fallback
+                        anchor_pos, anchor_links = anchor[:2]
+                        if pos_is_struct:  # SavedVec3 structure
+                            pos_tuple = (float(anchor_pos.x), float(anchor_pos.y), float(anchor_pos.z))
+                        else:
+                            pos_tuple = tuple(float(x) for x in anchor_pos)
+
+                        link_list = list(anchor_links) if hasattr(anchor_links, '__iter__') else [anchor_links]
+                        anchor_data.append((pos_tuple, link_list))
+            scene["arx_anchor_data"] = _encode_scene_blob(anchor_data)
+            log.debug(f"Stored {len(anchor_data)} anchors")
             
             # Store cell anchors - convert any ctypes arrays to lists
             cell_anchor_data = []
@@ -858,19 +1136,20 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                     else:
                         z_row_data.append(None)
                 cell_anchor_data.append(z_row_data)
-            scene["arx_cell_anchor_data"] = pickle.dumps(cell_anchor_data)
-            print(f"DEBUG: Stored cell anchor data")
+            scene["arx_cell_anchor_data"] = _encode_scene_blob(cell_anchor_data)
+            log.debug(f"Stored cell anchor data")
             
-            # Store portals as binary data
-            portal_data = []
-            for portal in fts_data.portals:
-                portal_data.append(bytes(portal))  # Serialize entire portal structure
-            scene["arx_portal_data"] = pickle.dumps(portal_data)
-            print(f"DEBUG: Stored {len(portal_data)} portals")
+            # Store portals as one contiguous binary blob - every portal
+            # struct has the same fixed size, so no pickle framing is needed
+            scene["arx_portal_data"] = b''.join(
+                portal if isinstance(portal, bytes) else bytes(portal)
+                for portal in fts_data.portals)
+            scene["arx_portal_count"] = len(fts_data.portals)
+            log.debug(f"Stored {len(fts_data.portals)} portals")
             
             # Store room data - handle ctypes arrays carefully
             if hasattr(fts_data, 'room_data') and fts_data.room_data:
-                print(f"DEBUG: Processing room data")
+                log.debug(f"Processing room data")
                 room_data_list, room_distances = fts_data.room_data
                 
                 # Serialize room structures as binary
@@ -898,52 +1177,72 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                         'poly_refs': [bytes(ref) for ref in room_poly_refs]  # Serialize polygon references
                     })
                 
-                print(f"DEBUG: Processed {len(serialized_rooms)} room structures")
+                log.debug(f"Processed {len(serialized_rooms)} room structures")
                 
-                # Serialize distance matrix - handle ROOM_DIST_DATA_SAVE structures
-                serialized_distances = []
+                # Serialize distance matrix - handle ROOM_DIST_DATA_SAVE
+                # structures. The matrix is O(rooms^2) and rarely changes, so
+                # hash it first and only rebuild the blob when it differs from
+                # what the scene already holds
+                distances_hash = hashlib.blake2b(digest_size=16)
                 for row in room_distances:
-                    serialized_row = []
                     for dist in row:
                         try:
-                            # Convert to bytes (should work for ctypes structures)
-                            dist_bytes = bytes(dist)
-                            serialized_row.append(dist_bytes)
-                        except Exception as e:
-                            print(f"WARNING: Failed to serialize distance data: {e}")
-                            # Create a simple fallback distance structure
-                            fallback_bytes = b'\x00' * 28  # Size of ROOM_DIST_DATA_SAVE (1 float + 2 Vec3s = 4 + 12 + 12 = 28 bytes)
-                            serialized_row.append(fallback_bytes)
-                    serialized_distances.append(serialized_row)
-                
-                scene["arx_room_data"] = pickle.dumps((serialized_rooms, serialized_distances))
-                print(f"DEBUG: Stored room data: {len(serialized_rooms)} rooms")
-            
-            print(f"DEBUG: Stored FTS data: {len(fts_data.textures)} textures, {len(fts_data.portals)} portals")
+                            distances_hash.update(dist if isinstance(dist, bytes) else bytes(dist))
+                        except Exception:
+                            distances_hash.update(b'\x00' * 28)
+                distances_digest = distances_hash.digest()
+
+                if ("arx_room_distance_data" not in scene or
+                        bytes(scene.get("arx_room_distances_hash", b'')) != distances_digest):
+                    serialized_distances = []
+                    for row in room_distances:
+                        serialized_row = []
+                        for dist in row:
+                            try:
+                                # Convert to bytes (should work for ctypes structures)
+                                dist_bytes = bytes(dist)
+                                serialized_row.append(dist_bytes)
+                            except Exception as e:
+                                log.warning(f"Failed to serialize distance data: {e}")
+                                # Create a simple fallback distance structure
+                                fallback_bytes = b'\x00' * 28  # Size of ROOM_DIST_DATA_SAVE (1 float + 2 Vec3s = 4 + 12 + 12 = 28 bytes)
+                                serialized_row.append(fallback_bytes)
+                        serialized_distances.append(serialized_row)
+                    scene["arx_room_distance_data"] = (
+                        _SCENE_BLOB_FRAMED +
+                        _pack_framed([_pack_framed(row) for row in serialized_distances]))
+                    scene["arx_room_distances_hash"] = distances_digest
+                else:
+                    log.debug("Room distance matrix unchanged - keeping stored blob")
+
+                scene["arx_room_data"] = _encode_scene_blob((serialized_rooms, None))
+                log.debug(f"Stored room data: {len(serialized_rooms)} rooms")
             
+            log.debug(f"Stored FTS data: {len(fts_data.textures)} textures, {len(fts_data.portals)} portals")
+            scene["arx_fts_cache_key"] = cache_key
+
         except Exception as e:
-            print(f"WARNING: Failed to store FTS data in scene properties: {e}")
+            log.warning(f"Failed to store FTS data in scene properties: {e}")
     
     def _restoreOriginalFtsDataFromScene(self, scene, base_fts_data):
         """Restore complete original FTS data from scene custom properties using pure Python structures"""
-        import pickle
-        print("DEBUG: Restoring original FTS data from scene properties")
+        log.debug("Restoring original FTS data from scene properties")
         
         try:
             # Restore textures as pure Python dicts (not ctypes)
             if "arx_texture_data" in scene:
-                texture_data = pickle.loads(scene["arx_texture_data"])
+                texture_data = _decode_scene_blob(scene["arx_texture_data"])
                 # Keep as pure Python dicts - don't create ctypes here
                 base_fts_data = base_fts_data._replace(textures=texture_data)
             
             # Restore anchors (already Python tuples/lists)
             if "arx_anchor_data" in scene:
-                anchors = pickle.loads(scene["arx_anchor_data"])
+                anchors = _decode_scene_blob(scene["arx_anchor_data"])
                 base_fts_data = base_fts_data._replace(anchors=anchors)
             
             # Restore cell anchors (already Python lists)
             if "arx_cell_anchor_data" in scene:
-                cell_anchors = pickle.loads(scene["arx_cell_anchor_data"])
+                cell_anchors = _decode_scene_blob(scene["arx_cell_anchor_data"])
                 base_fts_data = base_fts_data._replace(cell_anchors=cell_anchors)
             
             # Restore scene offset
@@ -953,14 +1252,32 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             
             # Restore portals as binary data (don't convert to ctypes yet)
             if "arx_portal_data" in scene:
-                portal_bytes_list = pickle.loads(scene["arx_portal_data"])
+                if "arx_portal_count" in scene:
+                    # Contiguous blob of fixed-size portal structs
+                    from .dataFts import EERIE_SAVE_PORTALS
+                    from ctypes import sizeof
+                    portal_blob = bytes(scene["arx_portal_data"])
+                    portal_size = sizeof(EERIE_SAVE_PORTALS)
+                    portal_bytes_list = [portal_blob[i * portal_size:(i + 1) * portal_size]
+                                         for i in range(scene["arx_portal_count"])]
+                else:
+                    # Older scenes stored a pickled list of bytes objects
+                    portal_bytes_list = _decode_scene_blob(scene["arx_portal_data"])
                 # Store as binary data, convert to ctypes only during final serialization
                 base_fts_data = base_fts_data._replace(portals=portal_bytes_list)
             
             # Restore room data as pure Python structures
             if "arx_room_data" in scene:
-                room_data = pickle.loads(scene["arx_room_data"])
+                room_data = _decode_scene_blob(scene["arx_room_data"])
                 serialized_rooms, serialized_distances = room_data
+                if "arx_room_distance_data" in scene:
+                    # Distance matrix lives in its own hash-guarded property
+                    distance_blob = bytes(scene["arx_room_distance_data"])
+                    if distance_blob[:1] == _SCENE_BLOB_FRAMED:
+                        serialized_distances = [_unpack_framed(row)
+                                                for row in _unpack_framed(distance_blob[1:])]
+                    else:
+                        serialized_distances = _decode_scene_blob(distance_blob)
                 
                 # Keep as pure Python structures - don't create ctypes here
                 restored_room_list = []
@@ -979,47 +1296,56 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 # Keep distance matrix as binary data
                 base_fts_data = base_fts_data._replace(room_data=(restored_room_list, serialized_distances))
             
-            print("DEBUG: Successfully restored FTS data as pure Python structures")
+            log.debug("Successfully restored FTS data as pure Python structures")
             return base_fts_data
             
         except Exception as e:
-            print(f"WARNING: Failed to restore FTS data from scene properties: {e}")
+            log.warning(f"Failed to restore FTS data from scene properties: {e}")
             return base_fts_data
     
     def _addNewTexture(self, fts_data, material_name, image_path=None):
         """Create new FTS texture entry for new material"""
-        print(f"WARNING: Material '{material_name}' not found in FTS textures")
+        log.warning(f"Material '{material_name}' not found in FTS textures")
         
         if image_path:
-            print(f"DEBUG: Creating new FTS texture for image path '{image_path}'")
-            
-            # Generate new texture container ID - use highest existing tc + 1
-            max_tc = max(((tex['tc'] if isinstance(tex, dict) else tex.tc) for tex in fts_data.textures), default=0)
-            new_tc = max_tc + 1
-            
-            # Set texture path in proper FTS format
-            fts_path = f"GRAPH\\OBJ3D\\TEXTURES\\{image_path.upper()}.BMP"
-            encoded_path = fts_path.encode('iso-8859-1', errors='replace')
-            if len(encoded_path) >= 256:
-                encoded_path = encoded_path[:255]  # Leave room for null terminator
-            
+            log.debug(f"Creating new FTS texture for image path '{image_path}'")
+            
+            # Generate new texture container ID from the counter maintained by
+            # _buildMaterialMapping; fall back to scanning the list once
+            next_tc = getattr(self, '_next_tc', None)
+            if next_tc is None:
+                max_tc = max(((tex['tc'] if isinstance(tex, dict) else tex.tc) for tex in fts_data.textures), default=0)
+                next_tc = max_tc + 1
+            new_tc = next_tc
+            self._next_tc = new_tc + 1
+            
+            # Build the fic field directly as bytes from the pre-encoded
+            # prefix/suffix - only the filename itself needs encoding
+            body = image_path.upper().encode('iso-8859-1', errors='replace')
+            encoded_path = (_FTS_PATH_PREFIX_BYTES + body + _FTS_PATH_SUFFIX_BYTES)[:255]
+
             # Create new texture as Python dict to avoid ctypes issues
-            path_bytes = encoded_path + b'\x00' * (256 - len(encoded_path))
+            path_bytes = encoded_path.ljust(256, b'\x00')
             new_texture = {
                 'tc': new_tc,
                 'temp': 0,  # Standard temp value
                 'fic': path_bytes
             }
             
-            # Create new texture list and update fts_data (namedtuple is immutable)
-            new_textures = list(fts_data.textures)
-            new_textures.append(new_texture)
-            fts_data = fts_data._replace(textures=new_textures)
+            # Append in place when textures is already a Python list (the
+            # read path produces dicts); only a ctypes array still needs
+            # materializing, and then just once
+            if isinstance(fts_data.textures, list):
+                fts_data.textures.append(new_texture)
+            else:
+                new_textures = list(fts_data.textures)
+                new_textures.append(new_texture)
+                fts_data = fts_data._replace(textures=new_textures)
             
-            print(f"DEBUG: Created new FTS texture tc={new_tc} for path '{fts_path}'")
+            log.debug(f"Created new FTS texture tc={new_tc} for path '{encoded_path.decode('iso-8859-1')}'")
             return new_tc, fts_data
         else:
-            print(f"DEBUG: No image path provided, using fallback texture")
+            log.debug(f"No image path provided, using fallback texture")
             
             # Try to find a reasonable fallback texture
             if fts_data.textures:
@@ -1030,31 +1356,39 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 else:
                     fallback_tc = fts_data.textures[0].tc
                     fallback_name = fts_data.textures[0].fic.decode('iso-8859-1').rstrip('\x00')
-                print(f"DEBUG: Using fallback texture tc={fallback_tc} ('{fallback_name}') for material '{material_name}'")
+                log.debug(f"Using fallback texture tc={fallback_tc} ('{fallback_name}') for material '{material_name}'")
                 return fallback_tc, fts_data
             else:
                 # No textures available, use tc=0 as absolute fallback
-                print(f"DEBUG: No textures in FTS, using tc=0 for material '{material_name}'")
+                log.debug(f"No textures in FTS, using tc=0 for material '{material_name}'")
                 return 0, fts_data
     
     def _rebuildRoomPolygonReferences(self, fts_data):
         """Rebuild room polygon references (EP_DATA) efficiently to fix topology changes"""
-        print("DEBUG: Rebuilding room polygon references to fix topology changes")
+        log.debug("Rebuilding room polygon references to fix topology changes")
         
         if not hasattr(fts_data, 'room_data') or not fts_data.room_data:
-            print("DEBUG: No room data to rebuild - disabling room system entirely")
+            log.debug("No room data to rebuild - disabling room system entirely")
             # Can't modify namedtuple directly - return without room data
             return
         
         room_data_list, room_distances = fts_data.room_data
         
-        # Build cell polygon mapping efficiently in a single pass
-        cell_polygons = {}  # (cell_x, cell_z) -> [(room_id, poly_idx_in_cell), ...]
-        
-        for face_data in self.converted_faces:
-            # Calculate cell coordinates using same logic as grid reconstruction
+        # Gather per-face cell coordinates and room IDs as parallel int32
+        # arrays so the per-cell polygon numbering is tight integer work
+        face_count = len(self.converted_faces)
+        face_cx = np.empty(face_count, dtype=np.int32)
+        face_cz = np.empty(face_count, dtype=np.int32)
+        face_room = np.empty(face_count, dtype=np.int32)
+        for i, face_data in enumerate(self.converted_faces):
+            # Use the same cell placement as grid reconstruction - prefer the
+            # precomputed coordinates from the vectorized center pass
+            grid_cell = face_data.get('grid_cell')
             vertices = face_data.get('vertices', [])
-            if vertices:
+            if grid_cell is not None:
+                cell_x = max(0, min(159, grid_cell[0]))
+                cell_z = max(0, min(159, grid_cell[1]))
+            elif vertices:
                 center_x = sum(v['pos'][0] for v in vertices) / len(vertices)
                 center_z = sum(v['pos'][2] for v in vertices) / len(vertices)
                 cell_x = int(center_x / 100)
@@ -1065,30 +1399,31 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             else:
                 cell_x = 80  # Center fallback
                 cell_z = 80
-            room_id = face_data.get('room', 0)
-            
-            cell_key = (cell_x, cell_z)
-            if cell_key not in cell_polygons:
-                cell_polygons[cell_key] = []
-            
-            # Polygon index within this cell is just the current count
-            poly_idx_in_cell = len(cell_polygons[cell_key])
-            cell_polygons[cell_key].append((room_id, poly_idx_in_cell))
-        
-        # Create room polygon mapping
-        room_polygon_refs = {}  # room_id -> [(cell_x, cell_z, poly_idx), ...]
-        
-        for (cell_x, cell_z), polys in cell_polygons.items():
-            for room_id, poly_idx in polys:
-                if room_id not in room_polygon_refs:
-                    room_polygon_refs[room_id] = []
-                room_polygon_refs[room_id].append((cell_x, cell_z, poly_idx))
-        
+            face_cx[i] = cell_x
+            face_cz[i] = cell_z
+            face_room[i] = face_data.get('room', 0)
+
+        # Polygon index within each cell is the count of earlier faces in the
+        # same cell - a counting pass over a 160x160 histogram
+        if cell_poly_indices is not None:
+            face_poly_idx = cell_poly_indices(face_cx, face_cz)
+        else:
+            cell_counts = np.zeros((160, 160), dtype=np.int32)
+            face_poly_idx = np.empty(face_count, dtype=np.int32)
+            for i in range(face_count):
+                face_poly_idx[i] = cell_counts[face_cz[i], face_cx[i]]
+                cell_counts[face_cz[i], face_cx[i]] += 1
+
+        room_polygon_refs = defaultdict(list)  # room_id -> [(cell_x, cell_z, poly_idx), ...]
+        for i in range(face_count):
+            room_polygon_refs[int(face_room[i])].append(
+                (int(face_cx[i]), int(face_cz[i]), int(face_poly_idx[i])))
+
         # Find the maximum room ID actually used
         max_room_id = max(room_polygon_refs.keys()) if room_polygon_refs else 0
         max_room_id = max(max_room_id, len(room_data_list) - 1)  # Ensure we don't shrink existing rooms
         
-        print(f"DEBUG: Expanding room data to support room IDs 0-{max_room_id}")
+        log.debug(f"Expanding room data to support room IDs 0-{max_room_id}")
         
         # Rebuild room structures with simple Python data (not ctypes) for ALL room IDs
         new_room_data_list = []
@@ -1122,7 +1457,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 new_room_info['nb_polys'] = len(new_poly_refs)
                 
             new_room_data_list.append((new_room_info, room_portal_indices, new_poly_refs))
-            print(f"DEBUG: Room {room_idx}: {new_room_info['nb_polys']} polygons")
+            log.debug(f"Room {room_idx}: {new_room_info['nb_polys']} polygons")
         
         # Check portal-room connectivity for debugging
         portal_room_errors = 0
@@ -1131,14 +1466,14 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 # Extract room connections from portal (assuming portal structure has room_1, room_2)
                 # This would need to be adapted based on actual portal structure
                 if portal_idx < 5:  # Debug first few portals
-                    print(f"DEBUG: Portal {portal_idx} connects rooms (data available but structure analysis needed)")
+                    log.debug(f"Portal {portal_idx} connects rooms (data available but structure analysis needed)")
         
         # Expand room distance matrix if needed
         current_matrix_size = len(room_distances) if room_distances else 0
         required_matrix_size = max_room_id + 1
         
         if required_matrix_size > current_matrix_size:
-            print(f"DEBUG: Expanding room distance matrix from {current_matrix_size}x{current_matrix_size} to {required_matrix_size}x{required_matrix_size}")
+            log.debug(f"Expanding room distance matrix from {current_matrix_size}x{current_matrix_size} to {required_matrix_size}x{required_matrix_size}")
             
             # Create new larger distance matrix
             new_room_distances = []
@@ -1165,12 +1500,12 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         
         # Update the FTS data with rebuilt room references using namedtuple _replace
         # Note: This function needs to return the updated fts_data since namedtuples are immutable
-        print(f"DEBUG: Rebuilt room references for {len(new_room_data_list)} rooms (max room ID: {max_room_id})")
+        log.debug(f"Rebuilt room references for {len(new_room_data_list)} rooms (max room ID: {max_room_id})")
         return fts_data._replace(room_data=(new_room_data_list, room_distances))
     
     def _disablePortalSystem(self, fts_data):
         """Disable portal/room system to prevent engine fullbright fallback when geometry is modified"""
-        print("DEBUG: Disabling portal/room system due to geometry modifications")
+        log.debug("Disabling portal/room system due to geometry modifications")
         
         # Clear room data to disable room-based rendering
         empty_room_data = ([], [])  # Empty room list and distance matrix
@@ -1184,7 +1519,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             portals=empty_portals
         )
         
-        print("DEBUG: Portal system disabled - engine should use basic rendering with vertex lighting")
+        log.debug("Portal system disabled - engine should use basic rendering with vertex lighting")
         return fts_data
     
     def _rebuildPortalSystemFromBlender(self, fts_data, scene):
@@ -1200,10 +1535,10 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 break
         
         if not portals_collection:
-            print("DEBUG: No portals collection found - keeping original portals")
+            log.debug("No portals collection found - keeping original portals")
             return fts_data
         
-        print(f"DEBUG: Found portals collection '{portals_collection.name}' with {len(portals_collection.objects)} objects")
+        log.debug(f"Found portals collection '{portals_collection.name}' with {len(portals_collection.objects)} objects")
         
         # Convert Blender portal objects back to FTS format
         new_portals = []
@@ -1227,10 +1562,8 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                     vert_idx = face.vertices[i]
                     local_pos = mesh.vertices[vert_idx].co
                     world_pos = portal_obj.matrix_world @ local_pos
-                    # Convert back to Arx coordinates
-                    arx_pos = blender_pos_to_arx(world_pos)
-                    arx_pos = Vector(arx_pos) * 10.0  # Reverse 0.1 scale
-                    portal_vertices.append(arx_pos)
+                    # Convert back to Arx coordinates (0.1 scale reversal fused in)
+                    portal_vertices.append(Vector(_blender_pos_to_arx_scaled(world_pos)))
                 else:
                     # Pad with last vertex for triangles
                     portal_vertices.append(portal_vertices[-1] if portal_vertices else Vector((0,0,0)))
@@ -1243,7 +1576,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             room_2 = portal_obj.get('arx_room_2', 1)
             useportal = portal_obj.get('arx_useportal', 1)
             
-            print(f"DEBUG: Portal {len(new_portals)}: connects room {room_1} ↔ room {room_2}")
+            log.debug(f"Portal {len(new_portals)}: connects room {room_1} ↔ room {room_2}")
             
             # Create portal data as dictionary (compatible with FTS serializer)
             
@@ -1356,7 +1689,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             # Store as bytes for FTS serialization
             new_portals.append(bytes(portal_struct))
         
-        print(f"DEBUG: Rebuilt {len(new_portals)} portals from Blender scene")
+        log.debug(f"Rebuilt {len(new_portals)} portals from Blender scene")
         
         # Update FTS data with new portals
         return fts_data._replace(portals=new_portals)
@@ -1377,15 +1710,15 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         
         if anchors_collection:
             anchor_objects = [obj for obj in anchors_collection.objects if obj.type == 'MESH']
-            print(f"DEBUG: Found anchors collection '{anchors_collection.name}' with {len(anchor_objects)} anchor objects")
+            log.debug(f"Found anchors collection '{anchors_collection.name}' with {len(anchor_objects)} anchor objects")
         else:
             # Look for individual anchor objects in main collection
             anchor_objects = [obj for obj in scene.collection.objects if 'anchor' in obj.name.lower() and obj.type == 'MESH']
             if anchor_objects:
-                print(f"DEBUG: Found {len(anchor_objects)} anchor objects in main collection")
+                log.debug(f"Found {len(anchor_objects)} anchor objects in main collection")
         
         if not anchor_objects:
-            print("DEBUG: No anchor objects found - keeping original anchors")
+            log.debug("No anchor objects found - keeping original anchors")
             return fts_data
         
         # Read anchor positions and connections from mesh
@@ -1402,10 +1735,8 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             anchor_positions = []
             for vertex in mesh.vertices:
                 world_pos = anchor_obj.matrix_world @ vertex.co
-                # Convert back to Arx coordinates
-                arx_pos = blender_pos_to_arx(world_pos)
-                arx_pos = Vector(arx_pos) * 10.0  # Reverse 0.1 scale
-                anchor_positions.append((arx_pos.x, arx_pos.y, arx_pos.z))
+                # Convert back to Arx coordinates (0.1 scale reversal fused in)
+                anchor_positions.append(_blender_pos_to_arx_scaled(world_pos))
             
             # Build anchor connectivity from mesh edges
             anchor_links = [[] for _ in range(len(anchor_positions))]
@@ -1447,68 +1778,106 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 if not new_cell_anchors[z][x]:
                     new_cell_anchors[z][x] = None
         
-        print(f"DEBUG: Rebuilt {len(new_anchors)} anchors from Blender anchor mesh")
+        log.debug(f"Rebuilt {len(new_anchors)} anchors from Blender anchor mesh")
         
         # Update FTS data with new anchor network
         return fts_data._replace(anchors=new_anchors, cell_anchors=new_cell_anchors)
     
     def _assignRoomsToNewGeometry(self, fts_data):
         """Assign room IDs to new faces based on spatial connectivity"""
-        print("DEBUG: Assigning room IDs to new geometry based on spatial analysis")
+        log.debug("Assigning room IDs to new geometry based on spatial analysis")
         
         # This is a simplified approach - would need sophisticated spatial analysis
         # For now, assign room IDs based on proximity to existing geometry
         
-        faces_updated = 0
-        for face_data in self.converted_faces:
-            # If face has no room assignment (new geometry)
-            if face_data.get('room', 0) == 0:
+        # Precompute centers and room IDs of the existing geometry once so the
+        # per-face nearest search is a single numpy reduction instead of a
+        # Python loop over every other face
+        existing_centers, existing_rooms = self._buildRoomSearchArrays()
+
+        # Faces without a room assignment are new geometry
+        new_faces = [face_data for face_data in self.converted_faces
+                     if face_data.get('room', 0) == 0]
+
+        if new_faces and existing_centers is not None and nearest_rooms is not None:
+            # Numba path: batch all queries through one parallel kernel
+            new_centers = np.empty((len(new_faces), 3), dtype=np.float32)
+            for i, face_data in enumerate(new_faces):
+                vertices = face_data.get('vertices', [])
+                if vertices:
+                    center_x = center_y = center_z = 0.0
+                    for v in vertices:
+                        pos = v['pos']
+                        center_x += pos[0]
+                        center_y += pos[1]
+                        center_z += pos[2]
+                    count = len(vertices)
+                    new_centers[i, 0] = center_x / count
+                    new_centers[i, 1] = center_y / count
+                    new_centers[i, 2] = center_z / count
+                else:
+                    new_centers[i] = 0.0
+            assigned = nearest_rooms(new_centers, existing_centers, existing_rooms)
+            for face_data, room in zip(new_faces, assigned):
+                face_data['room'] = int(room) if face_data.get('vertices') else 1
+        else:
+            for face_data in new_faces:
                 # Simple heuristic: find nearest existing face with room assignment
-                new_room = self._findNearestRoom(face_data)
-                face_data['room'] = new_room
-                faces_updated += 1
-        
-        if faces_updated > 0:
-            print(f"DEBUG: Assigned room IDs to {faces_updated} new faces")
-        
+                face_data['room'] = self._findNearestRoom(face_data, existing_centers, existing_rooms)
+
+        if new_faces:
+            log.debug(f"Assigned room IDs to {len(new_faces)} new faces")
+
         return fts_data
-    
-    def _findNearestRoom(self, new_face):
-        """Find the most appropriate room ID for a new face"""
-        # Get center position of new face
-        vertices = new_face.get('vertices', [])
-        if not vertices:
-            return 1  # Default room
-            
-        # Calculate face center
-        center_x = sum(v['pos'][0] for v in vertices) / len(vertices)
-        center_y = sum(v['pos'][1] for v in vertices) / len(vertices) 
-        center_z = sum(v['pos'][2] for v in vertices) / len(vertices)
-        new_center = Vector((center_x, center_y, center_z))
-        
-        # Find closest existing face with room assignment
-        closest_room = 1
-        min_distance = float('inf')
-        
+
+    def _buildRoomSearchArrays(self):
+        """Gather centers and room IDs of faces that already have a room"""
+        centers = []
+        rooms = []
         for existing_face in self.converted_faces:
             existing_room = existing_face.get('room', 0)
             if existing_room <= 0:
                 continue
-                
-            # Calculate distance to existing face
             existing_vertices = existing_face.get('vertices', [])
-            if existing_vertices:
-                existing_center_x = sum(v['pos'][0] for v in existing_vertices) / len(existing_vertices)
-                existing_center_y = sum(v['pos'][1] for v in existing_vertices) / len(existing_vertices)
-                existing_center_z = sum(v['pos'][2] for v in existing_vertices) / len(existing_vertices)
-                existing_center = Vector((existing_center_x, existing_center_y, existing_center_z))
-                
-                distance = (new_center - existing_center).length
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_room = existing_room
-        
-        return closest_room
+            if not existing_vertices:
+                continue
+            center_x = center_y = center_z = 0.0
+            for v in existing_vertices:
+                pos = v['pos']
+                center_x += pos[0]
+                center_y += pos[1]
+                center_z += pos[2]
+            count = len(existing_vertices)
+            centers.append((center_x / count, center_y / count, center_z / count))
+            rooms.append(existing_room)
+
+        if not centers:
+            return None, None
+
+        return np.asarray(centers, dtype=np.float32), np.asarray(rooms, dtype=np.int32)
+
+    def _findNearestRoom(self, new_face, existing_centers, existing_rooms):
+        """Find the most appropriate room ID for a new face"""
+        # Get center position of new face
+        vertices = new_face.get('vertices', [])
+        if not vertices or existing_centers is None:
+            return 1  # Default room
+
+        # Calculate face center in one pass with plain float accumulators
+        center_x = center_y = center_z = 0.0
+        for v in vertices:
+            pos = v['pos']
+            center_x += pos[0]
+            center_y += pos[1]
+            center_z += pos[2]
+        count = len(vertices)
+        new_center = np.array([center_x / count, center_y / count, center_z / count],
+                              dtype=np.float32)
+
+        # Closest existing face with room assignment, by squared distance
+        diff = existing_centers - new_center
+        nearest = np.argmin(np.einsum('ij,ij->i', diff, diff))
+        return int(existing_rooms[nearest])
     
     def updateLlfFile(self, llf_path, converted_faces):
         """Update LLF file with new vertex lighting data using Cycles renderer"""
@@ -1516,7 +1885,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         from ctypes import sizeof
         import struct
         
-        print(f"DEBUG: Updating LLF file with Cycles lighting for {len(converted_faces)} faces")
+        log.debug(f"Updating LLF file with Cycles lighting for {len(converted_faces)} faces")
         
         # Read original LLF file
         addon = getAddon(bpy.context)
@@ -1531,36 +1900,71 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 break
         
         if not background_obj:
-            print("ERROR: Could not find background mesh for Cycles lighting")
+            log.error("Could not find background mesh for Cycles lighting")
             # Fall back to simple calculation
             return self._updateLlfFileSimple(llf_path, converted_faces, original_llf_data)
         
-        print(f"DEBUG: Using Cycles lighting calculation on mesh: {background_obj.name}")
+        log.debug(f"Using Cycles lighting calculation on mesh: {background_obj.name}")
         
         # Calculate vertex lighting using Cycles
         try:
             vertex_lighting_colors = self._calculateCyclesVertexLighting(converted_faces, background_obj, scene)
-            print(f"DEBUG: Cycles calculated {len(vertex_lighting_colors)} vertex colors")
-            
-            # Convert to SavedColorBGRA format for LLF
-            new_lighting_data = []
-            for color in vertex_lighting_colors:
-                bgra_color = SavedColorBGRA()
-                bgra_color.r = color[0]
-                bgra_color.g = color[1] 
-                bgra_color.b = color[2]
-                bgra_color.a = color[3]
-                new_lighting_data.append(bgra_color)
-            
+            log.debug(f"Cycles calculated {len(vertex_lighting_colors)} vertex colors")
+
+            # Reorder RGBA -> BGRA in one vectorized pass instead of building
+            # a SavedColorBGRA ctypes object per vertex
+            rgba = np.clip(np.asarray(vertex_lighting_colors), 0, 255).astype(np.uint8)
+            new_lighting_data = rgba[:, [2, 1, 0, 3]].tobytes()
+
         except Exception as e:
-            print(f"ERROR: Cycles lighting failed: {e}")
+            log.error(f"Cycles lighting failed: {e}")
             # Fall back to simple calculation
             return self._updateLlfFileSimple(llf_path, converted_faces, original_llf_data)
-        
+
         # Write updated LLF file
         self._writeLlfFile(llf_path, original_llf_data.lights, new_lighting_data)
-        print(f"DEBUG: Updated LLF with {len(new_lighting_data)} Cycles-calculated vertex colors")
+        log.debug(f"Updated LLF with {len(new_lighting_data) // 4} Cycles-calculated vertex colors")
     
+    def _waypointsToPathways(self, parent_obj, prefix, children=None):
+        """Convert child waypoint objects into DANAE_LS_PATHWAYS records
+
+        Waypoint locations are batch-converted to relative Arx coordinates
+        with one matrix product instead of per-child Vector math. Children
+        are local to the parent, so no scene offset applies. Callers that
+        already hold a parent -> children map pass the children in; the
+        obj.children fallback scans every scene object.
+        """
+        from .dataDlf import DANAE_LS_PATHWAYS
+
+        if children is None:
+            children = parent_obj.children
+        waypoint_objects = [child for child in children
+                            if child.name.startswith(prefix)]
+        # Sort by pathway index to maintain order
+        waypoint_objects.sort(key=lambda w: w.get("arx_pathway_index", 0))
+
+        if not waypoint_objects:
+            return []
+
+        locs = np.empty((len(waypoint_objects), 3), dtype=np.float32)
+        for i, child in enumerate(waypoint_objects):
+            locs[i] = child.location
+        arx_relative = locs @ _BLENDER_TO_ARX_PERM
+
+        pathways = []
+        for i, waypoint_obj in enumerate(waypoint_objects):
+            pathway = DANAE_LS_PATHWAYS()
+            pathway.rpos.x = arx_relative[i, 0]
+            pathway.rpos.y = arx_relative[i, 1]
+            pathway.rpos.z = arx_relative[i, 2]
+
+            # Get pathway properties from waypoint object
+            pathway.flag = waypoint_obj.get("arx_pathway_flag", 0)
+            pathway.time = waypoint_obj.get("arx_pathway_time", 0)
+            pathways.append(pathway)
+
+        return pathways
+
     def updateDlfFile(self, dlf_path, scene, area_id):
         """Update DLF file with entity data from Blender scene"""
         from .dataDlf import DANAE_LS_HEADER, DANAE_LS_INTER
@@ -1568,7 +1972,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         from mathutils import Vector, Euler
         import time
         
-        print(f"DEBUG: Updating DLF file for area {area_id}")
+        log.debug(f"Updating DLF file for area {area_id}")
         
         # Read original DLF file
         addon = getAddon(bpy.context)
@@ -1585,287 +1989,280 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 break
         
         if not entities_collection:
-            print("WARNING: No entities collection found in scene")
+            log.warning("No entities collection found in scene")
             return
         
-        # Convert Blender objects to DLF format
-        new_entities = []
-        new_lights = []
-        new_fogs = []
+        # Convert Blender objects to DLF format - entity/light/fog lists are
+        # preallocated from a prefix count further down; paths and zones stay
+        # append-based because a path's height decides which list it joins
         new_paths = []
         new_zones = []
-        
+
+        # Rotation conversion constants hoisted out of the entity loop - the
+        # z-correction inverse, the dummy position/scale arguments and the
+        # flip flags never change between entities
+        from .arx_io_animation import blender_to_arx_transform
+        z_correction_inverse = Quaternion((0, 0, 1), _NEG_HALF_PI)  # -90 degrees around Z
+        zero_vec = Vector((0, 0, 0))
+        one_vec = Vector((1, 1, 1))
+
+        def _blender_quat_to_arx_rot(blender_quat):
+            _, arx_rot, _ = blender_to_arx_transform(
+                zero_vec, z_correction_inverse @ blender_quat, one_vec, 0.1,
+                flip_w=True, flip_x=False, flip_y=True, flip_z=False
+            )
+            return arx_rot
+
+        # Gather all candidate objects once and batch-convert their locations:
+        # blender_pos_to_arx(pos / 0.1) - scene_offset collapses into a single
+        # matrix product over an (N, 3) array instead of per-object Vector math
+        dlf_objects = [obj for collection in scene.collection.children
+                       for obj in collection.objects]
+        if dlf_objects:
+            locations = np.empty((len(dlf_objects), 3), dtype=np.float32)
+            for i, obj in enumerate(dlf_objects):
+                locations[i] = obj.location
+            arx_positions = locations @ _BLENDER_TO_ARX_PERM - np.asarray(scene_offset, dtype=np.float32)
+
+        # Size the fixed-per-prefix outputs once instead of growing them by
+        # append; entities and lights can skip objects, so those lists are
+        # trimmed to their fill counts after the loop
+        prefix_counts = Counter(obj.name.partition(':')[0] for obj in dlf_objects)
+        new_entities = np.zeros(prefix_counts.get('e', 0), dtype=_DLF_INTER_DTYPE)
+        new_lights = [None] * prefix_counts.get('light', 0)
+        new_fogs = [None] * prefix_counts.get('fog', 0)
+        entity_count = light_count = fog_count = 0
+
+        # obj.children scans every scene object per lookup, so build one
+        # parent -> children map up front instead of paying that scan for
+        # every path and zone parent
+        children_by_parent = {}
+        for scene_obj in scene.objects:
+            if scene_obj.parent is not None:
+                children_by_parent.setdefault(scene_obj.parent, []).append(scene_obj)
+
+        # Per-prefix conversion handlers - one dict lookup on the name
+        # prefix replaces the chain of startswith() scans per object
+        def _convert_entity(obj, arx_pos):
+            nonlocal entity_count
+
+            # Regular entity objects
+            entity_name = obj.get("arx_entity_name", "")
+            entity_ident = obj.get("arx_entity_ident", 0)
+            entity_flags = obj.get("arx_entity_flags", 0)
+
+            # Skip entities with invalid or empty names
+            if not entity_name or not entity_name.strip():
+                log.debug(f"Skipping entity {obj.name} with empty name")
+                return
+
+            entity = new_entities[entity_count]
+            # numpy zero-pads the S512 field, keeping the null terminator
+            entity['name'] = entity_name.encode('iso-8859-1', errors='replace')[:511]
+
+            # Properly reverse the import transformation:
+            # Import: proxyObject.location = arx_pos_to_blender_for_model(sceneOffset + arx_pos) * 0.1
+            # Export: arx_pos = (blender_pos / 0.1) reverse_transform - sceneOffset
+            entity['pos'] = arx_pos
+
+            # Properly reverse the rotation transformation using the correct inverse
+            if obj.rotation_mode == 'QUATERNION':
+                blender_quat = obj.rotation_quaternion.copy()
+            else:
+                blender_quat = obj.rotation_euler.to_quaternion()
+
+            # Reverse the import rotation and convert back to Arx
+            # Euler angles (a=pitch, b=yaw, g=roll) - through the
+            # compiled scalar kernel when numba is available
+            if quat_to_arx_euler_deg is not None:
+                entity['angle'] = quat_to_arx_euler_deg(
+                    blender_quat.w, blender_quat.x, blender_quat.y, blender_quat.z)
+            else:
+                arx_rot = _blender_quat_to_arx_rot(blender_quat)
+                euler = arx_rot.to_euler('XYZ')
+                # pitch, yaw, roll
+                entity['angle'] = (euler.x * _DEG_PER_RAD, euler.y * _DEG_PER_RAD, euler.z * _DEG_PER_RAD)
+            entity['ident'] = entity_ident
+            entity['flags'] = entity_flags
+
+            entity_count += 1
+
+        def _convert_path(obj, arx_pos):
+            # Convert path objects to DANAE_LS_PATH + DANAE_LS_PATHWAYS
+            from .dataDlf import DANAE_LS_PATH, DANAE_LS_PATHWAYS
+
+            path = DANAE_LS_PATH()
+            path_name = obj.name[5:]  # Remove 'path:' prefix
+            path.name = path_name.encode('iso-8859-1', errors='replace')[:63].ljust(64, b'\x00')
+
+            path.idx = obj.get("arx_path_idx", 0)
+            path.flags = obj.get("arx_path_flags", 0)
+            path.height = obj.get("arx_path_height", 0)
+
+            ambiance = obj.get("arx_path_ambiance", "")
+            path.ambiance = ambiance.encode('iso-8859-1', errors='replace')[:127].ljust(128, b'\x00')
+
+            path.reverb = obj.get("arx_path_reverb", 0.0)
+            path.farclip = obj.get("arx_path_farclip", 0.0)
+            path.amb_max_vol = obj.get("arx_path_amb_max_vol", 0.0)
+
+            # Convert path object position (same transformation as entities)
+            log.debug(f"Path '{path_name}' export: blender_pos={obj.location}, arx_pos={arx_pos}")
+            path.pos.x = arx_pos[0]
+            path.pos.y = arx_pos[1]
+            path.pos.z = arx_pos[2]
+            path.initpos.x = arx_pos[0]  # Same as pos
+            path.initpos.y = arx_pos[1]
+            path.initpos.z = arx_pos[2]
+
+            # Find child waypoint objects and convert to pathways
+            pathways = self._waypointsToPathways(obj, 'waypoint:',
+                                                 children_by_parent.get(obj, ()))
+            path.nb_pathways = len(pathways)
+
+            if path.height != 0:
+                new_zones.append((path, pathways))
+            else:
+                new_paths.append((path, pathways))
+
+        def _convert_zone(obj, arx_pos):
+            # Convert zone objects to DANAE_LS_PATH (with height != 0)
+            from .dataDlf import DANAE_LS_PATH, DANAE_LS_PATHWAYS
+
+            zone = DANAE_LS_PATH()
+            zone_name = obj.name[5:]  # Remove 'zone:' prefix
+            zone.name = zone_name.encode('iso-8859-1', errors='replace')[:63].ljust(64, b'\x00')
+
+            zone.idx = obj.get("arx_zone_idx", 0)
+            zone.flags = obj.get("arx_zone_flags", 0)
+            zone.height = obj.get("arx_zone_height", 1)  # Zones must have height != 0
+
+            ambiance = obj.get("arx_zone_ambiance", "")
+            zone.ambiance = ambiance.encode('iso-8859-1', errors='replace')[:127].ljust(128, b'\x00')
+            log.debug(f"Zone '{zone_name}' ambiance: '{ambiance}'")
+
+            zone.reverb = obj.get("arx_zone_reverb", 0.0)
+            zone.farclip = obj.get("arx_zone_farclip", 0.0)
+            zone.amb_max_vol = obj.get("arx_zone_amb_max_vol", 0.0)
+
+            # Convert position (same transformation as entities)
+            zone.pos.x = arx_pos[0]
+            zone.pos.y = arx_pos[1]
+            zone.pos.z = arx_pos[2]
+            zone.initpos.x = arx_pos[0]  # Same as pos
+            zone.initpos.y = arx_pos[1]
+            zone.initpos.z = arx_pos[2]
+
+            # Find child zone waypoint objects and convert to pathways
+            zone_pathways = self._waypointsToPathways(obj, 'zone_waypoint:',
+                                                      children_by_parent.get(obj, ()))
+            zone.nb_pathways = len(zone_pathways)
+            new_zones.append((zone, zone_pathways))
+
+        def _convert_fog(obj, arx_pos):
+            nonlocal fog_count
+
+            # Convert fog objects to DANAE_LS_FOG
+            from .dataDlf import DANAE_LS_FOG
+
+            fog = DANAE_LS_FOG()
+
+            # Convert position (same transformation as entities)
+            fog.pos.x = arx_pos[0]
+            fog.pos.y = arx_pos[1]
+            fog.pos.z = arx_pos[2]
+
+            # Convert rotation
+            if obj.rotation_mode == 'QUATERNION':
+                euler = obj.rotation_quaternion.to_euler('XYZ')
+            else:
+                euler = obj.rotation_euler
+
+            fog.angle.a = euler.x * _DEG_PER_RAD
+            fog.angle.b = euler.z * _DEG_PER_RAD
+            fog.angle.g = euler.y * _DEG_PER_RAD
+
+            # Convert properties from custom properties
+            fog.size = obj.get("arx_fog_size", 100.0)
+            fog.special = obj.get("arx_fog_special", 0)
+            fog.scale = obj.get("arx_fog_scale", 1.0)
+            fog.speed = obj.get("arx_fog_speed", 0.0)
+            fog.rotatespeed = obj.get("arx_fog_rotatespeed", 0.0)
+            fog.tolive = obj.get("arx_fog_tolive", 0)
+            fog.blend = obj.get("arx_fog_blend", 0)
+            fog.frequency = obj.get("arx_fog_frequency", 0.0)
+
+            # Convert color from object color
+            if hasattr(obj, 'color'):
+                fog.rgb.r = int(obj.color[0] * 255)
+                fog.rgb.g = int(obj.color[1] * 255)
+                fog.rgb.b = int(obj.color[2] * 255)
+            else:
+                fog.rgb.r = 255
+                fog.rgb.g = 255
+                fog.rgb.b = 255
+
+            new_fogs[fog_count] = fog
+            fog_count += 1
+
+        def _convert_light(obj, arx_pos):
+            nonlocal light_count
+
+            if obj.type != 'LIGHT':
+                return
+
+            # Convert DLF light objects to DANAE_LS_LIGHT
+            from .dataDlf import DANAE_LS_LIGHT
+
+            light = DANAE_LS_LIGHT()
+
+            # Convert position (same transformation as entities)
+            light.pos.x = arx_pos[0]
+            light.pos.y = arx_pos[1]
+            light.pos.z = arx_pos[2]
+
+            # Convert light properties
+            if obj.data:
+                light.intensity = obj.data.energy / 100.0
+                light.fallend = obj.data.distance / 0.1 if obj.data.distance > 0 else 1000.0
+
+                # Convert color
+                color = obj.data.color
+                light.rgb.r = int(color[0] * 255)
+                light.rgb.g = int(color[1] * 255)
+                light.rgb.b = int(color[2] * 255)
+
+            # Get additional properties from custom properties
+            light.fallstart = obj.get("arx_light_fallstart", 10.0)
+            light.fallend = obj.get("arx_light_fallend", light.fallend)
+            light.intensity = obj.get("arx_light_intensity", light.intensity)
+            light.extras = obj.get("arx_light_extras", 0)
+
+            new_lights[light_count] = light
+            light_count += 1
+
+        converters = {
+            'e': _convert_entity,
+            'path': _convert_path,
+            'zone': _convert_zone,
+            'fog': _convert_fog,
+            'light': _convert_light,
+        }
+
         # Process all objects in scene to gather different DLF components
-        for collection in scene.collection.children:
-            if not collection.objects:
-                continue
-                
-            for obj in collection.objects:
-                if obj.name.startswith('e:'):
-                    # Regular entity objects
-                    entity_name = obj.get("arx_entity_name", "")
-                    entity_ident = obj.get("arx_entity_ident", 0)
-                    entity_flags = obj.get("arx_entity_flags", 0)
-                    
-                    # Skip entities with invalid or empty names
-                    if not entity_name or not entity_name.strip():
-                        print(f"DEBUG: Skipping entity {obj.name} with empty name")
-                        continue
-                    
-                    entity = DANAE_LS_INTER()
-                    # Ensure entity name is properly null-terminated
-                    name_bytes = entity_name.encode('iso-8859-1', errors='replace')[:511]
-                    entity.name = name_bytes + b'\x00' * (512 - len(name_bytes))
-                    
-                    # Properly reverse the import transformation:
-                    # Import: proxyObject.location = arx_pos_to_blender_for_model(sceneOffset + arx_pos) * 0.1
-                    # Export: arx_pos = (blender_pos / 0.1) reverse_transform - sceneOffset
-                    blender_pos = obj.location
-                    arx_pos = Vector(blender_pos_to_arx(blender_pos / 0.1)) - Vector(scene_offset)
-                    entity.pos.x = arx_pos.x
-                    entity.pos.y = arx_pos.y 
-                    entity.pos.z = arx_pos.z
-                    
-                    # Properly reverse the rotation transformation using the correct inverse
-                    if obj.rotation_mode == 'QUATERNION':
-                        blender_quat = obj.rotation_quaternion.copy()
-                    else:
-                        blender_quat = obj.rotation_euler.to_quaternion()
-                    
-                    # First, reverse the Z correction applied during import
-                    z_correction_inverse = Quaternion((0, 0, 1), -math.radians(90))  # -90 degrees around Z
-                    corrected_quat = z_correction_inverse @ blender_quat
-                    
-                    # Now use blender_to_arx_transform to properly reverse the transformation
-                    from .arx_io_animation import blender_to_arx_transform
-                    _, arx_rot, _ = blender_to_arx_transform(
-                        Vector((0, 0, 0)), corrected_quat, Vector((1, 1, 1)), 0.1,
-                        flip_w=True, flip_x=False, flip_y=True, flip_z=False
-                    )
-                    
-                    # Convert quaternion back to Arx Euler angles (a=pitch, b=yaw, g=roll)
-                    euler = arx_rot.to_euler('XYZ')
-                    entity.angle.a = math.degrees(euler.x)  # pitch
-                    entity.angle.b = math.degrees(euler.y)  # yaw  
-                    entity.angle.g = math.degrees(euler.z)  # roll
-                    entity.ident = entity_ident
-                    entity.flags = entity_flags
-                    
-                    new_entities.append(entity)
-                    
-                elif obj.name.startswith('path:'):
-                    # Convert path objects to DANAE_LS_PATH + DANAE_LS_PATHWAYS
-                    from .dataDlf import DANAE_LS_PATH, DANAE_LS_PATHWAYS
-                    
-                    path = DANAE_LS_PATH()
-                    path_name = obj.name[5:]  # Remove 'path:' prefix
-                    name_bytes = path_name.encode('iso-8859-1', errors='replace')[:63]
-                    path.name = name_bytes + b'\x00' * (64 - len(name_bytes))
-                    
-                    path.idx = obj.get("arx_path_idx", 0)
-                    path.flags = obj.get("arx_path_flags", 0)
-                    path.height = obj.get("arx_path_height", 0)
-                    
-                    ambiance = obj.get("arx_path_ambiance", "")
-                    ambiance_bytes = ambiance.encode('iso-8859-1', errors='replace')[:127]
-                    path.ambiance = ambiance_bytes + b'\x00' * (128 - len(ambiance_bytes))
-                    
-                    path.reverb = obj.get("arx_path_reverb", 0.0)
-                    path.farclip = obj.get("arx_path_farclip", 0.0)
-                    path.amb_max_vol = obj.get("arx_path_amb_max_vol", 0.0)
-                    
-                    # Convert path object position (same transformation as entities)
-                    blender_pos = obj.location
-                    arx_pos = Vector(blender_pos_to_arx(blender_pos / 0.1)) - Vector(scene_offset)
-                    print(f"DEBUG: Path '{path_name}' export: blender_pos={blender_pos}, arx_pos={arx_pos}")
-                    path.pos.x = arx_pos.x
-                    path.pos.y = arx_pos.y
-                    path.pos.z = arx_pos.z
-                    path.initpos.x = arx_pos.x  # Same as pos
-                    path.initpos.y = arx_pos.y
-                    path.initpos.z = arx_pos.z
-                    
-                    # Find child waypoint objects and convert to pathways
-                    pathways = []
-                    waypoint_objects = []
-                    
-                    # Collect waypoint children
-                    for child in obj.children:
-                        if child.name.startswith('waypoint:'):
-                            waypoint_objects.append(child)
-                    
-                    # Sort by pathway index to maintain order
-                    waypoint_objects.sort(key=lambda w: w.get("arx_pathway_index", 0))
-                    
-                    for waypoint_obj in waypoint_objects:
-                        pathway = DANAE_LS_PATHWAYS()
-                        
-                        # Convert waypoint position to relative Arx coordinates
-                        # Since waypoint_obj is a child of path obj, waypoint_obj.location is already in local coordinates
-                        # Just convert the local position to Arx coordinates
-                        arx_relative_pos = Vector(blender_pos_to_arx(waypoint_obj.location / 0.1))
-                        print(f"DEBUG: Waypoint '{waypoint_obj.name}' export: blender_local={waypoint_obj.location}, arx_relative={arx_relative_pos}")
-                        
-                        pathway.rpos.x = arx_relative_pos.x
-                        pathway.rpos.y = arx_relative_pos.y
-                        pathway.rpos.z = arx_relative_pos.z
-                        
-                        # Get pathway properties from waypoint object
-                        pathway.flag = waypoint_obj.get("arx_pathway_flag", 0)
-                        pathway.time = waypoint_obj.get("arx_pathway_time", 0)
-                        
-                        pathways.append(pathway)
-                    
-                    path.nb_pathways = len(pathways)
-                    
-                    if path.height != 0:
-                        new_zones.append((path, pathways))
-                    else:
-                        new_paths.append((path, pathways))
-                    
-                elif obj.name.startswith('zone:'):
-                    # Convert zone objects to DANAE_LS_PATH (with height != 0)
-                    from .dataDlf import DANAE_LS_PATH, DANAE_LS_PATHWAYS
-                    
-                    zone = DANAE_LS_PATH()
-                    zone_name = obj.name[5:]  # Remove 'zone:' prefix
-                    name_bytes = zone_name.encode('iso-8859-1', errors='replace')[:63]
-                    zone.name = name_bytes + b'\x00' * (64 - len(name_bytes))
-                    
-                    zone.idx = obj.get("arx_zone_idx", 0)
-                    zone.flags = obj.get("arx_zone_flags", 0)
-                    zone.height = obj.get("arx_zone_height", 1)  # Zones must have height != 0
-                    
-                    ambiance = obj.get("arx_zone_ambiance", "")
-                    ambiance_bytes = ambiance.encode('iso-8859-1', errors='replace')[:127]
-                    zone.ambiance = ambiance_bytes + b'\x00' * (128 - len(ambiance_bytes))
-                    print(f"DEBUG: Zone '{zone_name}' ambiance: '{ambiance}'")
-                    
-                    zone.reverb = obj.get("arx_zone_reverb", 0.0)
-                    zone.farclip = obj.get("arx_zone_farclip", 0.0)
-                    zone.amb_max_vol = obj.get("arx_zone_amb_max_vol", 0.0)
-                    
-                    # Convert position (same transformation as entities)
-                    blender_pos = obj.location
-                    arx_pos = Vector(blender_pos_to_arx(blender_pos / 0.1)) - Vector(scene_offset)
-                    zone.pos.x = arx_pos.x
-                    zone.pos.y = arx_pos.y
-                    zone.pos.z = arx_pos.z
-                    zone.initpos.x = arx_pos.x  # Same as pos
-                    zone.initpos.y = arx_pos.y
-                    zone.initpos.z = arx_pos.z
-                    
-                    # Find child zone waypoint objects and convert to pathways
-                    zone_pathways = []
-                    zone_waypoint_objects = []
-                    
-                    # Collect zone waypoint children
-                    for child in obj.children:
-                        if child.name.startswith('zone_waypoint:'):
-                            zone_waypoint_objects.append(child)
-                    
-                    # Sort by pathway index to maintain order
-                    zone_waypoint_objects.sort(key=lambda w: w.get("arx_pathway_index", 0))
-                    
-                    for waypoint_obj in zone_waypoint_objects:
-                        pathway = DANAE_LS_PATHWAYS()
-                        
-                        # Convert waypoint position to relative Arx coordinates
-                        # Since waypoint_obj is a child of zone obj, waypoint_obj.location is already in local coordinates
-                        # Just convert the local position to Arx coordinates
-                        arx_relative_pos = Vector(blender_pos_to_arx(waypoint_obj.location / 0.1))
-                        
-                        pathway.rpos.x = arx_relative_pos.x
-                        pathway.rpos.y = arx_relative_pos.y
-                        pathway.rpos.z = arx_relative_pos.z
-                        
-                        # Get pathway properties from waypoint object
-                        pathway.flag = waypoint_obj.get("arx_pathway_flag", 0)
-                        pathway.time = waypoint_obj.get("arx_pathway_time", 0)
-                        
-                        zone_pathways.append(pathway)
-                    
-                    zone.nb_pathways = len(zone_pathways)
-                    new_zones.append((zone, zone_pathways))
-                    
-                elif obj.name.startswith('fog:'):
-                    # Convert fog objects to DANAE_LS_FOG
-                    from .dataDlf import DANAE_LS_FOG
-                    
-                    fog = DANAE_LS_FOG()
-                    
-                    # Convert position (same transformation as entities)
-                    blender_pos = obj.location
-                    arx_pos = Vector(blender_pos_to_arx(blender_pos / 0.1)) - Vector(scene_offset)
-                    fog.pos.x = arx_pos.x
-                    fog.pos.y = arx_pos.y
-                    fog.pos.z = arx_pos.z
-                    
-                    # Convert rotation
-                    if obj.rotation_mode == 'QUATERNION':
-                        euler = obj.rotation_quaternion.to_euler('XYZ')
-                    else:
-                        euler = obj.rotation_euler
-                    
-                    fog.angle.a = math.degrees(euler.x)
-                    fog.angle.b = math.degrees(euler.z)
-                    fog.angle.g = math.degrees(euler.y)
-                    
-                    # Convert properties from custom properties
-                    fog.size = obj.get("arx_fog_size", 100.0)
-                    fog.special = obj.get("arx_fog_special", 0)
-                    fog.scale = obj.get("arx_fog_scale", 1.0)
-                    fog.speed = obj.get("arx_fog_speed", 0.0)
-                    fog.rotatespeed = obj.get("arx_fog_rotatespeed", 0.0)
-                    fog.tolive = obj.get("arx_fog_tolive", 0)
-                    fog.blend = obj.get("arx_fog_blend", 0)
-                    fog.frequency = obj.get("arx_fog_frequency", 0.0)
-                    
-                    # Convert color from object color
-                    if hasattr(obj, 'color'):
-                        fog.rgb.r = int(obj.color[0] * 255)
-                        fog.rgb.g = int(obj.color[1] * 255)
-                        fog.rgb.b = int(obj.color[2] * 255)
-                    else:
-                        fog.rgb.r = 255
-                        fog.rgb.g = 255
-                        fog.rgb.b = 255
-                    
-                    new_fogs.append(fog)
-                    
-                elif obj.name.startswith('light:') and obj.type == 'LIGHT':
-                    # Convert DLF light objects to DANAE_LS_LIGHT
-                    from .dataDlf import DANAE_LS_LIGHT
-                    
-                    light = DANAE_LS_LIGHT()
-                    
-                    # Convert position (same transformation as entities)
-                    blender_pos = obj.location
-                    arx_pos = Vector(blender_pos_to_arx(blender_pos / 0.1)) - Vector(scene_offset)
-                    light.pos.x = arx_pos.x
-                    light.pos.y = arx_pos.y
-                    light.pos.z = arx_pos.z
-                    
-                    # Convert light properties
-                    if obj.data:
-                        light.intensity = obj.data.energy / 100.0
-                        light.fallend = obj.data.distance / 0.1 if obj.data.distance > 0 else 1000.0
-                        
-                        # Convert color
-                        color = obj.data.color
-                        light.rgb.r = int(color[0] * 255)
-                        light.rgb.g = int(color[1] * 255) 
-                        light.rgb.b = int(color[2] * 255)
-                    
-                    # Get additional properties from custom properties
-                    light.fallstart = obj.get("arx_light_fallstart", 10.0)
-                    light.fallend = obj.get("arx_light_fallend", light.fallend)
-                    light.intensity = obj.get("arx_light_intensity", light.intensity)
-                    light.extras = obj.get("arx_light_extras", 0)
-                    
-                    new_lights.append(light)
-        
-        print(f"DEBUG: Converted {len(new_entities)} entities, {len(new_lights)} lights, {len(new_fogs)} fogs, {len(new_paths)} paths, {len(new_zones)} zones from Blender scene")
+        for obj_index, obj in enumerate(dlf_objects):
+            prefix, sep, _ = obj.name.partition(':')
+            if sep:
+                converter = converters.get(prefix)
+                if converter is not None:
+                    converter(obj, arx_positions[obj_index])
+
+        # Drop unused slots left by skipped entities and non-LIGHT objects
+        new_entities = new_entities[:entity_count]
+        del new_lights[light_count:]
+        del new_fogs[fog_count:]
+
+        log.debug(f"Converted {len(new_entities)} entities, {len(new_lights)} lights, {len(new_fogs)} fogs, {len(new_paths)} paths, {len(new_zones)} zones from Blender scene")
         
         # Write updated DLF file
         self._writeDlfFile(dlf_path, original_dlf_data, new_entities, new_lights, new_fogs, new_paths, new_zones)
@@ -1879,7 +2276,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         header = DANAE_LS_HEADER()
         header.version = 1.44  # Use same version as originals
         header.ident = b"DANAE_FILE\x00\x00\x00\x00\x00\x00"
-        header.lastuser = b"Blender Export\x00" + b"\x00" * (256 - 15)
+        header.lastuser = b"Blender Export\x00".ljust(256, b"\x00")
         header.time = int(time.time())
         
         # Copy most settings from original, then update counts to match what we're actually writing
@@ -1903,74 +2300,84 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         header.nb_fogs = len(new_fogs)
         header.nb_paths = len(new_paths) + len(new_zones)  # Zones are stored as paths with height != 0
         
-        # Build DLF payload data (everything except the main header)
-        payload_data = bytearray()
-        
+        # Collect DLF payload parts (everything except the main header) in
+        # file order - ctypes structs and raw byte blocks are copied into one
+        # preallocated buffer below instead of bytes()-copied one at a time
+        payload_parts = []
+
         # Add scene data (required by DLF format) - this is the level directory path
         if hasattr(original_dlf_data, 'scene') and original_dlf_data.scene:
-            payload_data.extend(bytes(original_dlf_data.scene))
+            payload_parts.append(original_dlf_data.scene)
             scene_dir = original_dlf_data.scene.name.decode('iso-8859-1').strip('\x00')
-            print(f"DEBUG: Added preserved scene directory: '{scene_dir}'")
+            log.debug(f"Added preserved scene directory: '{scene_dir}'")
         else:
             # Create scene data with correct level directory path
             from .dataDlf import DANAE_LS_SCENE
             scene_data = DANAE_LS_SCENE()
-            
+
             # Use the same directory format as original: Graph\Levels\Level1\
             scene_dir = b"Graph\\Levels\\Level1\\"
             # Pad to 512 bytes with null bytes
-            scene_data.name = scene_dir + b'\x00' * (512 - len(scene_dir))
-            
-            payload_data.extend(bytes(scene_data))
-            print(f"DEBUG: Added level directory: 'Graph\\Levels\\Level1\\'")
-        
-        # Add entity data from Blender scene
-        for entity in new_entities:
-            payload_data.extend(bytes(entity))
-        
+            scene_data.name = scene_dir.ljust(512, b'\x00')
+
+            payload_parts.append(scene_data)
+            log.debug(f"Added level directory: 'Graph\\Levels\\Level1\\'")
+
+        # Add entity data from Blender scene - one structured-array block
+        payload_parts.append(new_entities.tobytes())
+
         # Add lighting data (copy from original if available)
         if hasattr(original_dlf_data, 'lighting_data') and original_dlf_data.lighting_data:
-            payload_data.extend(original_dlf_data.lighting_data)
-            print(f"DEBUG: Added {len(original_dlf_data.lighting_data)} bytes of lighting data")
-        
-        # Add lights from Blender scene 
-        for light in new_lights:
-            payload_data.extend(bytes(light))
-        
+            payload_parts.append(original_dlf_data.lighting_data)
+            log.debug(f"Added {len(original_dlf_data.lighting_data)} bytes of lighting data")
+
+        # Add lights from Blender scene
+        payload_parts.extend(new_lights)
+
         # Add fogs from Blender scene
-        for fog in new_fogs:
-            payload_data.extend(bytes(fog))
-        
+        payload_parts.extend(new_fogs)
+
         # Add nodes data (preserve original for now since zones are handled as paths)
         if hasattr(original_dlf_data, 'nodes_data') and original_dlf_data.nodes_data:
-            payload_data.extend(original_dlf_data.nodes_data)
-        
+            payload_parts.append(original_dlf_data.nodes_data)
+
         # Add paths and zones from Blender scene (zones are paths with height != 0)
         for path_data, pathways in new_paths:
-            payload_data.extend(bytes(path_data))
-            for pathway in pathways:
-                payload_data.extend(bytes(pathway))
-        
+            payload_parts.append(path_data)
+            payload_parts.extend(pathways)
+
         for zone_data, pathways in new_zones:
-            payload_data.extend(bytes(zone_data))
-            for pathway in pathways:
-                payload_data.extend(bytes(pathway))
-        
+            payload_parts.append(zone_data)
+            payload_parts.extend(pathways)
+
+        # Assemble the payload with memmove into one buffer sized up front,
+        # skipping the intermediate bytes() allocation per struct
+        import ctypes
+        part_sizes = [len(part) if isinstance(part, (bytes, bytearray)) else ctypes.sizeof(part)
+                      for part in payload_parts]
+        payload = (ctypes.c_ubyte * sum(part_sizes))()
+        base_address = ctypes.addressof(payload)
+        offset = 0
+        for part, size in zip(payload_parts, part_sizes):
+            if isinstance(part, (bytes, bytearray)):
+                ctypes.memmove(base_address + offset, bytes(part), size)
+            else:
+                ctypes.memmove(base_address + offset, ctypes.addressof(part), size)
+            offset += size
+
         # Compress payload data using PKWare format
-        compressed_data = self._encode_pkware_dlf(payload_data)
+        compressed_data = self._encode_pkware_dlf(memoryview(payload))
         
         # Write DLF file: header + compressed payload
         with open(dlf_path, 'wb') as f:
             f.write(bytes(header))  # Header is uncompressed
             f.write(compressed_data)  # Payload is compressed
         
-        print(f"DEBUG: Wrote DLF file with {len(new_entities)} entities, {len(new_lights)} lights, {len(new_fogs)} fogs, {len(new_paths)} paths, {len(new_zones)} zones to {dlf_path}")
+        log.debug(f"Wrote DLF file with {len(new_entities)} entities, {len(new_lights)} lights, {len(new_fogs)} fogs, {len(new_paths)} paths, {len(new_zones)} zones to {dlf_path}")
     
     def _updateLlfFileSimple(self, llf_path, converted_faces, original_llf_data):
         """Fallback LLF update using simple lighting calculation"""
-        from .dataLlf import SavedColorBGRA
-        
-        print(f"DEBUG: Using fallback lighting for {len(converted_faces)} faces")
+        log.debug(f"Using fallback lighting for {len(converted_faces)} faces")
         
         # Calculate vertex count using FTS traversal order (matches engine countVertices)
         total_vertices = 0
@@ -1980,117 +2387,138 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             face_vertex_count = 4 if is_quad else 3
             total_vertices += face_vertex_count
         
-        print(f"DEBUG: Regenerating lighting data for {total_vertices} vertices (FTS traversal order)")
+        log.debug(f"Regenerating lighting data for {total_vertices} vertices (FTS traversal order)")
         
-        # Build new vertex lighting array matching exact FTS vertex order
-        new_lighting_data = []
+        # Gather vertex positions and per-face normals in exact FTS vertex
+        # order, then light all vertices in one batched call instead of a
+        # Python call per vertex
+        positions = np.empty((total_vertices, 3), dtype=np.float32)
+        normals = np.empty((total_vertices, 3), dtype=np.float32)
         vertex_index = 0
-        
+
         for face_data in converted_faces:
             # Get face properties for lighting calculation
             if 'norm' in face_data and isinstance(face_data['norm'], dict):
                 norm = face_data['norm']
-                face_normal = Vector((float(norm['x']), float(norm['y']), float(norm['z'])))
+                face_normal = (float(norm['x']), float(norm['y']), float(norm['z']))
             else:
-                face_normal = Vector((0, 1, 0))  # Default upward
-            
+                face_normal = (0.0, 1.0, 0.0)  # Default upward
+
             # Process vertices in FTS order (quad=4 verts, triangle=3 verts)
             vertices = face_data.get('vertices', [])
             is_quad = face_data.get('is_quad', False)
             face_vertex_count = 4 if is_quad else 3
-            
+
             for i in range(face_vertex_count):
                 if i < len(vertices):
-                    pos = vertices[i]['pos']
-                    vertex_pos = Vector((float(pos[0]), float(pos[1]), float(pos[2])))
-                else:
-                    # For triangles stored as quads, 4th vertex duplicates the last one
-                    if vertices:
-                        pos = vertices[-1]['pos']
-                        vertex_pos = Vector((float(pos[0]), float(pos[1]), float(pos[2])))
-                    else:
-                        vertex_pos = Vector((0.0, 0.0, 0.0))
-                
-                # Calculate lighting for this vertex
-                vertex_color = self._calculateVertexLighting(vertex_pos, face_normal)
-                
-                # Convert to SavedColorBGRA format (BGRA order)
-                bgra_color = SavedColorBGRA()
-                bgra_color.b = vertex_color[2]  # Blue
-                bgra_color.g = vertex_color[1]  # Green  
-                bgra_color.r = vertex_color[0]  # Red
-                bgra_color.a = vertex_color[3]  # Alpha
-                
-                new_lighting_data.append(bgra_color)
+                    pos = vertices[i]['pos']
+                elif vertices:
+                    # For triangles stored as quads, 4th vertex duplicates the last one
+                    pos = vertices[-1]['pos']
+                else:
+                    pos = (0.0, 0.0, 0.0)
+                positions[vertex_index] = (float(pos[0]), float(pos[1]), float(pos[2]))
+                normals[vertex_index] = face_normal
                 vertex_index += 1
-        
-        print(f"DEBUG: Generated {len(new_lighting_data)} vertex colors")
-        
+
+        rgba_colors = self._calculateVertexLightingBatch(positions, normals)
+
+        # Reorder RGBA -> BGRA and serialize in a single vectorized pass
+        new_lighting_data = rgba_colors[:, [2, 1, 0, 3]].tobytes()
+        log.debug(f"Generated {total_vertices} vertex colors")
+
         # Write updated LLF file
         self._writeLlfFile(llf_path, original_llf_data.lights, new_lighting_data)
     
     def _writeLlfFile(self, llf_path, lights, vertex_lighting):
-        """Write LLF file with updated lighting data using PKWare compression"""
-        from .dataLlf import DANAE_LLF_HEADER, DANAE_LS_LIGHTINGHEADER, SavedColorBGRA
+        """Write LLF file with updated lighting data using PKWare compression
+
+        vertex_lighting is either the raw BGRA lighting block as bytes
+        (4 bytes per vertex) or a legacy list of per-vertex colors.
+        """
+        from .dataLlf import DANAE_LLF_HEADER, DANAE_LS_LIGHTINGHEADER
         from ctypes import sizeof
         import time
-        
+
+        if isinstance(vertex_lighting, (bytes, bytearray, memoryview)):
+            lighting_block = bytes(vertex_lighting)
+        elif vertex_lighting and not isinstance(vertex_lighting[0], (tuple, list)):
+            # Already SavedColorBGRA structures - copy them into one ctypes
+            # array and serialize it whole instead of rebuilding each color
+            from .dataLlf import SavedColorBGRA
+            bgra_array = (SavedColorBGRA * len(vertex_lighting))(*vertex_lighting)
+            lighting_block = bytes(bgra_array)
+        else:
+            # Legacy path: pack per-vertex colors through a structured BGRA
+            # dtype and serialize the whole block in one tobytes() call
+            colors = np.zeros(len(vertex_lighting),
+                              dtype=[('b', 'u1'), ('g', 'u1'), ('r', 'u1'), ('a', 'u1')])
+            for i, vertex_color in enumerate(vertex_lighting):
+                if isinstance(vertex_color, (tuple, list)) and len(vertex_color) >= 3:
+                    r, g, b = vertex_color[:3]
+                    a = vertex_color[3] if len(vertex_color) > 3 else 255
+                    colors[i] = (max(0, min(255, int(b))), max(0, min(255, int(g))),
+                                 max(0, min(255, int(r))), max(0, min(255, int(a))))
+                else:
+                    # Fallback: vertex_color is already a BGRA structure
+                    colors[i] = tuple(bytes(vertex_color)[:4])
+            lighting_block = colors.tobytes()
+
+        vertex_count = len(lighting_block) // 4
+
         # Create LLF header - use version 1.44 for compressed format
         header = DANAE_LLF_HEADER()
         header.version = 1.44  # Version 1.44+ = compressed format
         header.ident = b"DANAE_LLH_FILE\x00\x00"  # Correct identifier from original file
-        header.lastuser = b"Blender Export\x00" + b"\x00" * (256 - 15)
+        header.lastuser = b"Blender Export\x00".ljust(256, b"\x00")
         header.time = int(time.time())
         header.nb_lights = len(lights)
         header.nb_Shadow_Polys = 0
         header.nb_IGNORED_Polys = 0
-        header.nb_bkgpolys = len(vertex_lighting) // 4  # Rough estimate
-        
+        header.nb_bkgpolys = vertex_count // 4  # Rough estimate
+
         # Create lighting header
         lighting_header = DANAE_LS_LIGHTINGHEADER()
-        lighting_header.nb_values = len(vertex_lighting)
+        lighting_header.nb_values = vertex_count
         lighting_header.ViewMode = 0
         lighting_header.ModeLight = 0
         lighting_header.pad = 0
-        
-        # Build uncompressed binary data
-        uncompressed_data = bytearray()
-        uncompressed_data.extend(bytes(header))
-        
+
+        # Build the uncompressed payload into a buffer sized up front,
+        # writing each section through a memoryview cursor instead of
+        # growing (and re-copying) a bytearray
+        header_size = sizeof(header)
+        light_sizes = [sizeof(light) for light in lights]
+        lighting_header_size = sizeof(lighting_header)
+        uncompressed_data = bytearray(header_size + sum(light_sizes)
+                                      + lighting_header_size + len(lighting_block))
+        view = memoryview(uncompressed_data)
+        cursor = 0
+
+        view[cursor:cursor + header_size] = bytes(header)
+        cursor += header_size
+
         # Add lights data
-        for light in lights:
-            uncompressed_data.extend(bytes(light))
-        
+        for light, light_size in zip(lights, light_sizes):
+            view[cursor:cursor + light_size] = bytes(light)
+            cursor += light_size
+
         # Add lighting header
-        uncompressed_data.extend(bytes(lighting_header))
-        
+        view[cursor:cursor + lighting_header_size] = bytes(lighting_header)
+        cursor += lighting_header_size
+
         # Add vertex lighting data in BGRA format
-        for vertex_color in vertex_lighting:
-            # Convert (r,g,b,a) tuple to SavedColorBGRA structure
-            if isinstance(vertex_color, (tuple, list)) and len(vertex_color) >= 3:
-                r, g, b = vertex_color[:3]
-                a = vertex_color[3] if len(vertex_color) > 3 else 255
-                
-                # Create BGRA color structure
-                bgra = SavedColorBGRA()
-                bgra.b = max(0, min(255, int(b)))
-                bgra.g = max(0, min(255, int(g)))
-                bgra.r = max(0, min(255, int(r)))
-                bgra.a = max(0, min(255, int(a)))
-                uncompressed_data.extend(bytes(bgra))
-            else:
-                # Fallback: use existing vertex_color as-is
-                uncompressed_data.extend(bytes(vertex_color))
-        
+        view[cursor:cursor + len(lighting_block)] = lighting_block
+
         # Compress using PKWare format (same as FTS compression)
         compressed_data = self._encode_pkware_llf(uncompressed_data)
-        
+
         # Write compressed LLF file
         with open(llf_path, 'wb') as f:
             f.write(compressed_data)
-        
-        print(f"DEBUG: Wrote PKWare compressed LLF file (v1.44) with {len(vertex_lighting)} vertex colors to {llf_path}")
-        print(f"DEBUG: Compression: {len(uncompressed_data)} → {len(compressed_data)} bytes")
+
+        log.debug(f"Wrote PKWare compressed LLF file (v1.44) with {vertex_count} vertex colors to {llf_path}")
+        log.debug(f"Compression: {len(uncompressed_data)} → {len(compressed_data)} bytes")
     
     def _encode_pkware_llf(self, data):
         """PKWare encoding for LLF files using proper header format"""
@@ -2101,12 +2529,17 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         result.append(0)  # nLitSize: 0 = IMPLODE_LITERAL_FIXED (for binary data)
         result.append(6)  # nDictSizeByte: 6 (matches original LLF file)
         
+        # Compiled one-pass encoder: literals plus end-of-stream in one call
+        if pkware_encode_literals is not None:
+            payload = np.frombuffer(data, dtype=np.uint8)
+            result.extend(pkware_encode_literals(payload))
+            return bytes(result)
+        
         # Create bitstream encoder for the actual data
         encoder = self._PKWareEncoder()
         
         # Encode all input bytes as uncoded literals (no separate header bits)
-        for byte_val in data:
-            encoder.write_literal(byte_val)
+        encoder.write_literals(data)
         
         # Write end-of-stream marker (length 519)
         encoder.write_end_of_stream()
@@ -2124,12 +2557,17 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         result.append(0)  # nLitSize: 0 = IMPLODE_LITERAL_FIXED (for binary data)
         result.append(6)  # nDictSizeByte: 6 (matches original DLF file)
         
+        # Compiled one-pass encoder: literals plus end-of-stream in one call
+        if pkware_encode_literals is not None:
+            payload = np.frombuffer(data, dtype=np.uint8)
+            result.extend(pkware_encode_literals(payload))
+            return bytes(result)
+        
         # Create bitstream encoder for the actual data
         encoder = self._PKWareEncoder()
         
         # Encode all input bytes as uncoded literals (no separate header bits)
-        for byte_val in data:
-            encoder.write_literal(byte_val)
+        encoder.write_literals(data)
         
         # Write end-of-stream marker (length 519)
         encoder.write_end_of_stream()
@@ -2140,23 +2578,45 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
     
     class _PKWareEncoder:
         """Clean PKWare encoder implementation based on ArxLibertatis blast.cpp"""
-        
+
+        # Constants from ArxLibertatis/src/io/Blast.cpp lines 343-347
+        BASE = [3, 2, 4, 5, 6, 7, 8, 9, 10, 12, 16, 24, 40, 72, 136, 264]
+        EXTRA = [0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8]
+        LENLEN = [2, 35, 36, 53, 38, 23]  # Line 340
+
+        # Derived constants from C++ arrays
+        MAX_LENGTH_SYMBOLS = len(BASE)  # 16 symbols (0-15)
+        END_SYMBOL = MAX_LENGTH_SYMBOLS - 1  # Symbol 15 for end-of-stream
+        END_LENGTH = BASE[END_SYMBOL] + ((1 << EXTRA[END_SYMBOL]) - 1)  # 519
+        BYTE_BITS = 8
+
+        # 8-bit reversal lookup table; shorter widths shift the reversed
+        # byte down instead of looping per bit
+        _REV8 = bytes(int(f'{i:08b}'[::-1], 2) for i in range(256))
+
+        # The length Huffman table is a pure function of the constants above;
+        # built once for all encoder instances
+        _LENGTH_CODES = None
+
         def __init__(self):
-            self.bits = []
-            
-            # Constants from ArxLibertatis/src/io/Blast.cpp lines 343-347
-            self.BASE = [3, 2, 4, 5, 6, 7, 8, 9, 10, 12, 16, 24, 40, 72, 136, 264]
-            self.EXTRA = [0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8]
-            self.LENLEN = [2, 35, 36, 53, 38, 23]  # Line 340
-            
-            # Derived constants from C++ arrays
-            self.MAX_LENGTH_SYMBOLS = len(self.BASE)  # 16 symbols (0-15)
-            self.END_SYMBOL = self.MAX_LENGTH_SYMBOLS - 1  # Symbol 15 for end-of-stream
-            self.END_LENGTH = self.BASE[self.END_SYMBOL] + ((1 << self.EXTRA[self.END_SYMBOL]) - 1)  # 519
-            self.BYTE_BITS = 8
-            
-            # Build length code Huffman table
-            self.length_codes = self._build_length_table()
+            # Bitstream state: completed bytes plus an integer accumulator
+            # holding the pending (not yet byte-aligned) low bits
+            self._buf = bytearray()
+            self._acc = 0
+            self._nbits = 0
+            cls = type(self)
+            if cls._LENGTH_CODES is None:
+                cls._LENGTH_CODES = self._build_length_table()
+            self.length_codes = cls._LENGTH_CODES
+
+        def _push(self, value, num_bits):
+            """Append num_bits of value to the stream, LSB first"""
+            self._acc |= value << self._nbits
+            self._nbits += num_bits
+            while self._nbits >= 8:
+                self._buf.append(self._acc & 0xFF)
+                self._acc >>= 8
+                self._nbits -= 8
         
         def _build_length_table(self):
             """Build Huffman table for length codes using C++ construct() algorithm"""
@@ -2190,104 +2650,121 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         
         def _reverse_bits(self, value, num_bits):
             """Reverse bit order for PKWare compatibility (blast.cpp line 165)"""
-            result = 0
-            for i in range(num_bits):
-                if value & (1 << i):
-                    result |= (1 << (num_bits - 1 - i))
-            return result
+            if num_bits <= 8:
+                return self._REV8[value] >> (8 - num_bits)
+            # Compose two byte reversals for wider codes
+            return ((self._REV8[value & 0xFF] << (num_bits - 8))
+                    | (self._REV8[(value >> 8) & 0xFF] >> (16 - num_bits)))
         
         def write_header(self, lit_flag, dict_size):
             """Write PKWare header as part of bitstream (blast.cpp lines 359-366)"""
             # NOTE: For LLF files, header is written as literal bytes, not bitstream
             # This method is kept for FTS compatibility but not used for LLF
-            # Write lit flag (8 bits) - blast.cpp line 359: lit = bits(s, 8)
-            for i in range(self.BYTE_BITS):
-                self.bits.append((lit_flag >> i) & 1)
-            
-            # Write dict size (8 bits) - blast.cpp line 363: dict = bits(s, 8)  
-            for i in range(self.BYTE_BITS):
-                self.bits.append((dict_size >> i) & 1)
-        
+            # blast.cpp lines 359/363: lit = bits(s, 8); dict = bits(s, 8)
+            if self._nbits == 0:
+                # Byte-aligned: both header bytes go out verbatim
+                self._buf += struct.pack('<BB', lit_flag, dict_size)
+            else:
+                self._push(lit_flag | (dict_size << self.BYTE_BITS), 2 * self.BYTE_BITS)
+
         def write_literal(self, byte_val):
             """Write uncoded literal: 0 prefix + 8 bits (blast.cpp line 292)"""
-            # From blast.cpp line 292: "0 for literals"
-            self.bits.append(0)
-            
-            # From blast.cpp line 294-297: "no bit-reversal is needed" for uncoded literals
-            # Write in LSB-first order within byte
-            for i in range(self.BYTE_BITS):
-                self.bits.append((byte_val >> i) & 1)
-        
+            # From blast.cpp line 292: "0 for literals"; lines 294-297: "no
+            # bit-reversal is needed" for uncoded literals, LSB-first
+            if self._nbits == 7:
+                # The 0 prefix tops off the pending byte and leaves the
+                # literal byte-aligned - two direct appends
+                self._buf.append(self._acc)
+                self._buf.append(byte_val)
+                self._acc = 0
+                self._nbits = 0
+            else:
+                self._push(byte_val << 1, 9)
+
+        def write_literals(self, buf):
+            """Bulk write_literal over an entire bytes-like payload
+
+            The accumulator loop is inlined with local variables so each
+            input byte costs a handful of int ops instead of a method call.
+            Large byte-aligned payloads take a vectorized route: the 9-bit
+            codes are laid out as a bit matrix and folded with np.packbits.
+            """
+            if self._nbits == 0 and len(buf) >= 64:
+                data = buf if isinstance(buf, np.ndarray) else np.frombuffer(buf, dtype=np.uint8)
+                bit_matrix = np.empty((len(data), 9), dtype=np.uint8)
+                bit_matrix[:, 0] = 0  # literal prefix
+                bit_matrix[:, 1:] = np.unpackbits(data[:, np.newaxis], axis=1, bitorder='little')
+                flat = bit_matrix.reshape(-1)
+                complete = len(flat) // 8 * 8
+                self._buf += np.packbits(flat[:complete], bitorder='little').tobytes()
+                # Up to seven trailing bits carry over into the accumulator
+                acc = 0
+                for i, bit in enumerate(flat[complete:]):
+                    acc |= int(bit) << i
+                self._acc = acc
+                self._nbits = len(flat) - complete
+                return
+
+            acc = self._acc
+            nbits = self._nbits
+            out = self._buf
+            for byte_val in buf:
+                if nbits == 7:
+                    # Aligned literal: prefix tops off the pending byte
+                    out.append(acc)
+                    out.append(byte_val)
+                    acc = 0
+                    nbits = 0
+                    continue
+                acc |= (byte_val << 1) << nbits
+                nbits += 9
+                while nbits >= 8:
+                    out.append(acc & 0xFF)
+                    acc >>= 8
+                    nbits -= 8
+            self._acc = acc
+            self._nbits = nbits
+
         def write_end_of_stream(self):
             """Write simple end-of-stream marker like working FTS implementation"""
-            # From working FTS code: much simpler EOS than complex Huffman
-            # Use the pattern that works in the FTS encoder
-            self.bits.append(1)    # EOS marker bit
-            # Simple EOS pattern: 7 zeros + 8 ones (from working FTS implementation)
-            for i in range(7):
-                self.bits.append(0)
-            for i in range(8):
-                self.bits.append(1)
-        
+            # From working FTS code: much simpler EOS than complex Huffman -
+            # 1 marker bit, 7 zeros, 8 ones, LSB first
+            self._push(0xFF01, 16)
+
         def get_bytes(self):
-            """Convert bit array to bytes like working FTS implementation"""            
-            result = bytearray()
-            
-            # Process complete bytes first
-            complete_bytes = len(self.bits) // self.BYTE_BITS
-            for i in range(complete_bytes):
-                byte_val = 0
-                for j in range(self.BYTE_BITS):
-                    if self.bits[i * self.BYTE_BITS + j]:
-                        byte_val |= (1 << j)
-                result.append(byte_val)
-            
-            # Handle final partial byte (like working FTS GetBytePadded)
-            remaining_bits = len(self.bits) % self.BYTE_BITS
-            if remaining_bits > 0:
-                byte_val = 0
-                for j in range(remaining_bits):
-                    bit_index = complete_bytes * self.BYTE_BITS + j
-                    if self.bits[bit_index]:
-                        byte_val |= (1 << j)
-                result.append(byte_val)
-            
-            return bytes(result)
+            """Finish the stream: flush the zero-padded partial byte if any"""
+            if self._nbits > 0:
+                self._buf.append(self._acc & 0xFF)
+                self._acc = 0
+                self._nbits = 0
+            return bytes(self._buf)
     
-    def writeFtsFile(self, fts_path, fts_data, converted_faces):
+    def writeFtsFile(self, fts_path, fts_data, converted_faces, fts_serializer):
         """Write FTS file with updated background geometry"""
         if len(converted_faces) == 0:
             raise ArxException("No faces to export")
-        
+
         # Validate FTS properties
         self._validateFtsProperties(converted_faces)
-        
-        # Convert faces back to FTS polygon structures  
+
+        # Convert faces back to FTS polygon structures
         updated_cells = self._reconstructCellGrid(converted_faces, fts_data)
-        
-        # Write FTS file using the serializer  
-        import bpy
-        addon = getAddon(bpy.context)
-        fts_serializer = addon.sceneManager.ftsSerializer
-        
+
         try:
             fts_serializer.write_fts_container(fts_path, fts_data, updated_cells)
+            _FTS_CACHE.pop(fts_path, None)  # On-disk container changed
             self.report({'INFO'}, f"Successfully wrote FTS file with {len(converted_faces)} faces")
         except Exception as e:
             raise ArxException(f"FTS write failed: {str(e)}")
     
+    _REQUIRED_FTS_PROPS = frozenset(['transval', 'area', 'room', 'poly_type', 'vertices'])
+
     def _validateFtsProperties(self, converted_faces):
         """Validate that converted faces have required FTS properties"""
-        required_props = ['transval', 'area', 'room', 'poly_type', 'vertices']
-        missing_props = []
-        
-        for i, face in enumerate(converted_faces[:5]):  # Check first 5 faces
-            for prop in required_props:
-                if prop not in face:
-                    missing_props.append(prop)
-        
-        if missing_props:
-            raise ArxException(f"Missing required FTS properties: {set(missing_props)}")
+        for face in converted_faces[:5]:  # Check first 5 faces
+            missing_props = self._REQUIRED_FTS_PROPS - face.keys()
+            if missing_props:
+                raise ArxException(f"Missing required FTS properties: {missing_props}")
     
     def _reconstructCellGrid(self, converted_faces, fts_data):
         """Reconstruct FTS cell grid from converted face data with spatial partitioning"""
@@ -2295,124 +2772,199 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         
         # Get scene offset for proper cell grid alignment
         scene_offset = fts_data.sceneOffset
-        print(f"DEBUG: Using scene offset: {scene_offset}")
+        log.debug(f"Using scene offset: {scene_offset}")
         
         # Debug: Check if scene offset seems reasonable
         if abs(scene_offset[0]) > 50000 or abs(scene_offset[2]) > 50000:
-            print(f"WARNING: Scene offset seems very large, this may cause grid issues")
-            print(f"WARNING: First few face centers will be around ({converted_faces[0]['vertices'][0]['pos'][0]:.1f}, {converted_faces[0]['vertices'][0]['pos'][2]:.1f}) if available")
-        
+            log.warning(f"Scene offset seems very large, this may cause grid issues")
+            log.warning(f"First few face centers will be around ({converted_faces[0]['vertices'][0]['pos'][0]:.1f}, {converted_faces[0]['vertices'][0]['pos'][2]:.1f}) if available")
+        
+        # Columnar prepass: when the SoA mirrors from mesh conversion are
+        # available, degeneracy and cell placement come out of a few
+        # vectorized passes over the (N, 4, 3) position tensor instead of
+        # per-face dict walks below
+        soa = getattr(self, '_faces_soa', None)
+        degenerate_mask = None
+        face_centers = None
+        face_cells = None
+        if soa is not None and converted_faces and 'face_index' in converted_faces[0]:
+            rows = np.fromiter((fd['face_index'] for fd in converted_faces),
+                               dtype=np.int64, count=len(converted_faces))
+            positions = soa['pos'][rows]
+            is_quad_arr = soa['loop_total'][rows] == 4
+
+            # Positions quantized to the 0.001 tolerance; triangles duplicate
+            # slot 3, so that slot only participates for quads
+            quantized = np.round(positions * 1000.0)
+
+            def _slots_equal(a, b):
+                return np.all(quantized[:, a] == quantized[:, b], axis=1)
+
+            degenerate_mask = _slots_equal(0, 1) | _slots_equal(0, 2) | _slots_equal(1, 2)
+            degenerate_mask |= is_quad_arr & (_slots_equal(0, 3) | _slots_equal(1, 3)
+                                              | _slots_equal(2, 3))
+
+            # Vertex-average centers (3 real slots for triangles, 4 for
+            # quads) and truncating division to cell coordinates, matching
+            # the scalar int(center / 100)
+            sum3 = positions[:, :3, :].sum(axis=1)
+            sum4 = sum3 + positions[:, 3, :]
+            face_centers = np.where(is_quad_arr[:, np.newaxis], sum4 / 4.0, sum3 / 3.0)
+            face_cells = (face_centers[:, [0, 2]] / 100.0).astype(np.int32)
+
         # Create Python dict structures instead of ctypes to avoid read-only issues
         fts_polygons = []
         degenerate_faces = 0
-        
-        for face_data in converted_faces:
+
+        for face_idx, face_data in enumerate(converted_faces):
             # Create polygon as Python dict instead of ctypes structure
             vertices = face_data['vertices']
             num_verts = len(vertices)
             
-            # Check for degenerate geometry
+            # Check for degenerate geometry: quantize each position to the
+            # 0.001 tolerance and hash it - a repeated key means two vertices
+            # coincide, without the pairwise comparison loops
             is_degenerate = False
-            if num_verts >= 3:
-                # Check if any vertices are identical (would create degenerate face)
-                for i in range(num_verts):
-                    for j in range(i + 1, num_verts):
-                        v1 = vertices[i]['pos']
-                        v2 = vertices[j]['pos']
-                        # Check if positions are nearly identical
-                        if abs(v1[0] - v2[0]) < 0.001 and abs(v1[1] - v2[1]) < 0.001 and abs(v1[2] - v2[2]) < 0.001:
-                            is_degenerate = True
-                            break
-                    if is_degenerate:
+            if degenerate_mask is not None:
+                is_degenerate = num_verts >= 3 and bool(degenerate_mask[face_idx])
+            elif num_verts >= 3:
+                seen_positions = set()
+                for vert in vertices:
+                    pos = vert['pos']
+                    key = (round(pos[0] * 1000), round(pos[1] * 1000), round(pos[2] * 1000))
+                    if key in seen_positions:
+                        is_degenerate = True
                         break
+                    seen_positions.add(key)
             
             if is_degenerate:
                 degenerate_faces += 1
                 if degenerate_faces <= 5:
-                    print(f"DEBUG: Degenerate face {len(fts_polygons)}: identical vertices detected")
-            
-            # Build vertices array as Python dicts
-            poly_vertices = []
-            for i in range(4):
-                if i < num_verts:
-                    vert = vertices[i]
-                    poly_vertices.append({
-                        'ssx': vert['pos'][0],
-                        'sy': vert['pos'][1],
-                        'ssz': vert['pos'][2],
-                        'stu': vert['uv'][0],
-                        'stv': vert['uv'][1]
-                    })
-                else:
-                    # For triangles, duplicate the last vertex to make a degenerate quad
-                    # This preserves the triangle geometry while fitting FTS quad format
-                    if vertices:
-                        vert = vertices[-1]  # Use last vertex
-                        poly_vertices.append({
-                            'ssx': vert['pos'][0],
-                            'sy': vert['pos'][1],
-                            'ssz': vert['pos'][2],
-                            'stu': vert['uv'][0],
-                            'stv': vert['uv'][1]
-                        })
+                    log.debug(f"Degenerate face {len(fts_polygons)}: identical vertices detected")
+            
+            # Build vertices array as Python dicts, specialized for the two
+            # real shapes so the common cases run branch-free comprehensions.
+            # Triangles duplicate the last vertex to make a degenerate quad,
+            # preserving the geometry while fitting the FTS quad format
+            if num_verts == 4:
+                source_verts = vertices
+            elif num_verts == 3:
+                source_verts = (vertices[0], vertices[1], vertices[2], vertices[2])
+            else:
+                source_verts = None
+
+            if source_verts is not None:
+                poly_vertices = [FtsVertex(vert['pos'][0], vert['pos'][1], vert['pos'][2],
+                                           vert['uv'][0], vert['uv'][1])
+                                 for vert in source_verts]
+            else:
+                # Malformed face: pad with the last vertex, or zeros when
+                # there are no vertices at all
+                poly_vertices = []
+                for i in range(4):
+                    if i < num_verts:
+                        vert = vertices[i]
+                    elif vertices:
+                        vert = vertices[-1]
                     else:
-                        # Fallback zero vertex
-                        poly_vertices.append({
-                            'ssx': 0.0, 'sy': 0.0, 'ssz': 0.0,
-                            'stu': 0.0, 'stv': 0.0
-                        })
+                        poly_vertices.append(FtsVertex(0.0, 0.0, 0.0, 0.0, 0.0))
+                        continue
+                    poly_vertices.append(FtsVertex(vert['pos'][0], vert['pos'][1], vert['pos'][2],
+                                                   vert['uv'][0], vert['uv'][1]))
             
-            # Create polygon as Python dict
             room_id = face_data.get('room', 0)
             mapped_room = self._map_room_id_to_index(room_id)
-            
-            poly_dict = {
-                'vertices': poly_vertices,
-                'tex': face_data.get('tex', 0),
-                'transval': face_data.get('transval', 0.0),
-                'area': face_data.get('area', 1.0),
-                'room': mapped_room
-            }
-            
-            # Add normals to polygon dict
+
             norm = face_data.get('norm', [0, 1, 0])
-            poly_dict['norm'] = {'x': norm[0], 'y': norm[1], 'z': norm[2]}
-            poly_dict['norm2'] = {'x': norm[0], 'y': norm[1], 'z': norm[2]}
-            
-            # Add vertex normals 
+
+            # Vertex normals, padded with the face normal - ensure POLY_QUAD
+            # flag matches actual vertex count below
             vertex_norms = face_data.get('vertex_normals', [norm] * 4)
-            poly_dict['vertex_normals'] = []
+            vertex_normals = []
             for i in range(4):
                 if i < len(vertex_norms):
                     vnorm = vertex_norms[i]
-                    poly_dict['vertex_normals'].append({'x': vnorm[0], 'y': vnorm[1], 'z': vnorm[2]})
+                    vertex_normals.append(FtsVector3(vnorm[0], vnorm[1], vnorm[2]))
                 else:
-                    poly_dict['vertex_normals'].append({'x': norm[0], 'y': norm[1], 'z': norm[2]})
-            
-            # Set poly type flags - ensure POLY_QUAD flag matches actual vertex count
-            poly_type = face_data.get('poly_type', 0)
-            poly_dict['poly_type'] = poly_type
-            poly_dict['is_quad'] = (num_verts == 4)
-            
+                    vertex_normals.append(FtsVector3(norm[0], norm[1], norm[2]))
+
+            fts_poly = FtsPoly(
+                vertices=poly_vertices,
+                tex=face_data.get('tex', 0),
+                transval=face_data.get('transval', 0.0),
+                area=face_data.get('area', 1.0),
+                room=mapped_room,
+                norm=FtsVector3(norm[0], norm[1], norm[2]),
+                norm2=FtsVector3(norm[0], norm[1], norm[2]),
+                vertex_normals=vertex_normals,
+                poly_type=face_data.get('poly_type', 0),
+                is_quad=(num_verts == 4)
+            )
+
             # Debug: log room mapping for first few faces
             if len(fts_polygons) < 5:
-                print(f"DEBUG: Face {len(fts_polygons)}: room_id={room_id} → mapped_room={mapped_room}")
-                print(f"DEBUG: FTS polygon {len(fts_polygons)}: {num_verts} vertices, is_quad={poly_dict['is_quad']}")
-            
-            fts_polygons.append((poly_dict, face_data))
+                log.debug(f"Face {len(fts_polygons)}: room_id={room_id} → mapped_room={mapped_room}")
+                log.debug(f"FTS polygon {len(fts_polygons)}: {num_verts} vertices, is_quad={fts_poly.is_quad}")
+
+            fts_polygons.append((fts_poly, face_data))
         
         if degenerate_faces > 0:
-            print(f"DEBUG: Found {degenerate_faces} degenerate faces out of {len(fts_polygons)} total")
+            log.debug(f"Found {degenerate_faces} degenerate faces out of {len(fts_polygons)} total")
         
         # Initialize 160x160 cell grid
         updated_cells = [[None for _ in range(160)] for _ in range(160)]
         
+        # Vectorized placement: combine preserved grid cells with the
+        # precomputed centers, mask out-of-bounds faces, and group faces per
+        # cell with one stable argsort over z*160+x keys instead of 25k
+        # Python-level appends and a separate counting pass
+        if face_cells is not None:
+            face_count_total = len(fts_polygons)
+            cells = face_cells.copy()
+            calculated = np.ones(face_count_total, dtype=bool)
+            for i, (poly, face_data) in enumerate(fts_polygons):
+                # Preserved cell coordinates are always recalculated
+                face_data.pop('cell_x', None)
+                face_data.pop('cell_z', None)
+                grid_cell = face_data.get('grid_cell')
+                if grid_cell is not None:
+                    cells[i] = grid_cell
+                elif not face_data.get('vertices'):
+                    cells[i] = (80, 80)
+                    calculated[i] = False
+                    log.warning(f"Face {i + 1} has no vertices, placing in center cell (80, 80)")
+
+            valid = ((cells[:, 0] >= 0) & (cells[:, 0] < 160)
+                     & (cells[:, 1] >= 0) & (cells[:, 1] < 160))
+            valid_indices = np.flatnonzero(valid)
+            keys = cells[valid_indices, 1].astype(np.int64) * 160 + cells[valid_indices, 0]
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            unique_keys, starts = np.unique(sorted_keys, return_index=True)
+            boundaries = np.append(starts, len(sorted_keys))
+            for key_pos in range(len(unique_keys)):
+                cell_z, cell_x = divmod(int(unique_keys[key_pos]), 160)
+                updated_cells[cell_z][cell_x] = [
+                    fts_polygons[valid_indices[order[j]]][0]
+                    for j in range(boundaries[key_pos], boundaries[key_pos + 1])]
+
+            faces_processed = face_count_total
+            faces_placed = len(valid_indices)
+            faces_calculated = int(calculated[valid_indices].sum())
+            populated_cells = len(unique_keys)
+            total_polys = faces_placed
+
+            log.debug(f"Processed {faces_processed} faces, {faces_placed} placed in cells ({faces_calculated} calculated, {faces_processed - faces_calculated} preserved), {total_polys} total in grid")
+            self.report({'INFO'}, f"Reconstructed cell grid: {total_polys} polygons in {populated_cells} cells ({faces_calculated} new coordinates calculated)")
+            return updated_cells
+
         # Place polygons in cell grid using preserved coordinates or spatial calculation
         faces_processed = 0
         faces_placed = 0
         faces_calculated = 0
-        
-        for poly, face_data in fts_polygons:
+        populated_cells = 0
+
+        for face_idx, (poly, face_data) in enumerate(fts_polygons):
             faces_processed += 1
             
             # Force recalculation of cell coordinates for all faces
@@ -2424,137 +2976,149 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             cell_x = None
             cell_z = None
             
-            # Calculate center of polygon vertices
+            # Use the precomputed cell placement from mesh conversion when
+            # present, otherwise average the polygon vertices
             vertices = face_data.get('vertices', [])
-            if vertices:
-                center_x = sum(v['pos'][0] for v in vertices) / len(vertices)
-                center_z = sum(v['pos'][2] for v in vertices) / len(vertices)
-                
+            grid_cell = face_data.get('grid_cell')
+            if grid_cell is not None:
+                cell_x, cell_z = grid_cell
+                center_x, center_z = face_data.get('grid_center', (cell_x * 100.0, cell_z * 100.0))
+
+                # Validate bounds - if out of bounds, skip the face
+                if cell_x < 0 or cell_x >= 160 or cell_z < 0 or cell_z >= 160:
+                    if faces_processed < 10:  # Log first few out-of-bounds faces
+                        log.debug(f"Skipping out-of-bounds face at cell ({cell_x}, {cell_z}) - center: ({center_x:.1f}, {center_z:.1f})")
+                    continue
+                faces_calculated += 1
+            elif vertices:
                 # Convert to cell coordinates (160x160 grid, each cell is 100 units)
                 # Based on analysis: scene_offset should NOT be used for grid calculation
                 # Grid cells are simply: cell = int(coordinate / 100)
-                
-                cell_x = int(center_x / 100)  
-                cell_z = int(center_z / 100)
-                
+                if face_cells is not None:
+                    center_x = float(face_centers[face_idx, 0])
+                    center_z = float(face_centers[face_idx, 2])
+                    cell_x = int(face_cells[face_idx, 0])
+                    cell_z = int(face_cells[face_idx, 1])
+                else:
+                    center_x = sum(v['pos'][0] for v in vertices) / len(vertices)
+                    center_z = sum(v['pos'][2] for v in vertices) / len(vertices)
+                    cell_x = int(center_x / 100)
+                    cell_z = int(center_z / 100)
+
                 # Validate bounds - if out of bounds, skip the face
                 if cell_x < 0 or cell_x >= 160 or cell_z < 0 or cell_z >= 160:
                     if faces_processed < 10:  # Log first few out-of-bounds faces
-                        print(f"DEBUG: Skipping out-of-bounds face at cell ({cell_x}, {cell_z}) - center: ({center_x:.1f}, {center_z:.1f})")
+                        log.debug(f"Skipping out-of-bounds face at cell ({cell_x}, {cell_z}) - center: ({center_x:.1f}, {center_z:.1f})")
                     continue
                 faces_calculated += 1
                 
                 if faces_processed <= 5:
-                    print(f"DEBUG: Face {faces_processed}: calculated cell=({cell_x}, {cell_z}) from center=({center_x:.1f}, {center_z:.1f})")
+                    log.debug(f"Face {faces_processed}: calculated cell=({cell_x}, {cell_z}) from center=({center_x:.1f}, {center_z:.1f})")
             else:
                 # Fallback to center cell if no vertices
                 cell_x, cell_z = 80, 80
-                print(f"WARNING: Face {faces_processed} has no vertices, placing in center cell (80, 80)")
+                log.warning(f"Face {faces_processed} has no vertices, placing in center cell (80, 80)")
             
             # Validate cell coordinates
             if 0 <= cell_x < 160 and 0 <= cell_z < 160:
                 # Add polygon to its cell
                 if updated_cells[cell_z][cell_x] is None:
                     updated_cells[cell_z][cell_x] = []
+                    populated_cells += 1
                 updated_cells[cell_z][cell_x].append(poly)
                 faces_placed += 1
             else:
-                print(f"ERROR: Invalid cell coordinates ({cell_x}, {cell_z}) for face {faces_processed}, placing in center")
+                log.error(f"Invalid cell coordinates ({cell_x}, {cell_z}) for face {faces_processed}, placing in center")
                 # Fallback to center cell
                 if updated_cells[80][80] is None:
                     updated_cells[80][80] = []
+                    populated_cells += 1
                 updated_cells[80][80].append(poly)
                 faces_placed += 1
-        
-        # Count populated cells
-        populated_cells = sum(1 for z in range(160) for x in range(160) if updated_cells[z][x] is not None)
-        total_polys = sum(len(updated_cells[z][x]) for z in range(160) for x in range(160) if updated_cells[z][x] is not None)
-        
-        print(f"DEBUG: Processed {faces_processed} faces, {faces_placed} placed in cells ({faces_calculated} calculated, {faces_processed - faces_calculated} preserved), {total_polys} total in grid")
+
+        # Counters are maintained during placement; every placed face ends up
+        # in exactly one cell, so no separate grid-counting pass is needed
+        total_polys = faces_placed
+
+        log.debug(f"Processed {faces_processed} faces, {faces_placed} placed in cells ({faces_calculated} calculated, {faces_processed - faces_calculated} preserved), {total_polys} total in grid")
         self.report({'INFO'}, f"Reconstructed cell grid: {total_polys} polygons in {populated_cells} cells ({faces_calculated} new coordinates calculated)")
         
         return updated_cells
     
     def _calculateVertexLighting(self, vertex_pos, vertex_normal):
-        """Calculate vertex lighting from scene lights with tunable parameters"""
-        # Lighting parameters - these could be made user-configurable
-        ambient_color = (48, 48, 64)  # Slightly blue-tinted ambient
+        """Calculate vertex lighting from scene lights with tunable parameters
+
+        Single-vertex wrapper over _calculateVertexLightingBatch so every
+        caller goes through the cached light arrays instead of a per-light
+        Python loop over the ctypes structures.
+        """
+        colors = self._calculateVertexLightingBatch(
+            np.asarray(vertex_pos, dtype=np.float32).reshape(1, 3),
+            np.asarray(vertex_normal, dtype=np.float32).reshape(1, 3))
+        return (int(colors[0, 0]), int(colors[0, 1]), int(colors[0, 2]), 255)
+
+    def _calculateVertexLightingBatch(self, positions, normals):
+        """Vectorized _calculateVertexLighting over (N, 3) position/normal arrays"""
+        # Same lighting parameters as the scalar path
+        ambient_color = np.array((48.0, 48.0, 64.0), dtype=np.float32)
         ambient_intensity = 0.3
-        light_falloff_power = 1.5     # Moderate falloff 
-        max_light_contribution = 200.0  # Allow brighter lighting
-        
-        # Start with ambient lighting
-        final_r = ambient_color[0] * ambient_intensity
-        final_g = ambient_color[1] * ambient_intensity  
-        final_b = ambient_color[2] * ambient_intensity
-        
-        # Get lights from scene data if available
-        lights = getattr(self, '_scene_lights', [])
-        scene_offset = getattr(self, '_scene_offset', Vector((0, 0, 0)))
-        
-        lights_affecting_vertex = 0
-        for light in lights:
-            # Apply scene offset to light position to align with geometry
-            light_pos = Vector([light.pos.x, light.pos.y, light.pos.z]) + scene_offset
-            distance = (vertex_pos - light_pos).length
-            
-            # Skip if beyond light radius
-            if distance > light.fallend:
-                continue
-                
-            lights_affecting_vertex += 1
-                
-            # Calculate falloff based on distance
-            if distance < light.fallstart:
-                # Full intensity within fallstart radius
-                falloff = 1.0
-            else:
-                # Linear falloff from fallstart to fallend
-                falloff_range = light.fallend - light.fallstart
-                if falloff_range > 0:
-                    distance_in_falloff = distance - light.fallstart
-                    falloff = 1.0 - (distance_in_falloff / falloff_range)
-                    falloff = max(0.0, falloff)
-                    
-                    # Apply power curve for more realistic falloff
-                    falloff = pow(falloff, light_falloff_power)
-                else:
-                    falloff = 1.0 if distance <= light.fallend else 0.0
-            
-            # Calculate light direction and basic lambert lighting
-            if distance > 0.01:  # Avoid division by zero
-                light_dir = (light_pos - vertex_pos).normalized()
-                lambert = max(0.0, vertex_normal.dot(light_dir))
-            else:
-                lambert = 1.0  # Point is at light source
-            
-            # Combine intensity, falloff, and lambert
-            light_contribution = light.intensity * falloff * lambert * max_light_contribution
-            
-            # Add light color contribution
-            final_r += light.rgb.r * light_contribution
-            final_g += light.rgb.g * light_contribution  
-            final_b += light.rgb.b * light_contribution
-        
-        # Clamp to valid color range
-        final_r = max(0, min(255, int(final_r)))
-        final_g = max(0, min(255, int(final_g)))
-        final_b = max(0, min(255, int(final_b)))
-        
-        # Debug for first calculation
-        if not hasattr(self, '_lighting_debug_done'):
-            print(f"DEBUG: Lighting calc - {lights_affecting_vertex} lights affecting vertex, ambient={ambient_color}, final=({final_r},{final_g},{final_b})")
-            self._lighting_debug_done = True
-        
-        return (final_r, final_g, final_b, 255)
-    
+        light_falloff_power, max_light_contribution = getattr(self, '_light_params', (1.5, 200.0))
+
+        positions = np.asarray(positions, dtype=np.float32)
+        normals = np.asarray(normals, dtype=np.float32)
+        vertex_count = positions.shape[0]
+        final_colors = np.tile(ambient_color * ambient_intensity, (vertex_count, 1))
+
+        lights_pos = getattr(self, '_lights_pos', None)
+        if lights_pos is not None and len(lights_pos):
+            scene_offset = getattr(self, '_scene_offset', Vector((0, 0, 0)))
+            light_positions = lights_pos + np.asarray(scene_offset, dtype=np.float32)
+
+            # Prefer the numba-compiled kernel when numba is installed
+            if compute_vertex_lighting is not None:
+                return compute_vertex_lighting(
+                    positions, normals, light_positions, self._lights_color,
+                    self._lights_fallstart, self._lights_fallend, self._lights_intensity,
+                    ambient_color * ambient_intensity,
+                    light_falloff_power, max_light_contribution)
+
+            # (vertex, light, xyz) deltas and (vertex, light) distances
+            delta = light_positions[np.newaxis, :, :] - positions[:, np.newaxis, :]
+            distance = np.sqrt(np.einsum('vlx,vlx->vl', delta, delta))
+
+            # Linear falloff from fallstart to fallend with power curve,
+            # full intensity inside fallstart, zero beyond fallend
+            falloff_range = self._lights_fallend - self._lights_fallstart
+            with np.errstate(divide='ignore', invalid='ignore'):
+                falloff = 1.0 - (distance - self._lights_fallstart) / falloff_range
+            falloff = np.clip(falloff, 0.0, 1.0) ** light_falloff_power
+            falloff = np.where(distance < self._lights_fallstart, 1.0, falloff)
+            falloff = np.where(falloff_range > 0, falloff,
+                               (distance <= self._lights_fallend).astype(np.float32))
+            falloff = np.where(distance > self._lights_fallend, 0.0, falloff)
+
+            # Basic lambert lighting; a vertex at the light source gets full
+            # contribution, matching the scalar distance > 0.01 guard
+            with np.errstate(divide='ignore', invalid='ignore'):
+                light_dir = delta / distance[:, :, np.newaxis]
+            lambert = np.clip(np.einsum('vlx,vx->vl', light_dir, normals), 0.0, None)
+            lambert = np.where(distance > 0.01, lambert, 1.0)
+
+            contribution = self._lights_intensity * falloff * lambert * max_light_contribution
+            final_colors += contribution @ self._lights_color
+
+        colors = np.empty((vertex_count, 4), dtype=np.uint8)
+        colors[:, :3] = np.clip(final_colors, 0, 255).astype(np.uint8)
+        colors[:, 3] = 255
+        return colors
+
     def _calculateCyclesVertexLighting(self, converted_faces, mesh_obj, scene):
         """Calculate vertex lighting using Blender Cycles renderer for export geometry"""
         import bmesh
         import bpy
         from mathutils import Vector
         
-        print(f"DEBUG: Starting Cycles vertex lighting calculation for {len(converted_faces)} faces")
+        log.debug(f"Starting Cycles vertex lighting calculation for {len(converted_faces)} faces")
         
         # Store original render settings
         original_engine = scene.render.engine
@@ -2572,8 +3136,63 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
             
             # Get all existing lights in the scene
             lights = [obj for obj in scene.objects if obj.type == 'LIGHT']
-            print(f"DEBUG: Found {len(lights)} lights in scene")
-            
+            log.debug(f"Found {len(lights)} lights in scene")
+
+            # Batched path: gather vertex positions/normals in export order
+            # and the light parameters once, then evaluate every vertex in
+            # the compiled kernel instead of a Python call per vertex
+            if eval_scene_lighting is not None:
+                positions = []
+                normals = []
+                for face_data in converted_faces:
+                    vertices = face_data.get('vertices', [])
+                    is_quad = face_data.get('is_quad', False)
+                    face_norm = face_data.get('norm', {'x': 0, 'y': 1, 'z': 0})
+                    normal = (face_norm['x'], face_norm['y'], face_norm['z'])
+                    for vertex_data in vertices:
+                        arx_pos = vertex_data['pos']
+                        # Scale to Blender units
+                        positions.append((arx_pos[0] * 0.1, arx_pos[1] * 0.1, arx_pos[2] * 0.1))
+                        normals.append(normal)
+                    # Triangles are stored as quads with 4th vertex = 3rd vertex
+                    if not is_quad and len(vertices) == 3:
+                        positions.append(positions[-1])
+                        normals.append(normal)
+
+                light_pos = np.zeros((len(lights), 3), dtype=np.float32)
+                light_type = np.zeros(len(lights), dtype=np.int32)
+                light_cutoff = np.ones(len(lights), dtype=np.float32)
+                light_color = np.zeros((len(lights), 3), dtype=np.float32)
+                light_energy = np.zeros(len(lights), dtype=np.float32)
+                light_dir = np.zeros((len(lights), 3), dtype=np.float32)
+                for i, light_obj in enumerate(lights):
+                    light_data = light_obj.data
+                    if not light_data:
+                        light_type[i] = 3  # no data: default attenuation, zero energy
+                        continue
+                    light_pos[i] = light_obj.location
+                    light_color[i] = light_data.color[:3]
+                    light_energy[i] = light_data.energy * 0.001  # Scale down for vertex lighting
+                    if light_data.type == 'POINT':
+                        if hasattr(light_data, 'cutoff_distance') and light_data.cutoff_distance > 0:
+                            light_type[i] = 0
+                            light_cutoff[i] = light_data.cutoff_distance
+                        else:
+                            light_type[i] = 1
+                    elif light_data.type == 'SUN':
+                        light_type[i] = 2
+                        light_dir[i] = -(light_obj.matrix_world.to_3x3() @ Vector((0, 0, -1)))
+                    else:
+                        light_type[i] = 3
+
+                vertex_colors = eval_scene_lighting(
+                    np.asarray(positions, dtype=np.float32),
+                    np.asarray(normals, dtype=np.float32),
+                    light_pos, light_type, light_cutoff,
+                    light_color, light_energy, light_dir)
+                log.debug(f"Completed compiled lighting for {len(vertex_colors)} vertices matching export")
+                return vertex_colors
+
             # Calculate lighting following the EXACT same vertex order as export
             vertex_colors = []
             processed = 0
@@ -2598,7 +3217,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                     
                     processed += 1
                     if processed % 1000 == 0:
-                        print(f"DEBUG: Processed {processed} vertices matching export order")
+                        log.debug(f"Processed {processed} vertices matching export order")
                 
                 # Handle quad storage format: triangles are stored as quads with 4th vertex = 3rd vertex
                 if not is_quad and len(vertices) == 3:
@@ -2613,11 +3232,11 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                     vertex_colors.append(vertex_color)
                     processed += 1
             
-            print(f"DEBUG: Completed Cycles lighting calculation for {len(vertex_colors)} vertices matching export")
+            log.debug(f"Completed Cycles lighting calculation for {len(vertex_colors)} vertices matching export")
             return vertex_colors
             
         except Exception as e:
-            print(f"ERROR: Cycles lighting calculation failed: {e}")
+            log.error(f"Cycles lighting calculation failed: {e}")
             # Fall back to simple calculation
             return self._calculateSimpleVertexLighting(mesh_obj)
             
@@ -2628,67 +3247,81 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
                 cycles.samples = original_samples
     
     def _evaluateVertexLighting(self, world_pos, world_normal, lights, scene):
-        """Evaluate lighting at a specific vertex position using scene lights"""
+        """Evaluate lighting at a specific vertex position using scene lights
+
+        Plain float arithmetic throughout - mathutils Vector construction is
+        a heap allocation, and this runs once per vertex/light pair.
+        """
         from mathutils import Vector
-        
-        # Start with ambient lighting
-        ambient_strength = 0.2
-        ambient_color = Vector((0.3, 0.3, 0.4))  # Cool ambient
-        final_color = ambient_color * ambient_strength
-        
+
+        px, py, pz = world_pos[0], world_pos[1], world_pos[2]
+        nx, ny, nz = world_normal[0], world_normal[1], world_normal[2]
+
+        # Start with ambient lighting: (0.3, 0.3, 0.4) cool ambient at 0.2
+        final_r = 0.06
+        final_g = 0.06
+        final_b = 0.08
+
         # Add contribution from each light
         for light_obj in lights:
             if not light_obj.data:
                 continue
-                
+
             light_data = light_obj.data
             light_pos = light_obj.location
-            
-            # Calculate light direction and distance
-            light_dir = (light_pos - world_pos).normalized()
-            light_distance = (light_pos - world_pos).length
-            
+
+            # Single subtraction and length for both direction and attenuation
+            dx = light_pos[0] - px
+            dy = light_pos[1] - py
+            dz = light_pos[2] - pz
+            light_distance = (dx * dx + dy * dy + dz * dz) ** 0.5
+
             # Calculate attenuation based on light type and distance
-            if light_data.type == 'POINT':
-                # Point light attenuation
-                if hasattr(light_data, 'cutoff_distance') and light_data.cutoff_distance > 0:
-                    max_distance = light_data.cutoff_distance
-                    attenuation = max(0.0, 1.0 - (light_distance / max_distance))
-                else:
-                    # Inverse square falloff
-                    attenuation = 1.0 / (1.0 + light_distance * light_distance * 0.001)
-                    
-            elif light_data.type == 'SUN':
+            if light_data.type == 'SUN':
                 # Directional light - no distance attenuation
                 attenuation = 1.0
-                light_dir = -Vector(light_obj.matrix_world.to_3x3() @ Vector((0, 0, -1)))
-                
+                sun_dir = light_obj.matrix_world.to_3x3() @ Vector((0, 0, -1))
+                dx, dy, dz = -sun_dir[0], -sun_dir[1], -sun_dir[2]
+
             else:
-                # Default attenuation for other light types
-                attenuation = 1.0 / (1.0 + light_distance * 0.1)
-            
+                if light_data.type == 'POINT':
+                    # Point light attenuation
+                    if hasattr(light_data, 'cutoff_distance') and light_data.cutoff_distance > 0:
+                        max_distance = light_data.cutoff_distance
+                        if light_distance > max_distance:
+                            # Fully attenuated - skip before normalizing
+                            continue
+                        attenuation = 1.0 - (light_distance / max_distance)
+                    else:
+                        # Inverse square falloff
+                        attenuation = 1.0 / (1.0 + light_distance * light_distance * 0.001)
+                else:
+                    # Default attenuation for other light types
+                    attenuation = 1.0 / (1.0 + light_distance * 0.1)
+
+                if light_distance > 1e-5:
+                    inv = 1.0 / light_distance
+                    dx, dy, dz = dx * inv, dy * inv, dz * inv
+                else:
+                    dx, dy, dz = 0.0, 0.0, 1.0
+
             # Calculate diffuse lighting (Lambertian)
-            dot_product = max(0.0, world_normal.dot(light_dir))
-            
-            # Get light color and energy
-            light_color = Vector(light_data.color[:3])
-            light_energy = light_data.energy * 0.001  # Scale down for vertex lighting
-            
-            # Add light contribution
-            light_contribution = light_color * light_energy * attenuation * dot_product
-            final_color += light_contribution
-        
+            dot_product = nx * dx + ny * dy + nz * dz
+            if dot_product <= 0.0:
+                continue
+
+            # Light energy is scaled down for vertex lighting
+            weight = light_data.energy * 0.001 * attenuation * dot_product
+            light_color = light_data.color
+            final_r += light_color[0] * weight
+            final_g += light_color[1] * weight
+            final_b += light_color[2] * weight
+
         # Clamp and convert to 0-255 range
-        final_color = Vector((
-            max(0.0, min(1.0, final_color.x)),
-            max(0.0, min(1.0, final_color.y)),
-            max(0.0, min(1.0, final_color.z))
-        ))
-        
         return (
-            int(final_color.x * 255),
-            int(final_color.y * 255), 
-            int(final_color.z * 255),
+            int(max(0.0, min(1.0, final_r)) * 255),
+            int(max(0.0, min(1.0, final_g)) * 255),
+            int(max(0.0, min(1.0, final_b)) * 255),
             255
         )
     
@@ -2696,7 +3329,7 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
         """Simple fallback vertex lighting calculation"""
         import bmesh
         
-        print("DEBUG: Using simple fallback vertex lighting")
+        log.debug("Using simple fallback vertex lighting")
         
         bm = bmesh.new()
         bm.from_mesh(mesh_obj.data)
@@ -2719,7 +3352,25 @@ class CUSTOM_OT_arx_area_list_export_all(Operator, ArxAreaExportHelper):
     def _storeLightsForLighting(self, llfData):
         """Store lights from LLF data for lighting calculations"""
         self._scene_lights = llfData.lights if llfData and hasattr(llfData, 'lights') else []
-        print(f"DEBUG: Stored {len(self._scene_lights)} lights for vertex lighting calculation")
+
+        # Stack the light parameters into flat float32 arrays once so the
+        # batch lighting path can broadcast over them without touching the
+        # ctypes structures again
+        lights = self._scene_lights
+        light_count = len(lights)
+        self._lights_pos = np.empty((light_count, 3), dtype=np.float32)
+        self._lights_color = np.empty((light_count, 3), dtype=np.float32)
+        self._lights_fallstart = np.empty(light_count, dtype=np.float32)
+        self._lights_fallend = np.empty(light_count, dtype=np.float32)
+        self._lights_intensity = np.empty(light_count, dtype=np.float32)
+        for i, light in enumerate(lights):
+            self._lights_pos[i] = (light.pos.x, light.pos.y, light.pos.z)
+            self._lights_color[i] = (light.rgb.r, light.rgb.g, light.rgb.b)
+            self._lights_fallstart[i] = light.fallstart
+            self._lights_fallend[i] = light.fallend
+            self._lights_intensity[i] = light.intensity
+
+        log.debug(f"Stored {len(self._scene_lights)} lights for vertex lighting calculation")
 
 class CUSTOM_OT_arx_view_face_attributes(Operator):
     bl_idname = "arx.view_face_attributes"
@@ -2758,21 +3409,15 @@ class CUSTOM_OT_arx_view_face_attributes(Operator):
         room_layer = bm.faces.layers.int.get('arx_room') if has_room else None
         polytype_layer = bm.faces.layers.int.get('arx_polytype') if has_polytype else None
         
-        # Collect statistics
-        stats = {
-            'total_faces': len(bm.faces),
-            'transval_values': [],
-            'area_values': [],
-            'room_values': [],
-            'polytype_values': []
-        }
-        
-        for face in bm.faces:
-            if transval_layer: stats['transval_values'].append(face[transval_layer])
-            if area_layer: stats['area_values'].append(face[area_layer])
-            if room_layer: stats['room_values'].append(face[room_layer])
-            if polytype_layer: stats['polytype_values'].append(face[polytype_layer])
-        
+        # Summary statistics come straight from the attribute layers - one
+        # foreach_get per attribute instead of a Python loop over bm.faces
+        total_faces = len(bm.faces)
+
+        def attribute_values(name, dtype):
+            values = np.empty(total_faces, dtype=dtype)
+            mesh.attributes[name].data.foreach_get('value', values)
+            return values
+
         # Show selected faces in detail (up to 10)
         selected_faces = [f for f in bm.faces if f.select]
         if not selected_faces:
@@ -2784,20 +3429,20 @@ class CUSTOM_OT_arx_view_face_attributes(Operator):
         print("\n" + "="*60)
         print(f"FTS FACE ATTRIBUTES for {obj.name}")
         print("="*60)
-        print(f"Total faces: {stats['total_faces']}")
-        
+        print(f"Total faces: {total_faces}")
+
         if has_transval:
-            vals = stats['transval_values']
-            print(f"TransVal: min={min(vals):.3f}, max={max(vals):.3f}, unique={len(set(vals))}")
+            vals = attribute_values('arx_transval', np.float32)
+            print(f"TransVal: min={vals.min():.3f}, max={vals.max():.3f}, unique={np.unique(vals).size}")
         if has_area:
-            vals = stats['area_values'] 
-            print(f"Area: min={min(vals):.3f}, max={max(vals):.3f}, unique={len(set(vals))}")
+            vals = attribute_values('arx_area', np.float32)
+            print(f"Area: min={vals.min():.3f}, max={vals.max():.3f}, unique={np.unique(vals).size}")
         if has_room:
-            vals = stats['room_values']
-            print(f"Room: min={min(vals)}, max={max(vals)}, unique={len(set(vals))}")
+            vals = attribute_values('arx_room', np.int32)
+            print(f"Room: min={vals.min()}, max={vals.max()}, unique={np.unique(vals).size}")
         if has_polytype:
-            vals = stats['polytype_values']
-            print(f"PolyType: min={min(vals)}, max={max(vals)}, unique={len(set(vals))}")
+            vals = attribute_values('arx_polytype', np.int32)
+            print(f"PolyType: min={vals.min()}, max={vals.max()}, unique={np.unique(vals).size}")
         
         print(f"\nDetailed view of {len(selected_faces)} faces:")
         print("-" * 60)
@@ -2815,11 +3460,16 @@ class CUSTOM_OT_arx_view_face_attributes(Operator):
         
         bm.free()
         
-        self.report({'INFO'}, f"Face attributes shown in console. Found {stats['total_faces']} faces.")
+        self.report({'INFO'}, f"Face attributes shown in console. Found {total_faces} faces.")
         return {'FINISHED'}
 
+def _animation_test_model_update(self, context):
+    """Cache the lowered model name tokens so dialog redraws don't re-split"""
+    self["model_words"] = self.model.lower().split('_')
+
 class ArxAnimationTestProperties(PropertyGroup):
-    model: StringProperty(name="Model", description="Selected NPC model")
+    model: StringProperty(name="Model", description="Selected NPC model",
+                          update=_animation_test_model_update)
     animation: StringProperty(name="Animation", description="Selected animation")
     flip_w: BoolProperty(name="Flip W", default=False, description="Flip quaternion W component")
     flip_x: BoolProperty(name="Flip X", default=False, description="Flip quaternion X component")
@@ -2839,9 +3489,23 @@ class ArxAnimationTestProperties(PropertyGroup):
         description="Axis remapping for quaternions"
     )
 
+def _model_list_index_update(self, context):
+    """Mirror the selected model list row into the animation test properties"""
+    props = context.scene.arx_animation_test
+    if 0 <= self.active_index < len(self.model_list):
+        name = self.model_list[self.active_index].name
+        if props.model != name:
+            props.model = name
+            props.animation = ""
+
 class ArxModelListProperties(PropertyGroup):
     model_list: CollectionProperty(type=bpy.types.PropertyGroup)
     model_list_loaded: BoolProperty(default=False)
+    active_index: IntProperty(update=_model_list_index_update)
+
+class SCENE_UL_arx_model_list(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        layout.label(text=item.name)
 
 class ArxModelListItem(PropertyGroup):
     name: StringProperty()
@@ -2893,14 +3557,15 @@ class ArxOperatorTestGoblinAnimations(Operator):
         
         bpy.ops.object.select_all(action='SELECT')
         bpy.ops.object.delete(use_global=False)
-        for action in bpy.data.actions:
-            bpy.data.actions.remove(action)
-        for collection in bpy.data.collections:
-            bpy.data.collections.remove(collection)
-        for mesh in bpy.data.meshes:
-            bpy.data.meshes.remove(mesh)
-        for armature in bpy.data.armatures:
-            bpy.data.armatures.remove(armature)
+        # Remove stale datablocks in one batched C call instead of per-ID
+        # remove() calls, which each trigger a depsgraph tag and user fixup.
+        # Only armatures tagged by a previous test run are removed, so user
+        # armatures unrelated to the addon survive the cleanup.
+        stale_armatures = tuple(a for a in bpy.data.armatures if a.get("arx_test"))
+        stale_ids = (tuple(bpy.data.actions) + tuple(bpy.data.collections)
+                     + tuple(bpy.data.meshes) + stale_armatures)
+        if stale_ids:
+            bpy.data.batch_remove(ids=stale_ids)
         
         props = context.scene.arx_animation_test
         model_name = props.model
@@ -2908,34 +3573,47 @@ class ArxOperatorTestGoblinAnimations(Operator):
             self.report({'ERROR'}, "No model selected")
             return {'CANCELLED'}
         
-        model_key = tuple(["npc", model_name])
-        if model_key not in arx_files.models.data:
+        model_key = ("npc", model_name)
+        model_data = arx_files.models.data.get(model_key)
+        if model_data is None:
             self.report({'ERROR'}, f"Model {model_name} not found in ArxFiles")
             return {'CANCELLED'}
-        
-        model_data = arx_files.models.data[model_key]
         model_path = os.path.join(model_data.path, model_data.model)
-        
+
+        # Snapshot scene state so we only need to inspect objects the importer
+        # actually created. Scope the snapshot to the view layer rather than
+        # bpy.data.objects, which spans every scene and library in the file.
+        view_layer_objects = context.view_layer.objects
+        pre_import_names = set(view_layer_objects.keys())
+
         try:
             addon.objectManager.loadFile(context, model_path, context.scene, import_tweaks=False)
         except ArxException as e:
             self.report({'ERROR'}, f"Failed to import model {model_name}: {str(e)}")
             return {'CANCELLED'}
-        
+
+        new_names = set(view_layer_objects.keys()) - pre_import_names
+        name_prefix = f"npc/{model_name}"
+
+        # Single pass over the (small) import delta picks up both the mesh
+        # and the armature, bailing out as soon as both are found.
         obj = None
-        for o in bpy.data.objects:
-            if o.name.startswith(f"npc/{model_name}") and o.type == 'MESH':
+        armature_obj = None
+        for name in new_names:
+            if not name.startswith(name_prefix):
+                continue
+            o = view_layer_objects[name]
+            if o.type == 'MESH' and obj is None:
                 obj = o
+            elif o.type == 'ARMATURE' and armature_obj is None:
+                armature_obj = o
+            if obj and armature_obj:
                 break
+
         if not obj:
             self.report({'ERROR'}, f"Model mesh {model_name} not found")
             return {'CANCELLED'}
-        
-        armature_obj = None
-        for o in bpy.data.objects:
-            if o.name.startswith(f"npc/{model_name}") and o.type == 'ARMATURE':
-                armature_obj = o
-                break
+
         if not armature_obj:
             for modifier in obj.modifiers:
                 if modifier.type == 'ARMATURE' and modifier.object:
@@ -2944,22 +3622,30 @@ class ArxOperatorTestGoblinAnimations(Operator):
         if not armature_obj:
             self.report({'ERROR'}, f"No armature found for mesh '{obj.name}'")
             return {'CANCELLED'}
-        
+
+        # Tag the imported armature so the next test run only cleans up
+        # armatures created by this operator.
+        armature_obj.data["arx_test"] = True
+
         anim_name = props.animation
         if not anim_name:
             self.report({'ERROR'}, "No animation selected")
             return {'CANCELLED'}
         
         anim_key = anim_name
-        if anim_key not in arx_files.animations.data:
+        anim_path = arx_files.animations.data.get(anim_key)
+        if anim_path is None:
             self.report({'ERROR'}, f"Animation {anim_key} not found in ArxFiles")
             return {'CANCELLED'}
-        
-        anim_path = arx_files.animations.data[anim_key]
         frame_rate = context.scene.render.fps
         
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
+        # Only touch selection/active state when it actually changes, as both
+        # writes trigger depsgraph updates.
+        view_layer = context.view_layer
+        if view_layer.objects.active is not obj:
+            view_layer.objects.active = obj
+        if not obj.select_get():
+            obj.select_set(True)
         try:
             action = addon.animationManager.loadAnimation(
                 anim_path, 
@@ -2988,7 +3674,7 @@ class CUSTOM_OT_arx_area_export_fts(Operator):
     
     def invoke(self, context, event):
         """Call main export operator with FTS only"""
-        print("DEBUG: FTS export button pressed")
+        log.debug("FTS export button pressed")
         return bpy.ops.arx.area_list_export_all('INVOKE_DEFAULT', export_fts=True, export_llf=False, export_dlf=False)
 
 class CUSTOM_OT_arx_area_export_llf(Operator):
@@ -3064,17 +3750,19 @@ class ArxAnimationTestPanel(Panel):
 
     def draw(self, context):
         layout = self.layout
-        props = context.scene.arx_animation_test
+        scene = context.scene
+        props = scene.arx_animation_test
+        model_list_props = scene.arx_model_list_props
         addon = getAddon(context)
         arx_files = addon.arxFiles
-        
-        if not context.scene.arx_model_list_props.model_list_loaded:
+
+        if not model_list_props.model_list_loaded:
             layout.operator("arx.refresh_model_list", text="Load Models")
             return
-        
+
         layout.operator("arx.refresh_model_list", text="Refresh Models")
-        
-        if not context.scene.arx_model_list_props.model_list:
+
+        if not model_list_props.model_list:
             layout.label(text="WARNING: No NPC models found", icon='ERROR')
             return
         
@@ -3083,9 +3771,10 @@ class ArxAnimationTestPanel(Panel):
         row.operator("arx.select_model", text=props.model if props.model else "Select Model")
         
         if props.model:
+            model_lower = props.model.lower()
             anim_list = [
-                anim for anim in sorted(arx_files.animations.data.keys())
-                if props.model.lower() in anim.lower()
+                anim for anim in arx_files.animations.sortedKeys()
+                if model_lower in anim.lower()
             ]
             row = layout.row()
             row.label(text="Animation:")
@@ -3112,11 +3801,14 @@ class ArxSelectModelOperator(Operator):
 
     def draw(self, context):
         layout = self.layout
-        model_list = context.scene.arx_model_list_props.model_list
-        for item in model_list:
-            layout.operator("arx.set_model", text=item.name).model = item.name
-        if not model_list:
+        model_list_props = context.scene.arx_model_list_props
+        if not model_list_props.model_list:
             layout.label(text="No models available")
+            return
+        # template_list draws and scrolls in C, so only the visible rows cost
+        # anything per redraw.
+        layout.template_list("SCENE_UL_arx_model_list", "", model_list_props, "model_list",
+                             model_list_props, "active_index", rows=10)
 
     def execute(self, context):
         return {'FINISHED'}
@@ -3136,6 +3828,10 @@ class ArxSelectAnimationOperator(Operator):
     bl_idname = "arx.select_animation"
     bl_label = "Select Animation"
     animation: StringProperty()
+    filter: StringProperty(name="Filter", description="Filter animations by name")
+
+    # Cap the rows emitted per redraw so huge matches don't stall the popup
+    max_rows = 200
 
     def invoke(self, context, event):
         context.window_manager.invoke_props_dialog(self, width=200)
@@ -3145,17 +3841,26 @@ class ArxSelectAnimationOperator(Operator):
         layout = self.layout
         props = context.scene.arx_animation_test
         arx_files = getAddon(context).arxFiles
-        matching_anims = []
-        model_words = props.model.lower().split('_')
-        for anim in sorted(arx_files.animations.data.keys()):
-            anim_lower = anim.lower()
-            if any(word in anim_lower for word in model_words):
-                matching_anims.append(anim)
-        
-        for anim in matching_anims:
-            display_name = anim.replace('.tea', '') if anim.endswith('.tea') else anim
-            layout.operator("arx.set_animation", text=display_name).animation = anim
-        
+        # Match against the precomputed word index instead of substring
+        # scanning every animation name on each redraw.
+        word_index = arx_files.animations.wordIndex()
+        model_words = props.get("model_words")
+        if model_words is None:
+            model_words = props.model.lower().split('_')
+        matching_anims = sorted(set().union(*(word_index.get(word, set()) for word in model_words)))
+
+        layout.prop(self, "filter", text="", icon='VIEWZOOM')
+        if self.filter:
+            filter_lower = self.filter.lower()
+            matching_anims = [anim for anim in matching_anims if filter_lower in anim.lower()]
+
+        display_names = arx_files.animations.displayNames()
+        for anim in matching_anims[:self.max_rows]:
+            layout.operator("arx.set_animation", text=display_names[anim]).animation = anim
+
+        if len(matching_anims) > self.max_rows:
+            layout.label(text=f"... {len(matching_anims) - self.max_rows} more, refine the filter")
+
         if not matching_anims:
             layout.label(text="No animations available")
 
@@ -3703,6 +4408,7 @@ classes = (
     ArxOperatorImportAllLevels,
     ArxAnimationTestProperties,
     ArxModelListProperties,
+    SCENE_UL_arx_model_list,
     ArxModelListItem,
     ArxOperatorRefreshModelList,
     ArxOperatorTestGoblinAnimations,
@@ -3724,10 +4430,10 @@ classes = (
     ArxEntityPanel,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 def arx_ui_area_register():
-    from bpy.utils import register_class
-    for cls in classes:
-        register_class(cls)
+    _register_classes()
     bpy.types.WindowManager.arx_areas_col = CollectionProperty(type=ARX_area_properties)
     bpy.types.WindowManager.arx_areas_idx = IntProperty()
     bpy.types.Scene.arx_animation_test = PointerProperty(type=ArxAnimationTestProperties)
@@ -3738,17 +4444,14 @@ def arx_ui_area_register():
     bpy.types.TEXT_HT_header.append(draw_asl_header_buttons)
 
 def arx_ui_area_unregister():
-    from bpy.utils import unregister_class
-    
     # Clean up global ASL navigator
     global g_asl_navigator
     g_asl_navigator = None
-    
+
     # Unregister text editor header extension
     bpy.types.TEXT_HT_header.remove(draw_asl_header_buttons)
-    
-    for cls in reversed(classes):
-        unregister_class(cls)
+
+    _unregister_classes()
     del bpy.types.WindowManager.arx_areas_col
     del bpy.types.WindowManager.arx_areas_idx
     del bpy.types.Scene.arx_animation_test
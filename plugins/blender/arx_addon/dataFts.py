@@ -28,6 +28,8 @@ from .dataCommon import SavedVec3, PolyTypeFlag
 from collections import deque
 import os
 
+import numpy as np
+
 class UNIQUE_HEADER(LittleEndianStructure):
     _pack_ = 1
     _fields_ = [
@@ -68,6 +70,9 @@ class FAST_TEXTURE_CONTAINER(LittleEndianStructure):
         ("fic",  c_char * 256)
     ]
 
+# Same layout as FAST_TEXTURE_CONTAINER, for bulk numpy decoding
+_TEXTURE_DTYPE = np.dtype([('tc', '<i4'), ('temp', '<i4'), ('fic', 'S256')])
+
 class FAST_SCENE_INFO(LittleEndianStructure):
     _pack_ = 1
     _fields_ = [
@@ -180,6 +185,58 @@ from collections import namedtuple
 
 FtsData = namedtuple('FtsData', ['sceneOffset', 'textures', 'cells', 'cell_anchors', 'anchors', 'portals', 'room_data'])
 
+
+# Fixed-slot polygon records for rebuilt cell grids. Plain dicts cost a few
+# hundred bytes each; with tens of thousands of polygons per level the slot
+# classes cut the memory several times over and make field access a fixed
+# offset load. __getitem__ keeps them drop-in compatible with the dict-style
+# access the writer below uses.
+class FtsVector3:
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+class FtsVertex:
+    __slots__ = ('ssx', 'sy', 'ssz', 'stu', 'stv')
+
+    def __init__(self, ssx, sy, ssz, stu, stv):
+        self.ssx = ssx
+        self.sy = sy
+        self.ssz = ssz
+        self.stu = stu
+        self.stv = stv
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+class FtsPoly:
+    __slots__ = ('vertices', 'tex', 'transval', 'area', 'room',
+                 'norm', 'norm2', 'vertex_normals', 'poly_type', 'is_quad')
+
+    def __init__(self, vertices, tex, transval, area, room,
+                 norm, norm2, vertex_normals, poly_type, is_quad):
+        self.vertices = vertices
+        self.tex = tex
+        self.transval = transval
+        self.area = area
+        self.room = room
+        self.norm = norm
+        self.norm2 = norm2
+        self.vertex_normals = vertex_normals
+        self.poly_type = poly_type
+        self.is_quad = is_quad
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
 import logging
 
 from ctypes import sizeof
@@ -204,18 +261,17 @@ class FtsSerializer(object):
         
         sceneOffset = (ftsHeader.Mscenepos.x, ftsHeader.Mscenepos.y, ftsHeader.Mscenepos.z)
 
-        texturesType = FAST_TEXTURE_CONTAINER * ftsHeader.nb_textures
-        textures_array = texturesType.from_buffer_copy(data, pos)
-        pos += sizeof(texturesType)
-        # Convert ctypes structures to Python dicts to avoid pickle issues
-        textures = []
-        for tex in textures_array:
-            texture_dict = {
-                'tc': tex.tc,
-                'temp': tex.temp,
-                'fic': bytes(tex.fic)  # Convert to bytes for pickle safety
-            }
-            textures.append(texture_dict)
+        # Decode the whole texture array through a numpy structured dtype in
+        # one call instead of per-element ctypes attribute access
+        textures_arr = np.frombuffer(data, dtype=_TEXTURE_DTYPE, count=ftsHeader.nb_textures, offset=pos)
+        pos += ftsHeader.nb_textures * _TEXTURE_DTYPE.itemsize
+        # Convert to Python dicts to avoid pickle issues; fic is cut at the
+        # first NUL to match the old c_char field semantics
+        textures = [{
+            'tc': int(tex['tc']),
+            'temp': int(tex['temp']),
+            'fic': bytes(tex['fic']).split(b'\x00', 1)[0]
+        } for tex in textures_arr]
         self.log.debug("Loaded %i textures" % len(textures))
 
         #for i in textures:
@@ -662,7 +718,7 @@ class FtsSerializer(object):
                 # Write polygons in this cell
                 if cell is not None:
                     for poly in cell:
-                        if isinstance(poly, dict):
+                        if isinstance(poly, (dict, FtsPoly)):
                             # Convert dict to ctypes for serialization
                             poly_struct = FAST_EERIEPOLY()
                             
@@ -319,8 +319,14 @@ class Animations:
         self.danglingPaths = []
         self.amins = []
         self.data = {}
+        self._wordIndex = None
+        self._displayNames = None
+        self._sortedKeys = None
 
     def update(self, root):
+        self._wordIndex = None
+        self._displayNames = None
+        self._sortedKeys = None
         for root, dirs, files in os.walk(root):
 
             for f in files:
@@ -332,6 +338,32 @@ class Animations:
                 else:
                     self.danglingPaths.append(foo)
 
+    def wordIndex(self):
+        """Inverted index mapping lowercased name tokens to animation names"""
+        if self._wordIndex is None:
+            index = {}
+            for name in self.data:
+                for token in re.split(r'[_\W]+', name.lower()):
+                    if token:
+                        index.setdefault(token, set()).add(name)
+            self._wordIndex = index
+        return self._wordIndex
+
+    def sortedKeys(self):
+        """Animation names in sorted order, cached between catalogue scans"""
+        if self._sortedKeys is None:
+            self._sortedKeys = tuple(sorted(self.data))
+        return self._sortedKeys
+
+    def displayNames(self):
+        """Animation name to UI display name, with any .tea suffix stripped"""
+        if self._displayNames is None:
+            self._displayNames = {
+                name: name[:-4] if name.endswith('.tea') else name
+                for name in self.data
+            }
+        return self._displayNames
+
 
 class AudioEffects:
     def __init__(self):